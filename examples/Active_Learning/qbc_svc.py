@@ -20,7 +20,6 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pylabfea as FE
 from scipy.optimize import differential_evolution
-from scipy.optimize import fsolve
 from matplotlib.lines import Line2D
 
 
@@ -184,7 +183,7 @@ np.savetxt('Test_Cases.txt', sunit)
 
 # create set of unit stresses
 print('Created {0} unit stresses (6d Voigt tensor).'.format(nsamples_init))
-x1 = fsolve(mat_h.find_yloc, np.ones(nsamples_init) * mat_h.sy, args=(sunit,), xtol=1.e-5)
+x1 = mat_h.find_yloc_batch(sunit)
 sig = sunit * x1[:, None]
 print('Calculated {} yield stresses.'.format(nsamples_init))
 
@@ -243,7 +242,7 @@ for i in range(nsamples_to_generate):
     var.append(-variance)
 
     # Calculate corresponding stress state and update data set
-    x1 = fsolve(mat_h.find_yloc, mat_h.sy, args=(sunit_new,), xtol=1.e-5)
+    x1 = mat_h.find_yloc_batch(sunit_new)
     sig_new = sunit_new * x1[:, None]
     sig = np.vstack([sig, sig_new])
     sunit = np.vstack([sunit, sunit_new])
@@ -260,7 +259,7 @@ Ntot = nsamples_init + nsamples_to_generate
 c = int(Ntot / 3)
 d = Ntot - c
 sunit_r = FE.load_cases(number_3d=c, number_6d=d)
-x1 = fsolve(mat_h.find_yloc, np.ones(Ntot) * mat_h.sy, args=(sunit_r,), xtol=1.e-5)
+x1 = mat_h.find_yloc_batch(sunit_r)
 sig_r = sunit_r * x1[:, None]
 mat_ml_r = FE.Material(name='ML-Hill')  # define material
 mat_ml_r.train_SVC(C=C, gamma=gamma, Fe=Fe, Ce=Ce, Nseq=Nseq,
@@ -1,19 +1,52 @@
 # -*- coding: utf-8 -*-
 
-"""Top-level package for pyLabFEA"""
+"""Top-level package for pyLabFEA
 
+Only the module pylabfea.basic is imported with the package. All other classes and
+functions are imported from their submodules on first access, such that scripts that
+do not train ML flow rules or create plots do not import scikit-learn and matplotlib."""
+
+from importlib import import_module
 from pylabfea.basic import Strain, Stress, a_vec, b_vec, yf_tolerance, \
-    eps_eq, sig_polar_ang, yf_tolerance, sig_princ2cyl, \
-    sig_eq_j2, sig_cyl2princ, sig_cyl2voigt, sig_princ, \
-    pickle2mat, sig_dev, sig_spherical_to_cartesian, \
+    eps_eq, sig_polar_ang, sig_lode_ang, yf_tolerance, sig_princ2cyl, \
+    sig_eq_j2, sig_cyl2princ, sig_cyl2voigt, sig_princ, sig_princ_vals, \
+    pickle2mat, sig_dev, sig_spherical_to_cartesian, sig_voigt2tensor, \
     seq_J2, sprinc, sp_cart, svoigt, s_cyl, sdev  # legacy
-
-from pylabfea.model import Model
-from pylabfea.material import Material
-from pylabfea.data import Data, find_transition_index, get_elastic_coefficients
-from pylabfea.training import load_cases, training_score, create_test_sig
 from importlib.metadata import version
 
+# submodules providing the attributes of the package that are imported on first access
+_lazy_attrs = {
+    'Model': 'model',
+    'Material': 'material',
+    'Data': 'data',
+    'find_transition_index': 'data',
+    'find_transition_indices': 'data',
+    'get_elastic_coefficients': 'data',
+    'load_cases': 'training',
+    'training_score': 'training',
+    'create_test_sig': 'training',
+    'TrainingDataCache': 'training',
+    'YieldRadiusCache': 'surrogate',
+    'YieldBackend': 'backends',
+    'SVCBackend': 'backends',
+    'RBFExpansion': 'backends',
+}
+_lazy_modules = {'model', 'material', 'data', 'training', 'surrogate', 'backends', 'container'}
+
 __author__ = """Alexander Hartmaier, Ronak Shoghi, Jan Schmidt"""
 __email__ = 'alexander.hartmaier@rub.de'
 __version__ = version('pylabfea')
+
+
+def __getattr__(name):
+    if name in _lazy_attrs:
+        val = getattr(import_module('pylabfea.' + _lazy_attrs[name]), name)
+        globals()[name] = val  # subsequent accesses do not call __getattr__
+        return val
+    if name in _lazy_modules:
+        return import_module('pylabfea.' + name)
+    raise AttributeError("module 'pylabfea' has no attribute '{}'".format(name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_attrs) | _lazy_modules)
@@ -0,0 +1,588 @@
+# Module pylabfea.backends
+"""Module pylabfea.backends defines the interface ``YieldBackend`` of models that represent the
+ML yield function of a material. A backend evaluates the decision function, its gradient and
+its Hessian w.r.t. the scaled feature vector for batches of inputs. ``SVCBackend`` wraps a
+trained support vector classifier (SVC) of scikit-learn, and the class ``RBFExpansion``
+represents the decision function as weighted sum of Gaussian kernels. An ``RBFExpansion``
+can be used in place of the SVC for evaluating the ML yield function, its gradient and
+Hessian, and for the export of the yield function to the Abaqus UMAT. A reduced-set approximation with far
+fewer centers than support vectors of the original SVC is obtained with the method
+``from_svc``, which makes the evaluation of the yield function correspondingly cheaper.
+For large training sets, the method ``from_nystroem`` trains a linear classifier on a
+Nystroem approximation of the kernel map, which scales linearly with the number of data.
+
+uses NumPy; scikit-learn is only imported for the training of reduced-set and Nystroem approximations
+
+Authors: Alexander Hartmaier, ICAMS/Ruhr University Bochum, Germany
+Email: alexander.hartmaier@rub.de
+distributed under GNU General Public License (GPLv3)"""
+
+import numpy as np
+import threading
+
+_scratch = threading.local()  # thread-local scratch buffers for evaluations of single stresses
+
+
+def _scratch_buffer(name, shape):
+    """Get thread-local scratch array, which is only re-allocated if its shape changes"""
+    buf = getattr(_scratch, name, None)
+    if buf is None or buf.shape != shape:
+        buf = np.empty(shape)
+        setattr(_scratch, name, buf)
+    return buf
+
+
+def rbf_kernel_matrix(x, centers, gamma):
+    """Calculate Gaussian kernel matrix exp(-gamma*|x - c|^2) between data points and centers
+
+    Parameters
+    ----------
+    x : (N, Ndof) array
+        Data points
+    centers : (M, Ndof) array
+        Centers of radial basis functions
+    gamma : float
+        Parameter of Gaussian kernel
+
+    Returns
+    -------
+    K : (N, M) array
+        Kernel matrix
+    """
+    K = x @ centers.T
+    K *= -2.
+    K += np.sum(x * x, axis=1)[:, None]
+    K += np.sum(centers * centers, axis=1)[None, :]
+    np.maximum(K, 0., out=K)
+    K *= -gamma
+    np.exp(K, out=K)
+    return K
+
+
+def rbf_decision_gradient(model, x, gamma, cols=None, max_mem=2 ** 28):
+    """Evaluate decision function of a model with rbf kernel and its gradient w.r.t. selected features
+
+    Parameters
+    ----------
+    model : object of class ``sklearn.svm.SVC`` or ``RBFExpansion``
+        Model with attributes support_vectors_, dual_coef_ and intercept_
+    x : (N, Ndof) array
+        Data points
+    gamma : float
+        Parameter of Gaussian kernel
+    cols : array
+        Indices of features w.r.t. which gradient is calculated (optional, default: all)
+    max_mem : int
+        Memory budget in bytes for kernel matrix, evaluation is performed in chunks (optional, default: 256 MB)
+
+    Returns
+    -------
+    f : (N,) array
+        Decision function
+    grad : (N, len(cols)) array
+        Gradient of decision function
+    """
+    sv = model.support_vectors_
+    dc = model.dual_coef_[0]
+    if cols is None:
+        cols = np.arange(sv.shape[1])
+    f = np.zeros(len(x))
+    grad = np.zeros((len(x), len(cols)))
+    nch = max(1, int(max_mem / (8 * len(sv))))
+    for i0 in range(0, len(x), nch):
+        xc = x[i0:i0 + nch]
+        wk = rbf_kernel_matrix(xc, sv, gamma)
+        wk *= dc[None, :]
+        sw = np.sum(wk, axis=1)
+        f[i0:i0 + nch] = sw + model.intercept_[0]
+        grad[i0:i0 + nch] = -2. * gamma * (sw[:, None] * xc[:, cols] - wk @ sv[:, cols])
+    return f, grad
+
+
+def rbf_hessian(model, x, gamma, cols=None, max_mem=2 ** 28):
+    """Evaluate Hessian of decision function of a model with rbf kernel w.r.t. selected features.
+
+    With w_k = dc_k K(x, x'_k), the Hessian is H_ij = sum_k w_k (4 gamma^2 (x'_ki - x_i)(x'_kj - x_j)
+    - 2 gamma delta_ij). The quadratic term is expanded into moments of the weights w, such that only
+    the upper triangle of the symmetric Hessian must be contracted with products of support vector
+    components.
+
+    Parameters
+    ----------
+    model : object of class ``sklearn.svm.SVC`` or ``RBFExpansion``
+        Model with attributes support_vectors_, dual_coef_ and intercept_
+    x : (N, Ndof) array
+        Data points
+    gamma : float
+        Parameter of Gaussian kernel
+    cols : array
+        Indices of features w.r.t. which Hessian is calculated (optional, default: all)
+    max_mem : int
+        Memory budget in bytes for temporary arrays, evaluation is performed in chunks
+        (optional, default: 256 MB)
+
+    Returns
+    -------
+    hessian : (N, len(cols), len(cols)) array
+        Hessian of decision function
+    """
+    sv = model.support_vectors_
+    dc = model.dual_coef_[0]
+    if cols is None:
+        cols = np.arange(sv.shape[1])
+    nsv = len(dc)
+    ncol = len(cols)
+    iu = np.triu_indices(ncol)
+    svs = sv[:, cols]
+    sv2 = svs[:, iu[0]] * svs[:, iu[1]]  # (nsv, ntri)
+    hessian = np.zeros((len(x), ncol, ncol))
+    nch = max(1, int(max_mem / (8 * (3 * nsv + 2 * len(iu[0])))))
+    for i0 in range(0, len(x), nch):
+        xc = x[i0:i0 + nch]
+        wk = rbf_kernel_matrix(xc, sv, gamma)
+        wk *= dc[None, :]
+        w0 = np.sum(wk, axis=1)
+        w1 = wk @ svs
+        w2 = wk @ sv2
+        xs = xc[:, cols]
+        hh = w2 - xs[:, iu[0]] * w1[:, iu[1]] - w1[:, iu[0]] * xs[:, iu[1]] + \
+            xs[:, iu[0]] * xs[:, iu[1]] * w0[:, None]
+        hh *= 4. * gamma ** 2
+        hh[:, iu[0] == iu[1]] -= 2. * gamma * w0[:, None]
+        hessian[i0:i0 + nch, iu[0], iu[1]] = hh
+        hessian[i0:i0 + nch, iu[1], iu[0]] = hh
+    return hessian
+
+
+def rbf_decision_point(model, x, gamma):
+    """Evaluate decision function of a model with rbf kernel for a single data point. The kernel is
+    evaluated in thread-local scratch buffers, bypassing the input validation of scikit-learn.
+
+    Parameters
+    ----------
+    model : object of class ``sklearn.svm.SVC`` or ``RBFExpansion``
+        Model with attributes support_vectors_, dual_coef_ and intercept_
+    x : (Ndof,) array
+        Data point
+    gamma : float
+        Parameter of Gaussian kernel
+
+    Returns
+    -------
+    f : float
+        Decision function
+    """
+    sv = model.support_vectors_
+    d = _scratch_buffer('d', sv.shape)
+    k = _scratch_buffer('k', (sv.shape[0],))
+    np.subtract(sv, x, out=d)
+    np.einsum('ij,ij->i', d, d, out=k)
+    k *= -gamma
+    np.exp(k, out=k)
+    return model.dual_coef_[0] @ k + model.intercept_[0]
+
+
+def project_on_locus(model, x, gamma, cols, nit=12, step=0.2, ftol=1.e-3, max_mem=2 ** 28):
+    """Project data points on the zero level set of the decision function, i.e. the yield locus,
+    by Newton steps along the gradient w.r.t. the selected features
+
+    Parameters
+    ----------
+    model : object of class ``sklearn.svm.SVC`` or ``RBFExpansion``
+        Model with attributes support_vectors_, dual_coef_ and intercept_
+    x : (N, Ndof) array
+        Start points
+    gamma : float
+        Parameter of Gaussian kernel
+    cols : array
+        Indices of features that are varied, typically the stress features
+    nit : int
+        Number of Newton steps (optional, default: 12)
+    step : float
+        Maximum length of a Newton step (optional, default: 0.2)
+    ftol : float
+        Tolerance of decision function for converged points (optional, default: 1.e-3)
+    max_mem : int
+        Memory budget in bytes for kernel matrix (optional, default: 256 MB)
+
+    Returns
+    -------
+    xl : (M, Ndof) array
+        Converged points on the yield locus, M <= N
+    nl : (M, len(cols)) array
+        Unit normals of yield locus at xl
+    """
+    x = np.array(x, dtype=float)
+    for i in range(nit):
+        f, grad = rbf_decision_gradient(model, x, gamma, cols=cols, max_mem=max_mem)
+        dx = (f / np.maximum(np.sum(grad * grad, axis=1), 1.e-12))[:, None] * grad
+        hh = np.linalg.norm(dx, axis=1)
+        dx *= np.minimum(1., step / np.maximum(hh, 1.e-12))[:, None]
+        x[:, cols] -= dx
+    f, grad = rbf_decision_gradient(model, x, gamma, cols=cols, max_mem=max_mem)
+    ind = np.nonzero(np.abs(f) < ftol)[0]
+    grad = grad[ind]
+    return x[ind], grad / np.maximum(np.linalg.norm(grad, axis=1), 1.e-12)[:, None]
+
+
+class YieldBackend(object):
+    """Interface of models representing the ML yield function of a ``Material``. All methods are
+    evaluated for batches of scaled feature vectors (see ``Material.create_scaled_input``); the
+    decision function is negative in the elastic regime and positive in the plastic regime.
+    Subclasses must implement at least ``decision``; ``gradient`` and ``hessian`` are required for
+    plastic flow and the consistent tangent, ``rbf_params`` for the export to the Abaqus UMAT.
+    """
+
+    def decision(self, x):
+        """Evaluate decision function
+
+        Parameters
+        ----------
+        x : (N, Ndof) array
+            Scaled feature vectors
+
+        Returns
+        -------
+        f : (N,) array
+            Decision function
+        """
+        raise NotImplementedError('{0}: decision function not implemented.'.format(type(self).__name__))
+
+    def gradient(self, x, cols=None, max_mem=2 ** 28):
+        """Evaluate gradient of decision function
+
+        Parameters
+        ----------
+        x : (N, Ndof) array
+            Scaled feature vectors
+        cols : array
+            Indices of features w.r.t. which gradient is calculated (optional, default: all)
+        max_mem : int
+            Memory budget in bytes for temporary arrays (optional, default: 256 MB)
+
+        Returns
+        -------
+        grad : (N, len(cols)) array
+            Gradient of decision function
+        """
+        raise NotImplementedError('{0}: gradient not implemented.'.format(type(self).__name__))
+
+    def hessian(self, x, cols=None, max_mem=2 ** 28):
+        """Evaluate Hessian of decision function
+
+        Parameters
+        ----------
+        x : (N, Ndof) array
+            Scaled feature vectors
+        cols : array
+            Indices of features w.r.t. which Hessian is calculated (optional, default: all)
+        max_mem : int
+            Memory budget in bytes for temporary arrays (optional, default: 256 MB)
+
+        Returns
+        -------
+        hessian : (N, len(cols), len(cols)) array
+            Hessian of decision function
+        """
+        raise NotImplementedError('{0}: Hessian not implemented.'.format(type(self).__name__))
+
+    def decision_point(self, x):
+        """Evaluate decision function for a single scaled feature vector x of shape (Ndof,)"""
+        return self.decision(x[None, :])[0]
+
+    def predict(self, x):
+        """Predict class labels, -1 for elastic and +1 for plastic feature vectors x of shape (N, Ndof)"""
+        return np.where(self.decision(x) > 0., 1, -1)
+
+    def rbf_params(self):
+        """Get parameters of decision function in form of a weighted sum of Gaussian kernels, as
+        required for the export to the Abaqus UMAT
+
+        Returns
+        -------
+        centers : (M, Ndof) array
+            Centers of radial basis functions
+        coef : (M,) array
+            Weights of radial basis functions
+        intercept : float
+            Constant offset of decision function
+        gamma : float
+            Parameter of Gaussian kernel
+        """
+        raise NotImplementedError('{0}: decision function cannot be represented as sum of Gaussian kernels.'
+                                  .format(type(self).__name__))
+
+
+class SVCBackend(YieldBackend):
+    """Backend for a trained support vector classifier (SVC) of scikit-learn. The decision function is
+    evaluated by the SVC; gradient and Hessian are evaluated analytically for the rbf kernel.
+
+    Parameters
+    ----------
+    svc : object of class ``sklearn.svm.SVC``
+        Trained SVC
+    gamma : float
+        Parameter of Gaussian kernel (optional, default: gamma of SVC)
+    """
+
+    def __init__(self, svc, gamma=None):
+        self.svc = svc
+        if gamma is None:
+            gamma = getattr(svc, '_gamma', svc.gamma)
+        self.gamma = gamma
+        self.kernel = svc.kernel
+        self.support_vectors_ = svc.support_vectors_
+        self.dual_coef_ = svc.dual_coef_
+        self.intercept_ = svc.intercept_
+        self.classes_ = svc.classes_
+
+    def __repr__(self):
+        return 'SVCBackend({0})'.format(self.svc)
+
+    def _check_rbf(self):
+        if self.kernel != 'rbf':
+            raise NotImplementedError('SVCBackend: Only implemented for SVC with rbf kernel, not "{0}".'
+                                      .format(self.kernel))
+
+    def decision(self, x):
+        return self.svc.decision_function(x)
+
+    def gradient(self, x, cols=None, max_mem=2 ** 28):
+        self._check_rbf()
+        return rbf_decision_gradient(self, x, self.gamma, cols=cols, max_mem=max_mem)[1]
+
+    def hessian(self, x, cols=None, max_mem=2 ** 28):
+        self._check_rbf()
+        return rbf_hessian(self, x, self.gamma, cols=cols, max_mem=max_mem)
+
+    def decision_point(self, x):
+        if self.kernel != 'rbf':
+            return super().decision_point(x)
+        return rbf_decision_point(self, x, self.gamma)
+
+    def predict(self, x):
+        return self.svc.predict(x)
+
+    def rbf_params(self):
+        self._check_rbf()
+        return self.support_vectors_, self.dual_coef_[0], self.intercept_[0], self.gamma
+
+
+class RBFExpansion(YieldBackend):
+    """Decision function given as weighted sum of Gaussian radial basis functions,
+    f(x) = sum_j coef_j exp(-gamma |x - c_j|^2) + intercept.
+
+    The attributes are named like those of ``sklearn.svm.SVC`` with kernel='rbf', such
+    that an object of this class can replace a trained SVC wherever the support vectors,
+    dual coefficients and intercept of the SVC are evaluated, as in the gradient and Hessian
+    of the ML yield function and in ``Material.export_MLparam``.
+
+    Parameters
+    ----------
+    centers : (M, Ndof) array
+        Centers of radial basis functions
+    coef : (M,) array
+        Weights of radial basis functions
+    intercept : float
+        Constant offset of decision function
+    gamma : float
+        Parameter of Gaussian kernel
+    classes : (2,) array
+        Class labels for negative and positive decision function (optional, default: [-1, 1])
+
+    Attributes
+    ----------
+    kernel : str
+        Type of kernel, always 'rbf'
+    support_vectors_ : (M, Ndof) array
+        Centers of radial basis functions
+    dual_coef_ : (1, M) array
+        Weights of radial basis functions
+    intercept_ : (1,) array
+        Constant offset of decision function
+    gamma : float
+        Parameter of Gaussian kernel
+    classes_ : (2,) array
+        Class labels
+    """
+    kernel = 'rbf'
+
+    def __init__(self, centers, coef, intercept, gamma, classes=None):
+        # arrays are not copied if possible, such that memory-mapped arrays remain shared
+        self.support_vectors_ = np.ascontiguousarray(np.atleast_2d(np.asarray(centers, dtype=float)))
+        self.dual_coef_ = np.ascontiguousarray(np.asarray(coef, dtype=float).reshape((1, -1)))
+        self.intercept_ = np.array([intercept], dtype=float).reshape(1)
+        self.gamma = float(gamma)
+        self.classes_ = np.array([-1, 1]) if classes is None else np.asarray(classes)
+        self.n_features_in_ = self.support_vectors_.shape[1]
+        if self.dual_coef_.shape[1] != self.support_vectors_.shape[0]:
+            raise ValueError('RBFExpansion: Number of weights and centers must be identical.')
+
+    def __repr__(self):
+        return 'RBFExpansion(n_centers={0}, gamma={1})'.format(len(self.support_vectors_), self.gamma)
+
+    @classmethod
+    def from_svc(cls, svc, ncenters, x=None, f=None, gamma=None, random_state=0):
+        """Create reduced-set approximation of the decision function of a trained SVC.
+
+        The centers are obtained by k-means clustering of the support vectors, weighted with
+        the magnitude of their dual coefficients. The weights and the intercept are obtained
+        by a linear least-squares fit of the decision function of the SVC at the support
+        vectors and the additional data points ``x``. Points close to the decision boundary,
+        i.e. to the yield locus, receive a higher weight in the fit.
+
+        Parameters
+        ----------
+        svc : object of class ``sklearn.svm.SVC``, ``SVCBackend`` or ``RBFExpansion``
+            Trained SVC with kernel='rbf' or other model with rbf kernel
+        ncenters : int
+            Number of centers of the reduced-set approximation
+        x : (N, Ndof) array
+            Additional data points at which decision function is fitted (optional, default: None)
+        f : (Nsv+N,) array
+            Decision function of SVC at support vectors and x, if already known (optional, default: None)
+        gamma : float
+            Parameter of Gaussian kernel (optional, default: svc.gamma)
+        random_state : int
+            Seed for k-means clustering (optional, default: 0)
+
+        Returns
+        -------
+        rbf : object of class ``RBFExpansion``
+            Reduced-set approximation of decision function
+        """
+        from sklearn.cluster import KMeans
+
+        if getattr(svc, 'kernel', None) != 'rbf':
+            raise NotImplementedError('RBFExpansion: Reduced-set approximation requires SVC with rbf kernel.')
+        if gamma is None:
+            gamma = svc.gamma
+        sv = svc.support_vectors_
+        dc = svc.dual_coef_[0]
+        ncenters = int(min(ncenters, len(sv)))
+        if ncenters < 1:
+            raise ValueError('RBFExpansion: Number of centers must be positive.')
+        xfit = sv if x is None else np.vstack((sv, x))
+        if f is None:
+            f = rbf_kernel_matrix(xfit, sv, gamma) @ dc + svc.intercept_[0]
+        km = KMeans(n_clusters=ncenters, n_init=1, random_state=random_state)
+        km.fit(sv, sample_weight=np.abs(dc))
+        centers = km.cluster_centers_
+
+        # weighted least-squares fit of weights and intercept
+        wght = 1. / (np.abs(f) + 0.1)
+        A = np.ones((len(xfit), ncenters + 1))
+        A[:, 0:ncenters] = rbf_kernel_matrix(xfit, centers, gamma)
+        A *= wght[:, None]
+        sol = np.linalg.lstsq(A, f * wght, rcond=None)[0]
+        return cls(centers, sol[0:ncenters], sol[ncenters], gamma,
+                   classes=getattr(svc, 'classes_', None))
+
+    @classmethod
+    def from_nystroem(cls, x, y, C, gamma, ncomp=1000, max_iter=10000, random_state=0):
+        """Train a linear SVC on a Nystroem approximation of the rbf kernel map and collapse the result into
+        a weighted sum of Gaussian kernels centered at the Nystroem components.
+
+        With the feature map phi(x) = K(x, Z) N^T of the Nystroem approximation with components Z and
+        normalization N, the decision function of the linear classifier w.phi(x) + b equals
+        sum_j (N^T w)_j K(x, z_j) + b. Training time and memory scale linearly with the number of
+        training data, and the evaluation time is governed by the number of components.
+
+        Parameters
+        ----------
+        x : (N, Ndof) array
+            Scaled training data
+        y : (N,) array
+            Class labels of training data
+        C : float
+            Parameter for training of linear SVC
+        gamma : float
+            Parameter of Gaussian kernel
+        ncomp : int
+            Number of Nystroem components (optional, default: 1000)
+        max_iter : int
+            Maximum number of iterations of linear SVC (optional, default: 10000)
+        random_state : int
+            Seed for selection of Nystroem components (optional, default: 0)
+
+        Returns
+        -------
+        rbf : object of class ``RBFExpansion``
+            Trained decision function
+        """
+        from sklearn.kernel_approximation import Nystroem
+        from sklearn.svm import LinearSVC
+
+        if len(np.unique(y)) != 2:
+            raise ValueError('RBFExpansion: Nystroem approximation requires exactly two classes.')
+        ncomp = int(min(ncomp, len(x)))
+        nys = Nystroem(kernel='rbf', gamma=gamma, n_components=ncomp, random_state=random_state)
+        feat = nys.fit_transform(x)
+        clf = LinearSVC(C=C, loss='squared_hinge', dual=False, intercept_scaling=10., max_iter=max_iter)
+        clf.fit(feat, y)
+        coef = nys.normalization_.T @ clf.coef_[0]
+        return cls(nys.components_, coef, clf.intercept_[0], gamma, classes=clf.classes_)
+
+    def decision(self, x):
+        x = np.array(x, dtype=float, ndmin=2)
+        return rbf_kernel_matrix(x, self.support_vectors_, self.gamma) @ self.dual_coef_[0] + \
+            self.intercept_[0]
+
+    def decision_function(self, x):
+        """Evaluate decision function, alias of ``decision`` for compatibility with ``sklearn.svm.SVC``
+
+        Parameters
+        ----------
+        x : (N, Ndof) array
+            Data points
+
+        Returns
+        -------
+        f : (N,) array
+            Decision function
+        """
+        return self.decision(x)
+
+    def gradient(self, x, cols=None, max_mem=2 ** 28):
+        return rbf_decision_gradient(self, x, self.gamma, cols=cols, max_mem=max_mem)[1]
+
+    def hessian(self, x, cols=None, max_mem=2 ** 28):
+        return rbf_hessian(self, x, self.gamma, cols=cols, max_mem=max_mem)
+
+    def decision_point(self, x):
+        return rbf_decision_point(self, x, self.gamma)
+
+    def rbf_params(self):
+        return self.support_vectors_, self.dual_coef_[0], self.intercept_[0], self.gamma
+
+    def predict(self, x):
+        """Predict class labels
+
+        Parameters
+        ----------
+        x : (N, Ndof) array
+            Data points
+
+        Returns
+        -------
+        y : (N,) array
+            Class labels
+        """
+        return self.classes_[(self.decision(x) > 0.).astype(int)]
+
+    def score(self, x, y):
+        """Mean accuracy of predicted class labels w.r.t. given labels
+
+        Parameters
+        ----------
+        x : (N, Ndof) array
+            Data points
+        y : (N,) array
+            Class labels
+
+        Returns
+        -------
+        score : float
+            Mean accuracy
+        """
+        return np.mean(self.predict(x) == y)
@@ -45,20 +45,19 @@ def sig_eq_j2(sig: np.ndarray):
         sig = np.array(sig)
     nsc: int = len(sig)  # number of stress components
     sh = np.shape(sig)
-    if sh == (3,):
+    if sh == (3,) or sh == (6,):
         sp = np.array([sig])
-    elif sh == (6,):
-        sp = np.array([sig_princ(sig)[0]])
-    elif sh == (nsc, 6):
-        sp = sig_princ(sig)[0]
-    elif sh == (nsc, 3):
-        sp = np.array(sig)
+    elif sh == (nsc, 6) or sh == (nsc, 3):
+        sp = sig
     else:
         raise TypeError(f'Unknown format of stress in sig_eq_j2: nsc={nsc}, sh={sh}')
     d12 = sp[:, 0] - sp[:, 1]
     d23 = sp[:, 1] - sp[:, 2]
     d31 = sp[:, 2] - sp[:, 0]
     sj2 = 0.5 * (np.square(d12) + np.square(d23) + np.square(d31))
+    if sh[-1] == 6:
+        # invariant-based evaluation for Voigt stress: add contribution of shear components
+        sj2 += 3. * (np.square(sp[:, 3]) + np.square(sp[:, 4]) + np.square(sp[:, 5]))
     seq = np.sqrt(sj2)  # sj2 eqiv. stress
     if sh == (3,) or sh == (6,):
         seq = seq[0]
@@ -83,10 +82,14 @@ def sig_polar_ang(sig: np.ndarray):
     nsc = len(sig)
     if sh == (3,):
         sp = np.array([sig])
-    elif sh == (6,):
-        sp = [sig_princ(sig)[0]]
-    elif sh == (nsc, 6):
-        sp = sig_princ(sig)[0]
+    elif sh == (6,) or sh == (nsc, 6):
+        # principal stresses are normal stresses if shear components vanish,
+        # eigen decomposition only required for stresses with shear components
+        sv = np.array(sig, ndmin=2)
+        sp = np.array(sv[:, 0:3])
+        ind = np.nonzero(np.any(sv[:, 3:6] != 0., axis=1))[0]
+        if len(ind) > 0:
+            sp[ind, :] = sig_princ(sv[ind, :])[0]
     elif sh == (nsc, 3):
         sp = np.array(sig)
     else:
@@ -104,8 +107,85 @@ def sig_polar_ang(sig: np.ndarray):
     return theta
 
 
+def sig_voigt2tensor(sig: np.ndarray) -> np.ndarray:
+    """Convert Voigt stress tensors into Cartesian stress tensors.
+
+    Parameters
+    ----------
+    sig : (6,) or (N,6) array
+        Voigt stress tensor
+
+    Returns
+    -------
+    st : (3,3) or (N,3,3) array
+        Cartesian stress tensor
+    """
+    sig = np.asarray(sig)
+    st = sig[..., [[0, 5, 4], [5, 1, 3], [4, 3, 2]]]
+    return st
+
+
+def _j2_j3(sv):
+    """Calculate hydrostatic stress and invariants J2 and J3 of the stress deviator of Voigt stresses
+
+    Parameters
+    ----------
+    sv : (N,6) array
+        Voigt stress tensors
+
+    Returns
+    -------
+    p : (N,) array
+        Hydrostatic stress
+    J2 : (N,) array
+        Second invariant of stress deviator
+    J3 : (N,) array
+        Third invariant of stress deviator
+    """
+    p = np.sum(sv[:, 0:3], axis=1) / 3.
+    sd = sv[:, 0:3] - p[:, None]
+    J2 = 0.5 * np.sum(sd * sd, axis=1) + np.sum(sv[:, 3:6] * sv[:, 3:6], axis=1)
+    J3 = sd[:, 0] * sd[:, 1] * sd[:, 2] + 2. * sv[:, 3] * sv[:, 4] * sv[:, 5] \
+        - sd[:, 0] * sv[:, 3] ** 2 - sd[:, 1] * sv[:, 4] ** 2 - sd[:, 2] * sv[:, 5] ** 2
+    return p, J2, J3
+
+
+def sig_lode_ang(sig: np.ndarray):
+    """Calculate Lode angle from the invariants J2 and J3 of the stress deviator without
+    eigen decomposition; definition of positive cosine for Lode angle is applied
+
+    Parameters
+    ----------
+    sig : (3,), (6,) (N,3) or (N,6) array
+         (3,), (N,3): Principal stresses;
+         (6,), (N,6): Voigt stress
+
+    Returns
+    -------
+    la : float or (N,) array
+        Lode angles in range [0, pi/3]
+    """
+    sh = np.shape(sig)
+    sv = np.zeros((int(np.prod(sh[:-1])), 6))
+    sv[:, 0:sh[-1]] = np.reshape(sig, (-1, sh[-1]))
+    p, J2, J3 = _j2_j3(sv)
+    hh = np.zeros_like(J2)
+    ind = np.nonzero(J2 > 1.e-12)[0]
+    hh[ind] = 1.5 * np.sqrt(3.) * J3[ind] / J2[ind] ** 1.5
+    la = np.arccos(np.clip(hh, -1., 1.)) / 3.
+    if len(sh) == 1:
+        la = la[0]
+    return la
+
+
 def sig_princ(sig: np.ndarray):
     """Convert Voigt stress tensors into principal stresses and eigenvectors.
+    All stress tensors are processed simultaneously with a batched eigen solver for
+    symmetric matrices. Principal stresses are arranged according to the major force
+    axes, i.e. each eigenvector is assigned to the Cartesian axis of its largest
+    component, such that for stresses with small shear components the principal stresses
+    correspond to the normal stresses along the axes. If only principal stresses in
+    descending order are required, ``sig_princ_vals`` is faster.
 
     Parameters
     ----------
@@ -117,68 +197,64 @@ def sig_princ(sig: np.ndarray):
     spa : (3,) or (nsc,3) array
         Principal stresses
     eva : (3,3) or (nsc,3,3) array
-        Eigenvectors/rotation matrices of stress tensor
+        Eigenvectors/rotation matrices of stress tensor, eigenvectors are stored in columns
     """
-    nsc = len(sig)  # number of stress components
     sh = np.shape(sig)
-    if sh == (3, 3):
-        nsc = 1  # sig is Cartesian single stress tensor
-        st = np.array([sig])
-    elif sh == (nsc, 3, 3):
-        st = np.array(sig)  # sig is array of Cart. stress tensors
-    elif sh == (6,):
-        nsc = 1  # sig is single Voigt stress
-        st = np.zeros((1, 3, 3))
-        st[0, 0, 0] = sig[0]
-        st[0, 1, 1] = sig[1]
-        st[0, 2, 2] = sig[2]
-        st[0, 2, 1] = st[0, 1, 2] = sig[3]
-        st[0, 2, 0] = st[0, 0, 2] = sig[4]
-        st[0, 1, 0] = st[0, 0, 1] = sig[5]
-    elif sh == (nsc, 6):
-        st = np.zeros((nsc, 3, 3))
-        for i in range(nsc):
-            st[i, 0, 0] = sig[i, 0]
-            st[i, 1, 1] = sig[i, 1]
-            st[i, 2, 2] = sig[i, 2]
-            st[i, 2, 1] = st[i, 1, 2] = sig[i, 3]
-            st[i, 2, 0] = st[i, 0, 2] = sig[i, 4]
-            st[i, 1, 0] = st[i, 0, 1] = sig[i, 5]
+    if sh == (6,) or (len(sh) == 2 and sh[1] == 6):
+        st = sig_voigt2tensor(np.array(sig, dtype=float, ndmin=2))
+    elif sh == (3, 3) or (len(sh) == 3 and sh[1:] == (3, 3)):
+        st = np.array(sig, dtype=float, ndmin=3)
     else:
-        raise TypeError(f'Unknown format of stress in sig_princ: nsc={nsc}, sh={sh}')
+        raise TypeError(f'Unknown format of stress in sig_princ: sh={sh}')
+    single = sh == (3, 3) or sh == (6,)
 
     # calculate principal stresses and eigen vectors
-    spa = np.zeros((nsc, 3))
-    eva = np.zeros((nsc, 3, 3))
-    for n in range(nsc):
-        sp, ev = np.linalg.eig(st[n])  # solve eigenvalue problem
-        # arrange principal stress components according to major force axes
-        iev = np.argmax(np.abs(ev), axis=1)
-        j = np.zeros(3, dtype=int)
-        i0 = [i for i, x in enumerate(iev) if x == 0]  # positions of indices 0
-        i1 = [i for i, x in enumerate(iev) if x == 1]
-        i2 = [i for i, x in enumerate(iev) if x == 2]
-        k0 = len(i0)
-        for i in range(k0):
-            j[i] = i0[i]
-        for i in range(len(i1)):
-            j[k0 + i] = i1[i]
-        k0 += len(i1)
-        for i in range(len(i2)):
-            j[k0 + i] = i2[i]
-        ev = np.array([ev[j[0], :], ev[j[1], :], ev[j[2], :]])
-        sp = np.array([sp[j[0]], sp[j[1]], sp[j[2]]])
-        # ensure positive determinant
-        if np.linalg.det(ev) < 0:
-            ev *= -1
-        spa[n, :] = sp
-        eva[n, :, :] = ev
-    if sh == (3, 3) or sh == (6,):
+    spa, eva = np.linalg.eigh(st)
+    # arrange principal stress components according to major force axes
+    iax = np.argmax(np.abs(eva), axis=1)  # axis of largest component of each eigenvector
+    j = np.argsort(iax, axis=1, kind='stable')
+    spa = np.take_along_axis(spa, j, axis=1)
+    eva = np.take_along_axis(eva, j[:, None, :], axis=2)
+    # ensure positive determinant
+    eva[np.linalg.det(eva) < 0] *= -1
+    if single:
         spa = spa[0]
         eva = eva[0, :, :]
     return spa, eva
 
 
+def sig_princ_vals(sig: np.ndarray) -> np.ndarray:
+    """Calculate principal stresses in descending order without eigenvectors, based on the
+    closed-form trigonometric solution of the characteristic equation of symmetric 3x3 tensors.
+
+    Parameters
+    ----------
+    sig : (6,), (nsc,6), (3,3), or (nsc,3,3) array
+        Voigt stress tensor (dim=6) or Cartesian stress tensor (dim=3x3)
+
+    Returns
+    -------
+    spa : (3,) or (nsc,3) array
+        Principal stresses in descending order
+    """
+    sh = np.shape(sig)
+    if sh[-1] == 6:
+        sv = np.array(sig, dtype=float, ndmin=2)
+    else:
+        st = np.array(sig, dtype=float, ndmin=3)
+        sv = st[:, [0, 1, 2, 1, 0, 0], [0, 1, 2, 2, 2, 1]]
+    p, J2, J3 = _j2_j3(sv)
+    r = np.sqrt(J2 / 3.)
+    hh = np.zeros_like(J2)
+    ind = np.nonzero(J2 > 1.e-30 * np.max(sv * sv, axis=1, initial=1.e-300))[0]
+    hh[ind] = 0.5 * J3[ind] / r[ind] ** 3
+    phi = np.arccos(np.clip(hh, -1., 1.)) / 3.
+    spa = p[:, None] + 2. * r[:, None] * np.cos(phi[:, None] - np.array([0., 2., 4.]) * np.pi / 3.)
+    if len(sh) == 1 or sh == (3, 3):
+        spa = spa[0]
+    return spa
+
+
 def sig_cyl2princ(s_cyl) -> np.ndarray:
     """Convert cylindrical stress into 3D Cartesian principle stress
 
@@ -0,0 +1,185 @@
+# Module pylabfea.container
+"""Module pylabfea.container defines a versioned binary container for trained models. A
+container file consists of a fixed-size preamble, a JSON header describing the model and
+the stored arrays, and the raw data of the arrays. Each array starts at an offset that is a
+multiple of ``ALIGN`` bytes, such that the arrays can be mapped into memory with
+``numpy.memmap`` without copying. If several processes on one node map the same file
+read-only, they share a single physical copy of the arrays in the page cache of the
+operating system.
+
+Layout of a container file:
+
+- bytes 0-7: magic number ``MAGIC``
+- bytes 8-11: format version (little-endian uint32)
+- bytes 12-19: length of JSON header in bytes (little-endian uint64)
+- bytes 20-: JSON header in UTF-8, padded with blanks to a multiple of ``ALIGN``
+- raw array data in C order, each array padded to a multiple of ``ALIGN``
+
+The JSON header contains the user-defined entries and an entry 'arrays' with the dtype,
+shape and offset (w.r.t. the start of the file) of each array. Nested dictionaries and
+lists containing arrays are stored by replacing the arrays with references, see
+``pack_tree`` and ``unpack_tree``.
+
+uses NumPy
+
+Authors: Alexander Hartmaier, ICAMS/Ruhr University Bochum, Germany
+Email: alexander.hartmaier@rub.de
+distributed under GNU General Public License (GPLv3)"""
+
+import json
+import struct
+import numpy as np
+
+MAGIC = b'PYLFEAM\x00'
+VERSION = 1
+ALIGN = 64
+_PREAMBLE = struct.Struct('<8sIQ')
+
+
+def _padding(n):
+    """Number of bytes required to pad n bytes to a multiple of ALIGN"""
+    return (-n) % ALIGN
+
+
+def write_container(fname, header, arrays):
+    """Write header and arrays into a binary container file.
+
+    Parameters
+    ----------
+    fname : str
+        Name of container file
+    header : dict
+        Entries of header, must be serializable to JSON; the key 'arrays' is reserved
+    arrays : dict
+        Arrays to be stored with their names as keys
+
+    Returns
+    -------
+    None.
+    """
+    if 'arrays' in header:
+        raise ValueError("write_container: Key 'arrays' is reserved for the array directory.")
+    data = {key: np.ascontiguousarray(val) for key, val in arrays.items()}
+    for key, val in data.items():
+        if val.dtype.hasobject:
+            raise ValueError('write_container: Array "{}" has dtype object and cannot be stored.'.format(key))
+
+    # the length of the header depends on the offsets and vice versa, iterate until consistent
+    nhead = 0
+    while True:
+        offset = _PREAMBLE.size + nhead + _padding(_PREAMBLE.size + nhead)
+        directory = dict()
+        for key, val in data.items():
+            directory[key] = {'dtype': val.dtype.str, 'shape': list(val.shape), 'offset': offset}
+            offset += val.nbytes + _padding(val.nbytes)
+        head = json.dumps(dict(header, arrays=directory)).encode('utf-8')
+        if len(head) <= nhead:
+            break
+        nhead = len(head)
+    head += b' ' * (nhead - len(head) + _padding(_PREAMBLE.size + nhead))
+
+    with open(fname, 'wb') as fp:
+        fp.write(_PREAMBLE.pack(MAGIC, VERSION, len(head)))
+        fp.write(head)
+        for key, val in data.items():
+            fp.write(val.tobytes())
+            fp.write(b'\x00' * _padding(val.nbytes))
+
+
+def read_container(fname, mmap=True):
+    """Read header and arrays from a binary container file.
+
+    Parameters
+    ----------
+    fname : str
+        Name of container file
+    mmap : Boolean
+        Map arrays read-only into memory instead of reading them (optional, default: True)
+
+    Returns
+    -------
+    header : dict
+        Entries of header, including the array directory in 'arrays'
+    arrays : dict
+        Arrays with their names as keys, of class ``numpy.memmap`` if mmap is True
+    """
+    with open(fname, 'rb') as fp:
+        pre = fp.read(_PREAMBLE.size)
+        if len(pre) < _PREAMBLE.size:
+            raise ValueError('read_container: File {} is not a pyLabFEA model container.'.format(fname))
+        magic, version, nhead = _PREAMBLE.unpack(pre)
+        if magic != MAGIC:
+            raise ValueError('read_container: File {} is not a pyLabFEA model container.'.format(fname))
+        if version > VERSION:
+            raise ValueError('read_container: Version {} of container {} is not supported, '
+                             'maximum supported version is {}.'.format(version, fname, VERSION))
+        header = json.loads(fp.read(nhead).decode('utf-8'))
+        arrays = dict()
+        for key, entry in header['arrays'].items():
+            dtype = np.dtype(entry['dtype'])
+            shape = tuple(entry['shape'])
+            if mmap and int(np.prod(shape)) > 0:
+                arrays[key] = np.memmap(fname, dtype=dtype, mode='r', offset=entry['offset'], shape=shape)
+            else:
+                fp.seek(entry['offset'])
+                count = int(np.prod(shape))
+                arrays[key] = np.fromfile(fp, dtype=dtype, count=count).reshape(shape)
+    return header, arrays
+
+
+def pack_tree(obj, arrays):
+    """Replace arrays in nested dictionaries and lists by references, such that the tree
+    can be stored in the JSON header of a container and the arrays in its data section.
+
+    Parameters
+    ----------
+    obj : dict, list, tuple, array, scalar, str or None
+        Tree to be packed, keys of dictionaries must be strings
+    arrays : dict
+        Arrays of the tree are added to this dictionary
+
+    Returns
+    -------
+    tree : dict, list, scalar, str or None
+        Tree serializable to JSON; tuples are converted into lists and NumPy scalars into
+        Python scalars
+    """
+    if isinstance(obj, dict):
+        if not all(isinstance(key, str) for key in obj.keys()):
+            raise ValueError('pack_tree: Keys of dictionaries must be strings.')
+        return {key: pack_tree(val, arrays) for key, val in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [pack_tree(val, arrays) for val in obj]
+    if isinstance(obj, np.ndarray):
+        name = 'a{}'.format(len(arrays))
+        arrays[name] = obj
+        return {'__array__': name}
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    raise ValueError('pack_tree: Objects of type {} cannot be stored.'.format(type(obj)))
+
+
+def unpack_tree(tree, arrays):
+    """Restore nested dictionaries and lists packed with ``pack_tree``.
+
+    Parameters
+    ----------
+    tree : dict, list, scalar, str or None
+        Packed tree
+    arrays : dict
+        Arrays referenced in tree
+
+    Returns
+    -------
+    obj : dict, list, array, scalar, str or None
+        Tree with references replaced by arrays
+    """
+    if isinstance(tree, dict):
+        if len(tree) == 1 and '__array__' in tree:
+            return arrays[tree['__array__']]
+        return {key: unpack_tree(val, arrays) for key, val in tree.items()}
+    if isinstance(tree, list):
+        return [unpack_tree(val, arrays) for val in tree]
+    return tree
@@ -17,13 +17,10 @@ distributed under GNU General Public License (GPLv3)"""
 
 import os
 import json
-import random
 import warnings
 import pylabfea as FE
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.signal import savgol_filter
-from scipy.optimize import minimize
+from pylabfea.container import write_container, read_container, pack_tree, unpack_tree
 
 
 def ln_strain(eng_strain):
@@ -60,36 +57,76 @@ def find_transition_index(stress):
     idx: int
         The index within the stress array where a significant transition from linear behavior occurs.
     """
-    nst = len(stress)
-    wl1 = max(5, int(nst / 10))
-    wl2 = max(2, int(nst / 50))
-    sig_d1 = savgol_filter(stress, window_length=wl1, polyorder=1, deriv=1)
-    sig_d2 = savgol_filter(sig_d1, window_length=wl2, polyorder=1, deriv=1)
-
-    i0 = int(nst / 10)
-    tol = np.mean(sig_d2[i0:i0 + wl2]) * 1.2
-    idx = -1
-    iend = int((nst - i0) / wl2) - 1
-    for i in range(1, iend):
-        mav = np.mean(sig_d2[i0 + i * wl2:i0 + (i + 1) * wl2])
-        if np.abs(mav) > tol:
-            idx = i0 + i * wl2
-            break
-    if idx < 0:
-        print('Warning: Transition not determined properly')
-        idx = i0
+    return int(find_transition_indices([stress])[0])
+
+
+def find_transition_indices(stresses, lengths=None):
+    """Batched version of ``find_transition_index`` for several load paths. Load paths of equal
+    length are filtered together and the mean values of the second derivative within consecutive
+    windows are evaluated for all windows at once, such that the results are identical to
+    those of ``find_transition_index`` for each load path.
+
+    Parameters:
+    ----------
+    stresses: list of 1-d numpy arrays or 2-d numpy array
+        Arrays of equivalent stress values along different load paths; a 2-d array contains
+        one load path per row, padded to a common length.
+    lengths: list of int or None
+        Number of valid values in each row of a padded 2-d array, if None, all values are
+        used. Ignored for a list of arrays. (Optional, default is None).
+
+    Returns:
+    ----------
+    idx: 1-d numpy array of int
+        The indices within the stress arrays where a significant transition from linear behavior occurs.
+    """
+    from scipy.signal import savgol_filter
+
+    if isinstance(stresses, np.ndarray) and stresses.ndim == 2:
+        if lengths is None:
+            lengths = np.full(stresses.shape[0], stresses.shape[1])
+        paths = [stresses[k, :lengths[k]] for k in range(stresses.shape[0])]
+    else:
+        paths = [np.asarray(stress) for stress in stresses]
+    lengths = np.array([len(stress) for stress in paths], dtype=int)
+    idx = np.zeros(len(paths), dtype=int)
+    for nst in np.unique(lengths):
+        sel = np.nonzero(lengths == nst)[0]
+        wl1 = max(5, int(nst / 10))
+        wl2 = max(2, int(nst / 50))
+        sig_d1 = savgol_filter(np.array([paths[k] for k in sel]), window_length=wl1, polyorder=1, deriv=1)
+        sig_d2 = savgol_filter(sig_d1, window_length=wl2, polyorder=1, deriv=1)
+
+        i0 = int(nst / 10)
+        tol = np.mean(sig_d2[:, i0:i0 + wl2], axis=1) * 1.2
+        iend = int((nst - i0) / wl2) - 1
+        # mean values of second derivative in windows 1, ..., iend-1 of length wl2 starting at i0
+        nwin = max(iend - 1, 0)
+        if nwin == 0:
+            # load paths too short for windows beyond the first one
+            idx[sel] = i0
+            for k in range(len(sel)):
+                print('Warning: Transition not determined properly')
+            continue
+        mav = np.mean(sig_d2[:, i0 + wl2:i0 + (nwin + 1) * wl2].reshape(len(sel), nwin, wl2), axis=2)
+        trans = np.abs(mav) > tol[:, None]
+        found = np.any(trans, axis=1)
+        idx[sel] = np.where(found, i0 + (np.argmax(trans, axis=1) + 1) * wl2, i0)
+        for k in range(np.count_nonzero(~found)):
+            print('Warning: Transition not determined properly')
     return idx
 
 
-def get_elastic_coefficients(eps, sig, method='least_square', initial_guess=None):
+def get_elastic_coefficients(eps, sig, method='least_square', initial_guess=None, npairs=None, seed=None):
     """A function to compute the elastic coefficients (stiffness matrix) for a material
     based on stress-strain data. This function supports two methods for determining
     the stiffness matrix: a direct least squares approach and an optimization approach.
     The least squares method is used when 'least_square' is specified, which processes
-    any desired stress-strain pairs( minimum must be 4).  The optimization approach,
+    any desired stress-strain pairs (minimum must be 6).  The optimization approach,
     used when 'decomposition' method is specified, iteratively adjusts the
     stiffness matrix to minimize an objective function that measures the fit to the
-    observed data, subject to physical plausibility constraints.
+    observed data, subject to physical plausibility constraints. In both methods, all
+    stress-strain pairs are evaluated together in matrix operations.
 
     Parameters
     ----------
@@ -108,6 +145,12 @@ def get_elastic_coefficients(eps, sig, method='least_square', initial_guess=None
         Initial guess for the stiffness matrix coefficients
         used in the optimization approach. If None, a random initial guess is generated.
         This parameter is ignored when using the 'least_square' method. Default is None.
+    npairs: int or None
+        Number of randomly selected stress-strain pairs used for the identification, if None,
+        all pairs are used. (Optional, default is None).
+    seed: int or None
+        Seed of the random number generator used for the selection of pairs and the random initial
+        guess. (Optional, default is None).
 
     Returns:
     C: (6, 6)-array
@@ -116,6 +159,7 @@ def get_elastic_coefficients(eps, sig, method='least_square', initial_guess=None
         maximum number of attempts, the function may return the last attempted solution
         or raise an error, depending on implementation details.
     """
+    from scipy.optimize import minimize
 
     def map_flat_to_matrix(C_flat):
         """Maps a flat array of coefficients into a symmetric matrix C. This function takes the
@@ -168,63 +212,22 @@ def get_elastic_coefficients(eps, sig, method='least_square', initial_guess=None
         C = np.dot(L, L.T)
         return L, C
 
-    def is_positive_definite(C):
-        """Checks whether a given matrix is positive definite. A matrix is positive definite
-        if all its eigenvalues are greater than zero. This characteristic is essential for
-        ensuring the stability and uniqueness of solutions in many mathematical contexts,
-        including optimization problems and systems of linear equations.
-
-        Parameters
-        ----------
-        C: np.ndarray
-            The matrix to be checked. This should be a square matrix.
-
-        Returns
-        -------
-        _: bool:
-            True if the matrix is positive definite, meaning all its eigenvalues are
-            greater than zero; False otherwise.
-        """
-        return np.all(np.linalg.eigvals(C) > 0)
-
-    def calculate_stress_from_strain(strain, C):
-        """Calculates the predicted stress for a given strain using the material's stiffness
-        matrix. This function multiplies the stiffness matrix C by the strain vector to
-        predict the resulting stress, according to Hooke's Law for linear elastic materials.
-
-        Parameters
-        ----------
-        strain: list or np.ndarray
-            The strain vector, representing the deformation in the material. This should be a
-            1D array or list of length 6, corresponding to the three normal and three shear
-            components of strain.
-        C: np.ndarray
-            The stiffness matrix of the material. This should be a 6x6 symmetric
-            matrix representing the material's resistance to deformation. The matrix correlates
-            the strain to the stress in the material.
-
-        Returns
-        -------
-        _: np.ndarray
-            The predicted stress vector, calculated as the dot product of the stiffness
-            matrix C and the strain vector. This vector has the same dimension as the strain
-            input, containing the three normal and three shear components of stress.
-        """
-        strain_vector = np.array(strain)
-        stress_predicted = np.dot(C, strain_vector)
-        return stress_predicted
-
-    def objective_function(data_pairs, x_flat, penalty_weight=1e9, lambda_reg=1e-3):
+    def objective_function(x_flat, strain, stress, penalty_weight=1e9, lambda_reg=1e-3):
         """Calculates the objective function value for an optimization problem that aims
         to find the stiffness matrix coefficients using the decomposition method
         to construct the stiffness matrix from a flat array of coefficients. It includes
         penalties for non-positive definiteness of the matrix and a regularization term
-        to prevent overfitting.
+        to prevent overfitting. The residuals of all stress-strain pairs are evaluated in
+        one matrix product.
 
         Parameters
         ----------
         x_flat: np.ndarray
             A flat array of stiffness matrix coefficients.
+        strain: (N, 6)-array
+            Strain tensors of stress-strain pairs.
+        stress: (N, 6)-array
+            Observed stress tensors of stress-strain pairs.
         penalty_weight: float
             The weight of the penalty for non-positive definiteness. (Optional, default is 1e9).
         lambda_reg: float
@@ -237,117 +240,182 @@ def get_elastic_coefficients(eps, sig, method='least_square', initial_guess=None
             The value of the objective function, which includes the sum of squared residuals
             between observed and predicted stresses, a penalty for non-positive definiteness, and
             a regularization term.
+        grad: (21,)-array
+            Gradient of the objective function w.r.t. x_flat, the penalty term, which only
+            contributes for singular matrices, is not considered
         """
-        _, C = map_flat_to_L_and_C(x_flat)
+        L, C = map_flat_to_L_and_C(x_flat)
+        ev = np.linalg.eigvalsh(C)
         penalty = 0
-        if not is_positive_definite(C):
-            penalty = penalty_weight * np.sum(np.min(np.linalg.eigvals(C), 0) ** 2)
-        sum_squared_residuals = 0
-        for strain, observed_stress in data_pairs:
-            predicted_stress = calculate_stress_from_strain(strain, C)
-            residuals = observed_stress - predicted_stress
-            sum_squared_residuals += np.sum(residuals ** 2)
+        if not np.all(ev > 0):
+            penalty = penalty_weight * np.sum(np.minimum(ev, 0) ** 2)
+        residuals = stress - strain @ C
         regularization_term = lambda_reg * np.sum(x_flat ** 2)
-        return sum_squared_residuals + penalty + regularization_term
+        G = -2. * strain.T @ residuals  # derivative of sum of squared residuals w.r.t. C
+        grad = ((G + G.T) @ L)[np.tril_indices(6)] + 2. * lambda_reg * x_flat
+        return np.sum(residuals ** 2) + penalty + regularization_term, grad
 
-    def least_square(data_pairs, random_pairs_number=100):
+    def least_square(strain, stress):
         """Calculates the least squares solution for a set of equations derived from
-        a specified number of random experiment pairs. Each pair consists of strains
-        and stresses. In the case of general symmetry, the coefficients of the stiffness
-        matrix are reduced to 21 from 36, and at least 4 stress-strain pairs (24 equations) are required
-        to accurately determine these coefficients. This function solves for the coefficients
+        the stress-strain pairs. In the case of general symmetry, the coefficients of the stiffness
+        matrix are reduced to 21 from 36, and at least 6 stress-strain pairs with linearly independent
+        strains are required to determine these coefficients uniquely, since for n < 6 pairs the
+        equations have only 21 - (6 - n)(7 - n)/2 independent constraints. This function solves for the coefficients
         that minimize the difference between the observed stresses and those predicted by
         the strains through a linear model, under the assumption of general symmetry.
+        The design matrix of size (6N, 21) is assembled by index arithmetic for all pairs at once.
 
         Parameters
         ----------
-        - random_pairs_number (int): The number of random pairs of strains and stresses
-          to use in the calculation. Default is 100, Minimum must be 4.
+        strain: (N, 6)-array
+            Strain tensors of stress-strain pairs.
+        stress: (N, 6)-array
+            Stress tensors of stress-strain pairs.
 
         Returns
         -------
         - C (np.ndarray): The stiffness matrix
         """
-        if random_pairs_number > len(data_pairs):
-            random_pairs_number = len(data_pairs)
-            print("Warning: number of random pairs larger than data set. Using {random_pairs_number} pairs.}")
-        random_pairs = random.sample(data_pairs, random_pairs_number)
-        C_column_locator = {"C11": 1, "C12": 2, "C13": 3, "C14": 4, "C15": 5, "C16": 6,
-                            "C21": 2, "C22": 7, "C23": 8, "C24": 9, "C25": 10, "C26": 11,
-                            "C31": 3, "C32": 8, "C33": 12, "C34": 13, "C35": 14, "C36": 15,
-                            "C41": 4, "C42": 9, "C43": 13, "C44": 16, "C45": 17, "C46": 18,
-                            "C51": 5, "C52": 10, "C53": 14, "C54": 17, "C55": 19, "C56": 20,
-                            "C61": 6, "C62": 11, "C63": 15, "C64": 18, "C65": 20, "C66": 21}
-
-        b = np.zeros(len(random_pairs) * 6)
-        A = np.zeros((len(random_pairs) * 6, 21))
-        row_counter = 0
-        for experiment in random_pairs:
-            Pair_Counter = 1
-            strains = experiment[0]
-            stresses = experiment[1]
-
-            for index in range(len(stresses)):
-                stress = stresses[index]
-                C_locations = [f"C{Pair_Counter}1",
-                               f"C{Pair_Counter}2",
-                               f"C{Pair_Counter}3",
-                               f"C{Pair_Counter}4",
-                               f"C{Pair_Counter}5",
-                               f"C{Pair_Counter}6"]
-                C_locations_translated = [C_column_locator[C_locations[0]],
-                                          C_column_locator[C_locations[1]],
-                                          C_column_locator[C_locations[2]],
-                                          C_column_locator[C_locations[3]],
-                                          C_column_locator[C_locations[4]],
-                                          C_column_locator[C_locations[5]]]
-
-                A[row_counter][C_locations_translated[0] - 1] = strains[0]
-                A[row_counter][C_locations_translated[1] - 1] = strains[1]
-                A[row_counter][C_locations_translated[2] - 1] = strains[2]
-                A[row_counter][C_locations_translated[3] - 1] = strains[3]
-                A[row_counter][C_locations_translated[4] - 1] = strains[4]
-                A[row_counter][C_locations_translated[5] - 1] = strains[5]
-                b[row_counter] = stress
-
-                row_counter += 1
-                Pair_Counter += 1
-
-        # b.reshape(-1, 1)
-        C_flat, _, _, _ = np.linalg.lstsq(A, b, rcond=None)
-        C = map_flat_to_matrix(C_flat)
-        return C
+        # column of coefficient C_ij in vector of 21 independent coefficients, ordered as in map_flat_to_matrix
+        col = np.zeros((6, 6), dtype=int)
+        col[np.triu_indices(6)] = np.arange(21)
+        col = np.maximum(col, col.T)
+        irow, jcol = np.indices((6, 6))
+        # row 6*n+i of design matrix contains strain[n, j] in the column of C_ij
+        A = np.zeros((len(strain), 6, 21))
+        A[:, irow, col] = strain[:, jcol]
+        C_flat, _, _, _ = np.linalg.lstsq(A.reshape(-1, 21), stress.reshape(-1), rcond=None)
+        return map_flat_to_matrix(C_flat)
 
     # start elastic coefficient identification
-    data_pairs = list(zip(eps, sig))
+    strain = np.array(eps, dtype=float).reshape(-1, 6)
+    stress = np.array(sig, dtype=float).reshape(-1, 6)
+    rng = np.random.default_rng(seed)
+    if npairs is not None:
+        if npairs > len(strain):
+            warnings.warn('Number of random pairs larger than data set. Using {} pairs.'.format(len(strain)))
+        else:
+            ind = rng.choice(len(strain), size=npairs, replace=False)
+            strain = strain[ind]
+            stress = stress[ind]
     max_attempts = 50
     attempts = 0
     success = False
-    npairs = len(data_pairs)
     while attempts < max_attempts and not success:
         if method == 'least_square':
-            optimized_C = least_square(data_pairs, random_pairs_number=npairs)
+            optimized_C = least_square(strain, stress)
             success = True
         elif method == 'decomposition':
-            if initial_guess is None:
-                initial_guess = np.random.rand(
-                    21)  # Adjust the number according to the actual problem dimension
-            result = minimize(objective_function, initial_guess, args=(data_pairs, method,), method='L-BFGS-B')
+            # a new random initial guess is used for each attempt
+            x0 = rng.random(21) if initial_guess is None else initial_guess
+            result = minimize(objective_function, x0, args=(strain, stress), jac=True, method='L-BFGS-B')
+            _, optimized_C = map_flat_to_L_and_C(result.x)
             if result.success:
                 success = True
-                _, optimized_C = map_flat_to_L_and_C(result.x)
             else:
                 attempts += 1
                 print("Optimization attempt {} failed".format(attempts))
+                if initial_guess is not None:
+                    break  # repeated attempts with identical initial guess are futile
         else:
             raise ValueError("Invalid method selected. Choose 'least_square' or 'decomposition'.")
 
     if not success:
-        print("Optimization of material stiffness matrix failed after {} attempts".format(max_attempts))
+        print("Optimization of material stiffness matrix failed after {} attempts".format(attempts))
 
     return np.array(optimized_C)
 
 
+def iter_json_items(fname, chunk_size=2 ** 22):
+    """Iterate over the items of the top-level object of a JSON file without loading the
+    complete file. The file is read in chunks and each item is decoded as soon as its text is
+    complete, such that the text of an item is released before the next item is read. Peak
+    memory is thus given by the largest item and not by the complete file.
+
+    Parameters
+    ----------
+    fname : str
+        Name of JSON file, the top-level element must be an object
+    chunk_size : int
+        Number of characters read at once (optional, default: 4M)
+
+    Yields
+    ------
+    key : str
+        Key of item
+    val : object
+        Decoded value of item
+    """
+    decoder = json.JSONDecoder()
+    with open(fname, 'r', encoding='utf-8') as fp:
+        buf = ''
+        pos = 0
+        eof = False
+
+        def more(min_size):
+            # append next chunk to buffer, at least as large as the data already buffered to keep
+            # repeated decoding attempts of large items linear in the size of the item
+            nonlocal buf, pos, eof
+            chunk = fp.read(max(chunk_size, min_size))
+            if not chunk:
+                eof = True
+            buf = buf[pos:] + chunk
+            pos = 0
+
+        def next_char():
+            # skip whitespace and return next character, None at end of file
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in ' \t\n\r':
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                if eof:
+                    return None
+                more(0)
+
+        def decode():
+            # decode JSON value starting at pos, read more data until value is complete, i.e. until
+            # it is followed by a delimiter, numbers could be truncated otherwise
+            nonlocal pos
+            while True:
+                try:
+                    val, end = decoder.raw_decode(buf, pos)
+                    if eof or (end < len(buf) and buf[end] in ' \t\n\r,:]}'):
+                        pos = end
+                        return val
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                more(len(buf) - pos)
+
+        if next_char() != '{':
+            raise ValueError('iter_json_items: Top-level element of {} is not a JSON object.'.format(fname))
+        pos += 1
+        if next_char() == '}':
+            return
+        while True:
+            key = decode()
+            if not isinstance(key, str) or next_char() != ':':
+                raise ValueError('iter_json_items: Invalid key in JSON object of {} at "{}".'
+                                 .format(fname, buf[pos:pos + 20]))
+            pos += 1
+            next_char()
+            yield key, decode()
+            sep = next_char()
+            pos += 1
+            if sep == '}':
+                return
+            if sep != ',':
+                raise ValueError('iter_json_items: Missing separator in JSON object of {}.'.format(fname))
+            next_char()
+
+
+def _load_mat_data(source, path_data, parse_args):
+    """Parse data file and return material data, executed in worker processes of ``Data.load_many``"""
+    return Data(source, path_data=path_data, **parse_args).mat_data
+
+
 class Data(object):
     """Define class for handling data from virtual mechanical tests in micromechanical
     simulations and data from physical mechanical tests on materials with various
@@ -379,6 +447,12 @@ class Data(object):
         Intermediate variable to control the operation mode between Ronak's version (='RS') and Jan's (='JS')
         Currently affects key_parser to decode the bc_keys and read_data where JS uses 32 for instead of 23 for the
         tensor components.
+    cache_dir : str
+        Directory for a cache of parsed data files. If given, the parsed data of a data file is written
+        into a binary container and reused when the same file is read again with the same parameters.
+        The cache entry is identified by the path, size and modification time of the file and by the
+        parsing parameters, such that it is invalidated automatically if one of them changes
+        (optional, default: None, i.e. no caching)
 
     Attributes
     ----------
@@ -429,7 +503,8 @@ class Data(object):
                  tx_data=False,
                  texture_name='Random',
                  tx_descriptor='GSH_3',
-                 mode='RS'):
+                 mode='RS',
+                 cache_dir=None):
         if sdim!=3 and sdim!=6:
             raise ValueError('Value of sdim must be either 3 or 6')
         self.lc_data = None
@@ -454,8 +529,14 @@ class Data(object):
         self.mode = mode
 
         if isinstance(source, str):
-            self.lc_data = self.read_data(os.path.join(path_data, source))
-            self.parse_data(epl_crit, epl_start, epl_max, depl)  # add data to mat_data
+            fname = os.path.join(path_data, source)
+            cache_key = None if cache_dir is None else \
+                self._cache_key(fname, epl_crit, epl_start, epl_max, depl)
+            if cache_key is None or not self._read_cache(cache_dir, cache_key):
+                self.lc_data = self.read_data(fname)
+                self.parse_data(epl_crit, epl_start, epl_max, depl)  # add data to mat_data
+                if cache_key is not None:
+                    self._write_cache(cache_dir, cache_key)
         elif isinstance(source, dict):
             self.lc_data = source
             self.parse_data(epl_crit, epl_start, epl_max, depl)  # add data to mat_data
@@ -468,6 +549,84 @@ class Data(object):
         if plot:
             self.plot_training_data()
 
+    @staticmethod
+    def load_many(paths, path_data='./', n_jobs=-1, **parse_args):
+        """Parse several data files with identical parameters in parallel processes, e.g. data sets
+        of different textures. Parsed data is read from and written into the cache of parsed data
+        files if the parameter cache_dir is given.
+
+        Parameters
+        ----------
+        paths : list of str
+            Names of data files
+        path_data : str
+            Trunc of pathname for data files (optional, default: './')
+        n_jobs : int
+            Number of parallel processes (optional, default: -1, i.e. all cores)
+        parse_args :
+            Further parameters passed to ``Data``, e.g. epl_crit, wh_data, tx_data, mode or cache_dir
+
+        Returns
+        -------
+        mat_data : list of dictionaries
+            Material data of the data files in the order of paths, to be used in ``Material.from_data``
+        """
+        if 'plot' in parse_args:
+            raise ValueError('load_many: Plotting is not supported in parallel processes.')
+        if n_jobs < 0:
+            n_jobs = os.cpu_count()
+        n_jobs = max(1, min(n_jobs, len(paths)))
+        if n_jobs == 1:
+            return [_load_mat_data(source, path_data, parse_args) for source in paths]
+        from joblib import Parallel, delayed
+        return Parallel(n_jobs=n_jobs)(delayed(_load_mat_data)(source, path_data, parse_args)
+                                       for source in paths)
+
+    def _cache_key(self, fname, epl_crit, epl_start, epl_max, depl):
+        """Get key of cache entry for parsed data of a data file, consisting of a fingerprint of the
+        path, size and modification time of the file and of all parameters that affect parsing"""
+        stat = os.stat(fname)
+        md = self.mat_data
+        return FE.TrainingDataCache.fingerprint(
+            FE.__version__, os.path.abspath(fname), stat.st_size, stat.st_mtime_ns, self.mode,
+            epl_crit, epl_start, epl_max, depl, md['sdim'], md['Name'], md['Dataset'], md['wh_data'],
+            md['tx_data'], md['tx_name'], md['tx_descriptor'])
+
+    def _read_cache(self, cache_dir, cache_key):
+        """Read parsed data from cache, returns False if no valid cache entry exists"""
+        fname = os.path.join(cache_dir, 'data_{}.plm'.format(cache_key))
+        if not os.path.isfile(fname):
+            return False
+        try:
+            header, arrays = read_container(fname, mmap=False)
+            if header['Key'] != cache_key:
+                return False
+            lc_data = unpack_tree(header['lc_data'], arrays)
+            mat_data = unpack_tree(header['mat_data'], arrays)
+        except (OSError, ValueError, KeyError) as err:
+            warnings.warn('Cache entry {} cannot be read and will be replaced: {}'.format(fname, err))
+            return False
+        print("Reading parsed data from cache", fname)
+        self.lc_data = lc_data
+        self.mat_data = mat_data
+        return True
+
+    def _write_cache(self, cache_dir, cache_key):
+        """Write parsed data into cache"""
+        arrays = dict()
+        try:
+            header = {'Creator': 'pylabfea', 'Version': FE.__version__, 'Key': cache_key,
+                      'lc_data': pack_tree(self.lc_data, arrays),
+                      'mat_data': pack_tree(self.mat_data, arrays)}
+        except ValueError as err:
+            warnings.warn('Parsed data cannot be cached: {}'.format(err))
+            return
+        os.makedirs(cache_dir, exist_ok=True)
+        fname = os.path.join(cache_dir, 'data_{}.plm'.format(cache_key))
+        ftmp = '{}.{}.tmp'.format(fname, os.getpid())
+        write_container(ftmp, header, arrays)
+        os.replace(ftmp, fname)  # atomic, concurrent jobs never read partially written entries
+
     def key_parser(self, key):
         # JS: Modified to teture version
         parameters = key.split('_')
@@ -513,12 +672,12 @@ class Data(object):
         """
         # JS TODO: Store CYL data correctly
         print("Reading data from", data_File)
-        data = json.load(open(data_File))
         Final_Data = dict()
         elstrain = []
         elstress = []
         E_Plastic = False
-        for num, (key, val) in enumerate(data.items()):
+        # load cases are read and converted one by one to keep memory consumption low
+        for num, (key, val) in enumerate(iter_json_items(data_File)):
             if key == 'Texture':
                 self.mat_data['tx_name'] = val['name']
                 try:
@@ -686,20 +845,19 @@ class Data(object):
             SV = np.linalg.inv(C)
             # print(f'Calculated elastic coefficients:\n {C}')
             # print(f'Compliance matrix:\n {SV}')
-            for key, val in Final_Data.items():
-                stress = val['Stress']
-                strain_t = val['Strain_Total']
-                nval = len(stress)
-                peeq_plastic = np.zeros(nval)
-                Plastic_Strains = np.zeros_like(stress)
-                for i in range(nval):
-                    Elog_tot = ln_strain(strain_t[i, :])
-                    Elog_el = ln_strain(np.dot(SV, stress[i, :]))
-                    E_Plastic_6D = eng_strain(Elog_tot - Elog_el)
-                    peeq_plastic[i] = FE.eps_eq(E_Plastic_6D)
-                    Plastic_Strains[i, :] = E_Plastic_6D
-                Final_Data[key]["Strain_Plastic"] = Plastic_Strains
-                Final_Data[key]["Eq_Strain_Plastic"] = peeq_plastic
+            # plastic strains of all load cases are evaluated at once on the stacked data
+            keys = list(Final_Data.keys())
+            ind = np.cumsum([0] + [len(Final_Data[key]['Stress']) for key in keys])
+            if len(keys) > 0:
+                stress = np.concatenate([Final_Data[key]['Stress'] for key in keys])
+                strain_t = np.concatenate([Final_Data[key]['Strain_Total'] for key in keys])
+                Elog_tot = ln_strain(strain_t)
+                Elog_el = ln_strain(stress @ SV.T)
+                Plastic_Strains = eng_strain(Elog_tot - Elog_el)
+                peeq_plastic = FE.eps_eq(Plastic_Strains)
+                for i, key in enumerate(keys):
+                    Final_Data[key]["Strain_Plastic"] = Plastic_Strains[ind[i]:ind[i + 1]]
+                    Final_Data[key]["Eq_Strain_Plastic"] = peeq_plastic[ind[i]:ind[i + 1]]
             print('Plastic strains are reconstructed from linear part of stress strain data.')
         return Final_Data
 
@@ -737,6 +895,10 @@ class Data(object):
         elstrain = []
         elstress = []
         it_list = []
+        # transition indices of all load cases in one batched call
+        it_dict = dict(zip([key for key in self.lc_data.keys() if 'cyl' not in key],
+                           find_transition_indices([val["Eq_Stress"] for key, val in self.lc_data.items()
+                                                    if 'cyl' not in key])))
         # for key, val in db.items():  ???
         for key, val in self.lc_data.items():
             if 'cyl' in key:
@@ -747,7 +909,7 @@ class Data(object):
             else:
                 # estimate yield point for load case
                 # (1) find transition index w/o definition of critical plastic strain
-                it = find_transition_index(val["Eq_Stress"])
+                it = int(it_dict[key])
                 elstrain.append(
                     val['Strain_Total'][it] - val['Strain_Plastic'][it])  # elastic strain tensor at transition
                 elstress.append(val['Stress'][it])  # stress tensor at transition
@@ -929,6 +1091,8 @@ class Data(object):
             self.plot_data(data, xlabel, ylabel, emax=emax)
 
     def plot_data(self, data, xlabel, ylabel, emax=None):
+        import matplotlib.pyplot as plt
+
         for key, val in data.items():
             if 'cyl' in key:
                 continue
@@ -943,6 +1107,8 @@ class Data(object):
     def plot_stress_strain(self, plot_peeq=True, eps_max=0.1,
                            epc=None,
                            fontsize=14, cmap='viridis'):
+        import matplotlib.pyplot as plt
+
         cols = plt.get_cmap(cmap)
         smax = 0.0
         fig = plt.figure()
@@ -974,6 +1140,8 @@ class Data(object):
 
     def plot_yield_stress(self, show_hist=True, test_data=None,
                           fontsize=14, cmap='viridis'):
+        import matplotlib.pyplot as plt
+
         cols = plt.get_cmap(cmap)
         fig = plt.figure()
         ang = FE.sig_polar_ang(self.mat_data['sig_ideal'])
@@ -1006,6 +1174,8 @@ class Data(object):
             plt.close(fig)
 
     def plot_set(self):
+        import matplotlib.pyplot as plt
+
         fontsize = 18
         cmap = plt.cm.get_cmap('viridis', self.mat_data['Nlc'])
         plt.figure(figsize=(18, 7))
@@ -1057,6 +1227,8 @@ class Data(object):
     def plot_yield_locus(self, db, mat_data, active, scatter=False, data=None,
                          data_label=None, arrow=False, file=None, title=None,
                          fontsize=18):
+        import matplotlib.pyplot as plt
+
         fig, ax = plt.subplots(subplot_kw={'projection': 'polar'},
                                figsize=(15, 8))
         cmap = plt.cm.get_cmap('viridis', 10)
@@ -17,37 +17,60 @@ import random
 from importlib import metadata
 from pylabfea.basic import a_vec, b_vec, \
     eps_eq, sig_polar_ang, yf_tolerance, \
-    sig_eq_j2, sig_cyl2princ, sig_princ, sig_dev, sig_princ2cyl
+    sig_eq_j2, sig_cyl2princ, sig_princ, sig_dev, sig_princ2cyl, sig_voigt2tensor, \
+    sig_princ_vals
 from pylabfea.model import Model
-from pylabfea.training import load_cases
+from pylabfea.training import load_cases, training_score, TrainingDataCache
+from pylabfea.surrogate import YieldRadiusCache
+from pylabfea.backends import YieldBackend, SVCBackend, RBFExpansion, project_on_locus, _scratch_buffer
+from pylabfea.container import write_container, read_container
 from scipy.optimize import root_scalar
-from scipy.optimize import fsolve
-from scipy.spatial import distance
-
-try:
-    from sklearnex import patch_sklearn  # JS: This is patching scikit-learn on intel hardware
-
-    # patch_sklearn()  """aha@JS: Why is this commented???"""
-    print("The scikit-learn intel acceleration is used.")
-except ModuleNotFoundError:
-    pass
-from sklearn import svm
-from matplotlib.lines import Line2D
-from sklearn.preprocessing import StandardScaler
+from importlib.util import find_spec
 import numpy as np
-import matplotlib.pyplot as plt
 import sys
+import os
 import warnings
 import pickle
-from sklearn.model_selection import GridSearchCV
-from sklearn.decomposition import PCA
-from sklearn.model_selection import ParameterGrid
-from sklearn.metrics import matthews_corrcoef
-from sklearn.model_selection import KFold
+import copy
 import platform
 import getpass
 import time
 
+# scikit-learn, joblib and matplotlib are imported in the methods for training and plotting,
+# such that the import of this module and the evaluation of trained materials remain fast
+if find_spec('sklearnex') is not None:
+    # from sklearnex import patch_sklearn  # JS: This is patching scikit-learn on intel hardware
+    # patch_sklearn()  """aha@JS: Why is this commented???"""
+    print("The scikit-learn intel acceleration is used.")
+
+
+def _cv_fold_precomputed(K, y, itrain, itest, cvals):
+    """Train SVC on precomputed kernel matrix of training fold for all values of C and
+    return accuracies on test fold"""
+    from sklearn import svm
+
+    Ktr = K[np.ix_(itrain, itrain)]
+    Kte = K[np.ix_(itest, itrain)]
+    score = np.zeros(len(cvals))
+    for i, C in enumerate(cvals):
+        clf = svm.SVC(kernel='precomputed', C=C).fit(Ktr, y[itrain])
+        score[i] = np.mean(clf.predict(Kte) == y[itest])
+    return score
+
+
+def _texture_cv_job(mat, x, y, offsets, itrain, itest, C, gamma, verbose, metric, pca_dim, backend, ncomp):
+    """Train SVC yield function of a copy of material on the data of the microstructures in the training fold
+    and return scores for training fold and test fold. The data of microstructure i are stored in rows
+    offsets[i]:offsets[i+1] of x and y, which are shared read-only between all jobs."""
+    mat = copy.copy(mat)
+    xtr = np.concatenate([x[offsets[i]:offsets[i + 1]] for i in itrain], axis=0)
+    ytr = np.concatenate([y[offsets[i]:offsets[i + 1]] for i in itrain], axis=0)
+    xte = np.concatenate([x[offsets[i]:offsets[i + 1]] for i in itest], axis=0)
+    yte = np.concatenate([y[offsets[i]:offsets[i + 1]] for i in itest], axis=0)
+    return mat.setup_yf_SVM_6D(xtr, ytr, x_test=xte, y_test=yte, C=C, gamma=gamma,
+                               gridsearch=False, verbose=verbose, metric=metric, pca_dim=pca_dim,
+                               backend=backend, ncomp=ncomp)
+
 
 # ==========================
 # define class for materials
@@ -136,6 +159,16 @@ class Material(object):
     # plasticity: define plastic material parameter sy, khard
     # epl_dot: calculate plastic strain rate
 
+    # class-level defaults of attributes for materials restored from pickles of previous versions
+    yr_cache = None
+    hess_mem = 2 ** 28
+    gs_mem = 2 ** 31
+    td_cache = None
+    compress_info = None
+    tx_descr = None
+    ms_ref = None
+    _yf_backend = None
+
     def __init__(self, name='Material', num=1):
         self.khard = None
         self.ind_tx = None
@@ -174,6 +207,14 @@ class Material(object):
         self.sdim = None  # dimensionality of stress space to be considered in ML flow rules
         self.tdim = None  # JS: dimensionality of texture space to be considered in ML flow rules
         self.root_method = 'brentq'
+        self.yr_cache = None  # surrogate for yield radius, used in ML_full_yf if defined
+        self.hess_mem = 2 ** 28  # memory budget in bytes for temporary arrays in calc_hessian
+        self.gs_mem = 2 ** 31  # memory budget in bytes for kernel matrices in grid search of SVC parameters
+        self.td_cache = None  # cache for training data of microstructures, created in _create_data_for_ms
+        self.compress_info = None  # fidelity of reduced-set approximation of ML yield function, see compress_svc
+        self.tx_descr = None  # type of texture descriptor, used if msparam is not available
+        self.ms_ref = None  # references to data sets of microstructures if msparam is not stored, see pckl
+        self._yf_backend = None  # backend wrapping self.svm_yf, see get_yf_backend
         self.msg = {
             'yield_fct': None,
             'gradient': None,
@@ -206,7 +247,8 @@ class Material(object):
     # =================================================================
     def response(self, sig, epl, deps, CV, maxit=50):
         """Calculate non-linear material response to deformation defined by load step, 
-        corresponds to user material function.
+        corresponds to user material function. Wrapper of ``eval_response`` that stores the
+        diagnostics in self.msg and the strain hardening rate in self.khard.
         
         Parameters
         ----------
@@ -233,6 +275,53 @@ class Material(object):
             Tangent material stiffness matrix (d_sig/d_eps) at end of load step
         
         """
+        fy1, sig, depl, grad_stiff, info = self.eval_response(sig, epl, deps, CV, maxit=maxit)
+        self._store_info(info)
+        return fy1, sig, depl, grad_stiff
+
+    def _store_info(self, info):
+        """Store diagnostics returned by eval_* methods in self.msg and
+        hardening rate in self.khard, as done by the legacy methods"""
+        for key, val in info.items():
+            if key == 'khard':
+                self.khard = val
+            else:
+                self.msg[key] = val
+
+    def eval_response(self, sig, epl, deps, CV, maxit=50, khard=None):
+        """Calculate non-linear material response to deformation defined by load step
+        without modifying the state of the material object. The strain hardening rate
+        is threaded through the load step locally and returned in the diagnostics.
+        
+        Parameters
+        ----------
+        sig : (6,) array
+            Voigt stress tensor at start of load step (=end of previous load step)
+        epl : (6,) array
+            Voigt plastic strain tensor at start of load step
+        deps : (6,) array
+            Voigt strain tensor defining deformation (=load step)
+        CV : (6,6) array
+            Voigt elastic tensor
+        maxit : int
+            Maximum number of iteration steps (optional, default= 5)
+        khard : float
+            Strain hardening rate at start of load step (optional, default: self.khard)
+            
+        Returns
+        -------
+        fy1 : real
+            Yield function at end of load step (indicates whether convergence is reached)
+        sig : (6,) array
+            Voigt stress tensor at end of load step
+        depl : (6,) array
+            Voigt tensor of plastic strain increment at end of load step
+        grad_stiff : (6,6) array
+            Tangent material stiffness matrix (d_sig/d_eps) at end of load step
+        info : dictionary
+            Diagnostics with the entries 'nsteps', 'khard' (strain hardening rate at end of
+            load step) and the labels of the evaluated yield function, equiv. stress and gradient
+        """
         sh = sig.shape
         if sh != (6,) and sh != (3,):
             raise ValueError(
@@ -240,30 +329,51 @@ class Material(object):
         # initialize quantities needed
         sig = np.array(sig)  # produce copy of sig to avoid changes to original
         depl = np.zeros(6)  # initialize plastic strain increment
-        toler = yf_tolerance * self.get_sflow(epl)
+        if khard is None:
+            khard = self.khard
+        info = dict()
+
+        def yfun(s, e):
+            # evaluate yield function with current hardening rate
+            if self.ML_yf:
+                return self.ML_full_yf(s, epl=e, khard=khard)
+            f, hh = self.eval_yf(s, epl=e, khard=khard)
+            info.update(hh)
+            return f
+
+        def pl_step(s, d):
+            # plastic strain increment and tangent stiffness, updates hardening rate
+            nonlocal khard
+            dep, hh = self.eval_epl_dot(s, epl, CV, d, khard=khard)
+            info.update(hh)
+            khard = info['khard']
+            ct, hh = self.eval_C_tan(s, CV, epl=epl, khard=khard)
+            info.update(hh)
+            khard = info['khard']
+            return dep, ct
+
+        toler = yf_tolerance * self.get_sflow(epl, khard)
         dsig = CV @ deps  # predictor of stress increment
         st_scal = 1.
         niter = 0
 
         # evaluate yield function for elastic predictor step
-        if self.ML_yf:
-            fy1 = self.ML_full_yf(sig + dsig, epl=epl)
-        else:
-            fy1 = self.calc_yf(sig + dsig, epl=epl)
+        fy1 = yfun(sig + dsig, epl)
         if fy1 < toler:
             # purely elastic load step
             sig += dsig  # update stress
             grad_stiff = np.array(CV)  # gradient stiffness is elastic stiffness
         else:
             # elastic predictor step reaches to plastic regime
-            fy0 = self.calc_yf(sig, epl=epl)  # yield fct. at start of load step
+            fy0, hh = self.eval_yf(sig, epl=epl, khard=khard)  # yield fct. at start of load step
+            info.update(hh)
             if fy0 < -0.15:
                 # load step starts in elastic regime and ends in plastic regime
                 # must be split into elastic and plastic parts
                 if self.ML_yf:
                     # for categorial ML yield function, calculate fy0 as distance to yield surface
-                    fy0 = self.ML_full_yf(sig)  # distance of initial stress state to yield locus
-                st_scal += fy0 / self.calc_seq(dsig)
+                    fy0 = self.ML_full_yf(sig, khard=khard)  # distance of initial stress state to yield locus
+                st_scal += fy0 / self.eval_seq(dsig)[0]
                 deps_el = deps * (1. - st_scal)  # calculate elastic part of load step
                 sig += CV @ deps_el  # update stress which lies now on yield locus
                 grad_stiff = CV * (1. - st_scal)  # contribution to gradient stiffness
@@ -274,15 +384,11 @@ class Material(object):
                 grad_stiff = np.zeros((6, 6))  # initialize stiffness matrix
 
             # do a first trial step with full deps_r
-            ddepl = self.epl_dot(sig, epl, CV, deps_r)  # plastic strain increment
-            t_stiff = self.C_tan(sig, CV, epl=epl)  # tangent stiffness
+            ddepl, t_stiff = pl_step(sig, deps_r)  # plastic strain increment and tangent stiffness
             eplt = epl + depl + ddepl
             dsig = t_stiff @ deps_r  # update stress with current tangent stiffness
             # evaluate yield function at the end of this step
-            if self.ML_yf:  # and self.msparam is not None:
-                fy1 = self.ML_full_yf(sig + dsig, epl=eplt)
-            else:
-                fy1 = self.calc_yf(sig + dsig, epl=eplt)
+            fy1 = yfun(sig + dsig, eplt)
 
             # if remaining step deps_r is too large, better to subdivide it
             if fy1 > toler:
@@ -296,16 +402,12 @@ class Material(object):
                 # at this stage, the initial stress sig should lie on the yield locus
                 # and the yield function fy1 points outside
                 # in the following, the remaining load step is performed 
-                ddepl = self.epl_dot(sig, epl, CV, deps_r)  # plastic strain increment
-                t_stiff = self.C_tan(sig, CV, epl=epl)  # tangent stiffness
+                ddepl, t_stiff = pl_step(sig, deps_r)  # plastic strain increment and tangent stiffness
                 eplt = epl + depl + ddepl
                 dsig = t_stiff @ deps_r  # update stress with current tangent stiffness
                 sig += dsig
                 # evaluate yield function at the end of this step
-                if self.ML_yf:  # and self.msparam is not None:
-                    fy1 = self.ML_full_yf(sig, epl=eplt)
-                else:
-                    fy1 = self.calc_yf(sig, epl=eplt)
+                fy1 = yfun(sig, eplt)
 
                 if fy1 > toler:
                     # the step size was too large because it ends outside of the yield locus
@@ -319,7 +421,7 @@ class Material(object):
                     for i in range(3, 6):
                         if CV[i, i] > 1.: SV[i, i] = 1. / CV[i, i]
 
-                    dsig = sig * fy1 / self.calc_seq(sig)  # excess stress tensor
+                    dsig = sig * fy1 / self.eval_seq(sig)[0]  # excess stress tensor
                     sig -= dsig  # reduce stress about excess stress
                     ddepl += SV @ dsig  # add plastic strain to balance the elastic strain, violation of volume 
                     # conservation! 
@@ -336,20 +438,19 @@ class Material(object):
                                              [x[4], x[3], x[2]]])
                     t_stiff -= Ct
                     # update yield function
-                    if self.ML_yf:  # and self.msparam is not None:
-                        fy1 = self.ML_full_yf(sig, epl=eplt)
-                    else:
-                        fy1 = self.calc_yf(sig, epl=eplt)
+                    fy1 = yfun(sig, eplt)
                 grad_stiff += t_stiff * st_scal / nsteps
                 depl += ddepl
-        self.msg['nsteps'] = niter
-        return fy1, sig, depl, grad_stiff
+        info['nsteps'] = niter
+        info['khard'] = khard
+        return fy1, sig, depl, grad_stiff, info
 
     def calc_yf(self, sig, epl=None,
                 accumulated_strain=0.0, max_stress=0.0, flag=0.0,
                 tex=None,
                 ana=False, pred=False):
-        """Calculate yield function
+        """Calculate yield function. Wrapper of ``eval_yf`` that stores the
+        diagnostics in self.msg.
 
         Parameters
         ----------
@@ -375,6 +476,45 @@ class Material(object):
         f    : flot or 1d-array
             Yield function for given stress (same length as sig)
         """
+        f, info = self.eval_yf(sig, epl=epl, accumulated_strain=accumulated_strain,
+                               max_stress=max_stress, flag=flag, tex=tex, ana=ana, pred=pred)
+        self._store_info(info)
+        return f
+
+    def eval_yf(self, sig, epl=None,
+                accumulated_strain=0.0, max_stress=0.0, flag=0.0,
+                tex=None,
+                ana=False, pred=False, khard=None):
+        """Calculate yield function without modifying the state of the material object
+
+        Parameters
+        ----------
+        flag : float
+            Indicator
+        sig  : (sdim,) or (N, sdim) array
+            Stresses (arrays of Voigt or principal stresses)
+        epl : (sdim, ) array
+            Equivalent plastic strain tensor (optional, default: 0)
+        max_stress : float
+            Maximum equivalent stress reached so far at this Gauss point
+        accumulated_strain
+            Accumulated equiv. plastic strain at this Gauss point
+        tex : (tdim, ) array
+            Texture descriptor (optional, default: None)
+        ana  : Boolean
+            Indicator if analytical solution should be used, rather than ML yield fct (optional, default: False)
+        pred : Boolean
+            Indicator if prediction value should be returned, rather than decision function (optional, default: False)
+        khard : float
+            Strain hardening rate used for analytical yield function (optional, default: self.khard)
+
+        Returns
+        -------
+        f    : flot or 1d-array
+            Yield function for given stress (same length as sig)
+        info : dictionary
+            Diagnostics with the labels 'yield_fct' and, for analytical yield functions, 'equiv'
+        """
         sh = np.shape(sig)
         if epl is None:
             epl = np.zeros(self.sdim)
@@ -383,6 +523,13 @@ class Material(object):
             epl = epl * np.array([1., -0.5, -0.5, 0., 0., 0.])
 
         if self.ML_yf and not ana:
+            if tex is None and self.txdat:
+                raise ValueError("SVM is trained on texture data but no texture data is given to evaluate yf!")
+            if (sh == (3,) or sh == (6,)) and not pred:
+                # fast path for single stress
+                f = self._yf_point(sig, epl, accumulated_strain, max_stress, flag, tex)
+                if f is not None:
+                    return f, {'yield_fct': 'ML_yf-decision-fct'}
             if sh == (3,) or sh == (6,):
                 sig = np.array([sig])
                 N = 1
@@ -392,28 +539,159 @@ class Material(object):
                 sh_tex = np.shape(tex)
                 if len(sh_tex) == 1:
                     tex = np.array([tex])
-            elif self.txdat:
-                raise ValueError("SVM is trained on texture data but no texture data is given to evaluate yf!")
 
             x = self.create_scaled_input(sig, epl, accumulated_strain, max_stress, flag, tex)
             if pred:
                 # use prediction, returns either -1 or +1
-                f = self.svm_yf.predict(x)
-                self.msg['yield_fct'] = 'ML_yf-predict'
+                f = self.get_yf_backend().predict(x)
+                info = {'yield_fct': 'ML_yf-predict'}
             else:
                 # use continuous decision function in range [-1,+1]
-                f = self.svm_yf.decision_function(x)
-                self.msg['yield_fct'] = 'ML_yf-decision-fct'
+                f = self.get_yf_backend().decision(x)
+                info = {'yield_fct': 'ML_yf-decision-fct'}
             if N == 1:
                 f = f[0]
         else:
-            f = self.calc_seq(sig) - self.get_sflow(epl)
-            self.msg['yield_fct'] = 'analytical'
-        return f
+            seq, info = self.eval_seq(sig)
+            f = seq - self.get_sflow(epl, khard)
+            info['yield_fct'] = 'analytical'
+        return f, info
+
+    def _seq_point(self, sig):
+        """Fast path of ``eval_seq`` for a single principal or Voigt stress without
+        array allocations, not applicable for Barlat model.
+
+        Parameters
+        ----------
+        sig : (3,) or (6,) array
+            Principal stress or Voigt stress
+
+        Returns
+        -------
+        seq : float
+            Equivalent stress
+        info : dictionary
+            Diagnostics with the label 'equiv' of the evaluated equiv. stress
+        """
+        s = np.asarray(sig, dtype=float).tolist()
+        princ = len(s) == 3
+        if princ:
+            s += [0., 0., 0.]
+        if self.tresca:
+            sp = s[0:3] if princ else sig_princ_vals(np.array([s]))[0].tolist()
+            return max(sp) - min(sp), {'equiv': 'Tresca'}
+        if self.sy is None:
+            # elastic material
+            hp = (1., 1., 1.)
+            d0 = (0., 0., 0.)
+        else:
+            hp = self.hill
+            d0 = self.lhs if self.lhs else (self.drucker, self.drucker, self.drucker)
+        I1 = (s[0] * d0[0] + s[1] * d0[1] + s[2] * d0[2]) / 3.
+        if self.hill_6p:
+            I2 = 0.5 * (hp[0] * (s[0] - s[1]) ** 2 + hp[1] * (s[1] - s[2]) ** 2 +
+                        hp[2] * (s[2] - s[0]) ** 2) + \
+                 3. * (hp[3] * s[3] ** 2 + hp[4] * s[4] ** 2 + hp[5] * s[5] ** 2)
+            label = '6-parameter Hill, full Voigt stress'
+        elif not princ and hp[0] == hp[1] == hp[2] == 1.:
+            I2 = 0.5 * ((s[0] - s[1]) ** 2 + (s[1] - s[2]) ** 2 + (s[2] - s[0]) ** 2) + \
+                 3. * (s[3] ** 2 + s[4] ** 2 + s[5] ** 2)
+            label = '3-parameter Hill'
+        else:
+            sp = s[0:3] if princ else sig_princ(np.array([s]))[0][0].tolist()
+            I2 = 0.5 * (hp[0] * (sp[0] - sp[1]) ** 2 + hp[1] * (sp[1] - sp[2]) ** 2 +
+                        hp[2] * (sp[2] - sp[0]) ** 2)
+            label = '3-parameter Hill'
+        return np.sqrt(I2) + I1, {'equiv': label}
+
+    def _scaled_input_point(self, sig, epl, accumulated_strain, max_stress, flag, tex):
+        """Fast path of ``create_scaled_input`` for a single stress. The feature vector is written
+        into a thread-local scratch buffer, which is overwritten by the next call in the same thread.
+
+        Returns
+        -------
+        x : (Ndof,) array or None
+            Scaled feature vector, None if fast path is not applicable (principal stresses with texture,
+            PCA of texture descriptor); in this case ``create_scaled_input`` must be used
+        """
+        if self.txdat and (self.pca is not None or len(sig) != 6):
+            return None
+        if self.sdim == 3 and len(sig) != 3:
+            return None
+        x = _scratch_buffer('x', (self.Ndof,))
+        x.fill(0.)
+        n = len(sig)
+        if self.sdim == 3:
+            s0, s1, s2 = np.asarray(sig, dtype=float).tolist()
+            hyd = (s0 + s1 + s2) / 3.
+            d0, d1, d2 = s0 - hyd, s1 - hyd, s2 - hyd
+            x[0] = np.sqrt(1.5 * (d0 * d0 + d1 * d1 + d2 * d2)) / self.scale_seq - 1.
+            x[1] = np.arctan2(d0 * b_vec[0] + d1 * b_vec[1] + d2 * b_vec[2],
+                              d0 * a_vec[0] + d1 * a_vec[1] + d2 * a_vec[2]) / np.pi
+        else:
+            x[0:n] = sig
+            if self.dev_only:
+                x[0:3] -= (x[0] + x[1] + x[2]) / 3.  # use only deviatoric part
+        if self.txdat:
+            # create unscaled features to be scaled by std_scaler
+            if self.whdat:
+                x[self.ind_wh:self.ind_wh + self.sdim] = epl
+                x[self.ind_wh + self.sdim] = accumulated_strain
+                x[self.ind_wh + self.sdim + 1] = max_stress
+                x[self.ind_wh + self.sdim + 2] = flag
+            x[self.ind_tx:] = np.ravel(tex)
+            sc = self.std_scaler
+            if sc.with_mean:
+                x -= sc.mean_
+            if sc.with_std:
+                x /= sc.scale_
+        else:
+            if self.sdim == 6:
+                x[0:n] /= self.scale_seq
+            if self.whdat:
+                x[self.ind_wh:self.ind_wh + self.sdim] = epl
+                x[self.ind_wh:self.ind_wh + self.sdim] /= self.scale_wh
+                x[self.ind_wh + self.sdim] = accumulated_strain
+                x[self.ind_wh + self.sdim + 1] = max_stress / self.scale_seq
+                x[self.ind_wh + self.sdim + 2] = flag
+        return x
+
+    def get_yf_backend(self):
+        """Get backend of the ML yield function, which evaluates the decision function, its gradient
+        and Hessian w.r.t. the scaled feature vector. The attribute self.svm_yf can hold any object
+        implementing ``pylabfea.backends.YieldBackend``, e.g. an ``RBFExpansion``, which is used
+        directly. A trained SVC of scikit-learn is wrapped into an ``SVCBackend``.
+
+        Returns
+        -------
+        backend : object of class ``YieldBackend``
+            Backend of ML yield function, None if no ML yield function is defined
+        """
+        model = self.svm_yf
+        if model is None or isinstance(model, YieldBackend):
+            return model
+        if self._yf_backend is None or self._yf_backend.svc is not model:
+            self._yf_backend = SVCBackend(model, gamma=self.gam_yf)
+        return self._yf_backend
+
+    def _yf_point(self, sig, epl, accumulated_strain, max_stress, flag, tex):
+        """Fast path of ``eval_yf`` for the decision function of the ML yield function at a single
+        stress. The feature vector is created in a thread-local scratch buffer and passed to
+        ``decision_point`` of the backend, bypassing the input validation of sklearn.
+
+        Returns
+        -------
+        f : float or None
+            Yield function, None if fast path is not applicable
+        """
+        x = self._scaled_input_point(sig, epl, accumulated_strain, max_stress, flag, tex)
+        if x is None:
+            return None
+        return self.get_yf_backend().decision_point(x)
 
     def ML_full_yf(self, sig, epl=None, ld=None,
                    accumulated_strain=0.0, max_stress=0.0, flag=0.0,
-                   tex=None, verb=True):
+                   tex=None, verb=True, khard=None):
         """Calculate full ML yield function as distance of a single given stress
         tensor to the yield locus in loading direction.
         
@@ -428,6 +706,8 @@ class Material(object):
             Vector of loading direction in princ. stress space (optional)
         verb : Boolean
             Indicate whether to be verbose in text output (optional, default: False)
+        khard : float
+            Strain hardening rate (optional, default: self.khard)
 
         Returns
         -------
@@ -440,12 +720,17 @@ class Material(object):
         if sh != (3,) and sh != (6,):
             raise ValueError(
                 'Only individual stress tensors supported in material.ML_full_yf. Shape of argument is {}'.format(sh))
-        seq = self.calc_seq(sig)
-        sflow = self.get_sflow(epl)
+        seq = self.eval_seq(sig)[0]
+        sflow = self.get_sflow(epl, khard)
         if seq < 0.01 and ld is None:
             # return conservative estimate of yield function for small stresses
             # and unknown loading direction
             yf = seq - 0.85 * sflow
+        elif self.yr_cache is not None and ld is None:
+            # interpolate yield radius in direction of sig from surrogate
+            fac = self.yr_cache.yield_factor(sig, epl=epl, accumulated_strain=accumulated_strain,
+                                             max_stress=max_stress, flag=flag, tex=tex, khard=khard)
+            yf = seq * (1. - fac)
         else:
             if ld is None:
                 # construct unit stress in loading direction
@@ -472,26 +757,26 @@ class Material(object):
                 else:
                     x0 *= 0.5
             x1 = x0
-            while self.calc_yf(x0 * su, epl=epl,
+            while self.eval_yf(x0 * su, epl=epl,
                                accumulated_strain=accumulated_strain,
                                max_stress=max_stress, flag=flag,
-                               tex=tex) >= 0. and x0 > 0.01:
+                               tex=tex, khard=khard)[0] >= 0. and x0 > 0.01:
                 # find x0 with negative yield fct
                 x0 *= 0.98
-            while self.calc_yf(x1 * su, epl=epl,
+            while self.eval_yf(x1 * su, epl=epl,
                                accumulated_strain=accumulated_strain,
                                max_stress=max_stress, flag=flag,
-                               tex=tex) < 0. and x1 < 5. * sflow:
+                               tex=tex, khard=khard)[0] < 0. and x1 < 5. * sflow:
                 # find x1 with positive yield fct
                 x1 *= 1.02
-            f0 = self.calc_yf(x0 * su, epl=epl,
+            f0 = self.eval_yf(x0 * su, epl=epl,
                               accumulated_strain=accumulated_strain,
                               max_stress=max_stress, flag=flag,
-                              tex=tex)
-            f1 = self.calc_yf(x1 * su, epl=epl,
+                              tex=tex, khard=khard)[0]
+            f1 = self.eval_yf(x1 * su, epl=epl,
                               accumulated_strain=accumulated_strain,
                               max_stress=max_stress, flag=flag,
-                              tex=tex)
+                              tex=tex, khard=khard)[0]
             if f0 * f1 > 0.:
                 warnings.warn('ML_full_yf: Could not bracket yield function: '
                               + 'sunit={}, x0={}, f0={}, x1={}, f1={}'
@@ -500,24 +785,42 @@ class Material(object):
 
             res = root_scalar(self.find_yloc_scalar, method=self.root_method,
                               bracket=[x0, x1],
-                              args=(su, epl), xtol=1.e-5)
+                              args=(su, epl, 0.0, 0.0, 0.0, None, khard), xtol=1.e-5)
             xs = res.root
             if res.converged and xs < 4. * sflow:
                 # zero of ML yield fct. detected at x1*su
-                yf = seq - xs * self.calc_seq(su)
+                yf = seq - xs * self.eval_seq(su)[0]
             else:
                 # zero of ML yield fct. not found: get conservative estimate
                 yf = seq - 0.85 * sflow
                 if verb:
-                    ys = self.find_yloc_scalar(xs, su, epl)
+                    ys = self.find_yloc_scalar(xs, su, epl, khard=khard)
                     warnings.warn('ML_full_yf')
                     print('*** detection not successful. yf={}, seq={}, ld={}, su:{}'.format(yf, seq, ld, su))
                     print('*** optimization result (x1={},y1={},msg={}):'.format(xs, ys, res))
         return yf
 
+    def setup_yield_cache(self, nseed=None, nnb=4, tol=2.e-3, max_mem=2 ** 24, dev=None, verify=True):
+        """Create surrogate for the yield radius as function of the direction in stress space, which is
+        used in ``ML_full_yf`` to evaluate the distance of a stress to the yield locus by interpolation
+        rather than by a root search. For the parameters see class ``YieldRadiusCache``.
+        Call with ``nseed=0`` to remove an existing surrogate.
+
+        Returns
+        -------
+        yr_cache : object of class ``YieldRadiusCache``
+            Surrogate for yield radius
+        """
+        if nseed == 0:
+            self.yr_cache = None
+        else:
+            self.yr_cache = YieldRadiusCache(self, nseed=nseed, nnb=nnb, tol=tol, max_mem=max_mem,
+                                             dev=dev, verify=verify)
+        return self.yr_cache
+
     def find_yloc(self, x, su, epl=None,
                   accumulated_strain=0.0, max_stress=0.0, flag=0.0,
-                  tex=None):
+                  tex=None, khard=None):
         """Function to expand unit stresses by factor and calculate yield
         function; used by search algorithm to find zeros of yield function.
 
@@ -531,6 +834,8 @@ class Material(object):
             Plastic strain tensor (optional, default: None)
         tex : (tdim, ) array
             Texture descriptor (optional, default: None)
+        khard : float
+            Strain hardening rate (optional, default: self.khard)
         Returns
         -------
         f : (N,)-array
@@ -539,14 +844,14 @@ class Material(object):
 
         if self.txdat and tex is None:
             raise ValueError("SVM is trained on texture data but no texture data was provided to this function.")
-        f = self.calc_yf(x[:, None] * su, epl=epl,
-                         accumulated_strain=accumulated_strain,
-                         max_stress=max_stress, flag=flag, tex=tex)
+        f, info = self.eval_yf(x[:, None] * su, epl=epl,
+                               accumulated_strain=accumulated_strain,
+                               max_stress=max_stress, flag=flag, tex=tex, khard=khard)
         return f
 
     def find_yloc_scalar(self, x, su, epl=None,
                          accumulated_strain=0.0, max_stress=0.0, flag=0.0,
-                         tex=None):
+                         tex=None, khard=None):
         """Function to expand unit stresses by factor and calculate yield
         function; used by search algorithm to find zeros of yield function.
 
@@ -560,6 +865,8 @@ class Material(object):
             Plastic strain tensor (optional, default: None)
         tex : (tdim, ) array
             Texture descriptor (optional, default: None)
+        khard : float
+            Strain hardening rate (optional, default: self.khard)
         Returns
         -------
         f : float
@@ -568,13 +875,112 @@ class Material(object):
 
         if self.txdat and tex is None:
             raise ValueError("SVM is trained on texture data but no texture data was provided to this function.")
-        f = self.calc_yf(x * su, epl=epl,
-                         accumulated_strain=accumulated_strain,
-                         max_stress=max_stress, flag=flag, tex=tex)
+        f, info = self.eval_yf(x * su, epl=epl,
+                               accumulated_strain=accumulated_strain,
+                               max_stress=max_stress, flag=flag, tex=tex, khard=khard)
         return f
 
-    def calc_seq(self, sig):
-        """Calculate generalized equivalent stress from stress tensor;
+    def find_yloc_batch(self, su, epl=None,
+                        accumulated_strain=0.0, max_stress=0.0, flag=0.0,
+                        tex=None, x0=None, xtol=1.e-5, maxit=100, khard=None):
+        """Find yield stresses along N given directions in stress space. Each direction defines an
+        independent scalar root problem, all problems are bracketed and solved simultaneously by
+        a vectorized Illinois method (regula falsi with safeguard by bisection), such that each
+        iteration requires only one evaluation of the yield function for the N stresses.
+
+        Parameters
+        ----------
+        su : (N,sdim) array
+            Unit stresses defining directions in stress space
+        epl : (sdim,) array
+            Plastic strain tensor (optional, default: None)
+        tex : (tdim, ) array
+            Texture descriptor (optional, default: None)
+        x0 : float or (N,) array
+            Starting values for multipliers of unit stresses (optional, default: flow stress divided by
+            equivalent stress of su)
+        xtol : float
+            Relative tolerance of multipliers (optional, default: 1.e-5)
+        maxit : int
+            Maximum number of iterations for bracketing and for root search (optional, default: 100)
+        khard : float
+            Strain hardening rate (optional, default: self.khard)
+
+        Returns
+        -------
+        x : (N,)-array
+            Multipliers such that x*su lies on yield locus, NaN for directions in which yield locus cannot be found
+        """
+        su = np.array(su, dtype=float, ndmin=2)
+        N = len(su)
+        args = (epl, accumulated_strain, max_stress, flag, tex, khard)
+
+        def yfun(x, ind):
+            return np.atleast_1d(self.find_yloc(x, su[ind], *args))
+
+        if x0 is None:
+            sflow = self.get_sflow(np.zeros(self.sdim) if epl is None else epl, khard)
+            x0 = sflow / np.maximum(np.atleast_1d(self.eval_seq(su)[0]), 1.e-3)
+        xl = np.ones(N) * x0
+        xh = np.array(xl)
+        fl = yfun(xl, slice(None))
+        fh = np.array(fl)
+
+        # bracket zero of yield function by expanding interval geometrically
+        ind = np.nonzero(fl > 0.)[0]
+        for it in range(maxit):
+            if len(ind) == 0:
+                break
+            xh[ind], fh[ind] = xl[ind], fl[ind]
+            xl[ind] *= 0.8
+            fl[ind] = yfun(xl[ind], ind)
+            ind = ind[fl[ind] > 0.]
+        ind = np.nonzero(fh < 0.)[0]
+        for it in range(maxit):
+            if len(ind) == 0:
+                break
+            xl[ind], fl[ind] = xh[ind], fh[ind]
+            xh[ind] *= 1.25
+            fh[ind] = yfun(xh[ind], ind)
+            ind = ind[fh[ind] < 0.]
+        fail = np.logical_or(fl > 0., fh < 0.)
+        if np.any(fail):
+            warnings.warn('find_yloc_batch: Could not bracket yield locus for {} directions'
+                          .format(np.sum(fail)))
+
+        # Illinois method for all active directions
+        x = np.where(fl == 0., xl, xh)
+        side = np.zeros(N, dtype=int)  # side of interval retained in last iteration
+        act = np.nonzero(~fail & (fl != 0.) & (fh != 0.) & (xh - xl > xtol * np.abs(xh)))[0]
+        for it in range(maxit):
+            if len(act) == 0:
+                break
+            xa, xb, fa, fb = xl[act], xh[act], fl[act], fh[act]
+            xn = (xa * fb - xb * fa) / (fb - fa)
+            # bisection if secant step is not inside bracket
+            ibis = ~np.isfinite(xn) | (xn < xa) | (xn > xb)
+            xn[ibis] = 0.5 * (xa[ibis] + xb[ibis])
+            fn = yfun(xn, act)
+            dx = np.abs(xn - x[act])
+            x[act] = xn
+            upper = fn >= 0.
+            # replace upper bound, halve function value at lower bound if it was retained twice
+            iu = act[upper]
+            xh[iu], fh[iu] = xn[upper], fn[upper]
+            fl[iu[side[iu] == -1]] *= 0.5
+            side[iu] = -1
+            il = act[~upper]
+            xl[il], fl[il] = xn[~upper], fn[~upper]
+            fh[il[side[il] == 1]] *= 0.5
+            side[il] = 1
+            conv = np.logical_or(fn == 0., np.minimum(dx, xh[act] - xl[act]) <= xtol * np.abs(xn))
+            act = act[~conv]
+        x[fail] = np.nan
+        return x
+
+    def eval_seq(self, sig):
+        """Calculate generalized equivalent stress from stress tensor without modifying
+        the state of the material object;
         equivalent J2 stress for isotropic flow behavior and tension compression invariance;
         Hill-type approach for anisotropic plastic yielding;
         Drucker-like approach for tension-compression asymmetry;
@@ -583,7 +989,8 @@ class Material(object):
         
         Step 1: transform input into 
           (i)   sig: (N,6)-array of Voigt stresses (zeros added if input is princ. stresses)  
-          (ii)  sp: (N,3)-array of principal stresses  
+          (ii)  sp: (N,3)-array of principal stresses, for Voigt stresses only evaluated if required
+                (Tresca or anisotropic 3-parameter Hill), otherwise invariants of Voigt stress are used
           
           N=1 if input is single stress in which case return value is of type float
         
@@ -603,10 +1010,15 @@ class Material(object):
         -------
         seq : float or (N,) array
             Hill-Drucker-type equivalent stress
+        info : dictionary
+            Diagnostics with the label 'equiv' of the evaluated equiv. stress
         """
 
         N = len(sig)
         sh = np.shape(sig)
+        if (sh == (3,) or sh == (6,)) and not self.barlat:
+            # fast path for single stress
+            return self._seq_point(sig)
         # Step 1: Transform input
         if sh == (3,):
             N = 1  # sp is single principal stress vector
@@ -617,24 +1029,25 @@ class Material(object):
             sig = np.append(sig, np.zeros((N, 3)), axis=1)
         elif sh == (6,):
             N = 1
-            sp = sig_princ(sig)[0]
-            sp = np.array([sp])
+            sp = None
             sig = np.array([sig])
         elif sh == (N, 6):
-            sp = sig_princ(sig)[0]
+            sp = None
         else:
-            print('*** calc_seq: N={}, sh={}, caller={}'.format(N, sh, sys._getframe().f_back.f_code.co_name))
-            raise TypeError('Unknown format of stress in calc_seq')
+            print('*** eval_seq: N={}, sh={}, caller={}'.format(N, sh, sys._getframe().f_back.f_code.co_name))
+            raise TypeError('Unknown format of stress in eval_seq')
 
         # Step 2: call subroutines or evaluate von Mises/J2 equiv stress
         if self.tresca:
             # calculate Tresca equiv. stress
+            if sp is None:
+                sp = sig_princ_vals(sig)
             seq = np.amax(sp, axis=1) - np.amin(sp, axis=1)
+            label = 'Tresca'
         elif self.barlat:
             # calculate Baralat equiv. stress
-            seq = np.zeros(N)
-            for i in range(N):
-                seq[i] = self.calc_seqB(sig[i, :])
+            seq = self.calc_seqB(sig)
+            label = 'Barlat Yld2004-18p'
         else:
             # calculate J2 or Hill equiv. stress
             if self.sy is None:
@@ -659,46 +1072,109 @@ class Material(object):
                      6. * hp[4] * np.square(sig[:, 4]) + \
                      6. * hp[5] * np.square(sig[:, 5])
                 I2 *= 0.5
-                self.msg['equiv'] = '6-parameter Hill, full Voigt stress'
+                label = '6-parameter Hill, full Voigt stress'
                 # print('Full stress', np.sqrt(I2))
+            elif sp is None and hp[0] == hp[1] == hp[2] == 1.:
+                # J2 equiv. stress directly from invariants of Voigt stress
+                I2 = 0.5 * (np.square(sig[:, 0] - sig[:, 1]) +
+                            np.square(sig[:, 1] - sig[:, 2]) +
+                            np.square(sig[:, 2] - sig[:, 0])) + \
+                     3. * (np.square(sig[:, 3]) + np.square(sig[:, 4]) + np.square(sig[:, 5]))
+                label = '3-parameter Hill'
             else:
                 # standard: equiv. stress based on princ. stresses with 3-parameter Hill model
                 # calculate Hill or J2 equiv. stress (latter is default, all Hill parameters = 1)
+                if sp is None:
+                    sp = sig_princ(sig)[0]
                 d12 = sp[:, 0] - sp[:, 1]
                 d23 = sp[:, 1] - sp[:, 2]
                 d31 = sp[:, 2] - sp[:, 0]
                 I2 = 0.5 * (hp[0] * np.square(d12) + hp[1] * np.square(d23) + hp[2] * np.square(d31))
-                self.msg['equiv'] = '3-parameter Hill'
+                label = '3-parameter Hill'
             # eqiv stress including hydrostatic stress for tension-compression asymmetry
             seq = np.sqrt(I2) + I1  # generalized eqiv. stress
         if N == 1:
             seq = seq[0]
+        return seq, {'equiv': label}
+
+    def calc_seq(self, sig):
+        """Calculate generalized equivalent stress from stress tensor. Wrapper of ``eval_seq``
+        that stores the label of the evaluated equiv. stress in self.msg.
+
+        Parameters
+        ----------
+        sig : (sdim,) or (N,sdim) array
+            Stress values (for dim=3 principal stresses are assumed, otherwise Voigt stress)
+
+        Returns
+        -------
+        seq : float or (N,) array
+            Hill-Drucker-type equivalent stress
+        """
+        seq, info = self.eval_seq(sig)
+        self._store_info(info)
         return seq
 
-    def calc_seqB(self, sv):
+    def calc_seqB(self, sv, grad=False):
         """Calculate equivalent stress based on Yld2004-18p yield function 
-        proposed by Barlat et al, Int. J. Plast. 21 (2005) 1009
+        proposed by Barlat et al, Int. J. Plast. 21 (2005) 1009. All stresses are
+        evaluated simultaneously with batched linear transformations and eigen
+        decompositions.
         
         Parameters
         ----------
-        sv : (6,) array
+        sv : (6,) or (N,6) array
             Voigt stress tensor
+        grad : Boolean
+            Indicate whether gradient of equivalent stress should be returned (optional, default: False)
             
         Returns
         -------
-        seq : float
+        seq : float or (N,) array
             Equivalent stress
+        fgrad : (6,) or (N,6) array
+            Gradient of equivalent stress w.r.t. Voigt stress components (only if grad=True)
         """
-        sd = sig_dev(sv)
-        st1 = self.Bar_m1 @ sd  # first linearly transformed stress deviator s_tilda_'
-        st2 = self.Bar_m2 @ sd  # second linearly transformed stress deviator s_tilda_''
-        Stp1 = sig_princ(st1)[0]  # principal stress of transformed stress
-        Stp2 = sig_princ(st2)[0]
+        sh = np.shape(sv)
+        sd = sig_dev(np.array(sv, dtype=float, ndmin=2))
+        st1 = sd @ self.Bar_m1.T  # first linearly transformed stress deviator s_tilda_'
+        st2 = sd @ self.Bar_m2.T  # second linearly transformed stress deviator s_tilda_''
+        if grad:
+            # principal stresses and eigenvectors of transformed stresses
+            Stp1, ev1 = np.linalg.eigh(sig_voigt2tensor(st1))
+            Stp2, ev2 = np.linalg.eigh(sig_voigt2tensor(st2))
+        else:
+            Stp1 = sig_princ_vals(st1)
+            Stp2 = sig_princ_vals(st2)
         a = self.barlat_exp
-        seq = np.abs(Stp1[0] - Stp2[0]) ** a + np.abs(Stp1[0] - Stp2[1]) ** a + np.abs(Stp1[0] - Stp2[2]) ** a + \
-              np.abs(Stp1[1] - Stp2[0]) ** a + np.abs(Stp1[1] - Stp2[1]) ** a + np.abs(Stp1[1] - Stp2[2]) ** a + \
-              np.abs(Stp1[2] - Stp2[0]) ** a + np.abs(Stp1[2] - Stp2[1]) ** a + np.abs(Stp1[2] - Stp2[2]) ** a
-        seq = (0.25 * seq) ** (1. / a)
+        dS = Stp1[:, :, None] - Stp2[:, None, :]  # differences S'_i - S''_j
+        hh = np.abs(dS) ** a
+        phi = np.sum(hh, axis=(1, 2))
+        seq = (0.25 * phi) ** (1. / a)
+        if grad:
+            # derivatives of phi w.r.t. principal values, divided by a
+            hh = np.sign(dS) * np.abs(dS) ** (a - 1)
+            dp1 = np.sum(hh, axis=2)
+            dp2 = -np.sum(hh, axis=1)
+            # derivatives of principal values w.r.t. Voigt components of transformed stress
+            ind = ([0, 1, 2, 1, 0, 0], [0, 1, 2, 2, 2, 1])
+            fac = np.array([1., 1., 1., 2., 2., 2.])
+            dn1 = ev1[:, ind[0], :] * ev1[:, ind[1], :] * fac[None, :, None]
+            dn2 = ev2[:, ind[0], :] * ev2[:, ind[1], :] * fac[None, :, None]
+            dst1 = np.einsum('nki,ni->nk', dn1, dp1)
+            dst2 = np.einsum('nki,ni->nk', dn2, dp2)
+            dsd = dst1 @ self.Bar_m1 + dst2 @ self.Bar_m2
+            # derivative w.r.t. full stress via deviatoric projection
+            fgrad = dsd - np.sum(dsd[:, 0:3], axis=1)[:, None] * np.array([1., 1., 1., 0., 0., 0.]) / 3.
+            ind = np.nonzero(phi > 0.)[0]
+            fgrad[ind, :] *= (seq[ind] / phi[ind])[:, None]
+            fgrad[phi <= 0., :] = 0.
+        if sh == (6,):
+            seq = seq[0]
+            if grad:
+                fgrad = fgrad[0]
+        if grad:
+            return seq, fgrad
         return seq
 
     def calc_fgrad(self, sig, epl=None, seq=None,
@@ -707,6 +1183,42 @@ class Material(object):
         """Calculate gradient to yield surface. Three different methods can be used: (i) analytical gradient to Hill-like yield
         function (default if no ML yield function exists - ML_yf=False), (ii) gradient to ML yield function (default if ML yield
         function exists - ML_yf=True; can be overwritten if ana=True), (iii) ML gradient fitted seperately from ML yield function
+        (activated if ML_grad=True and ana=False).
+        Wrapper of ``eval_fgrad`` that stores the diagnostics in self.msg and the strain hardening rate
+        in self.khard.
+
+        Parameters
+        ----------
+        sig : (sdim,) or (N,sdim) array
+            Stress value (Pricipal stress or full stress tensor)
+        epl : (sdim,) array
+            Plastic strain tensor (optional, default = None)
+        accumulated_strain
+        max_stress
+        flag
+        seq : float or (N,) array
+            Equivalent stresses (optional)
+        ana : Boolean
+            Indicator if analytical solution should be used, rather than ML yield fct (optional, default: False)
+        tex : (tdim, ) array
+            Texture descriptor (optional, default: None)
+
+        Returns
+        -------
+        fgrad : (sdim,), (N,sdim) array
+            Gradient to yield surface at given position in stress space, same dimension as sdim
+        """
+        fgrad, info = self.eval_fgrad(sig, epl=epl, seq=seq, accumulated_strain=accumulated_strain,
+                                      max_stress=max_stress, flag=flag, tex=tex, ana=ana)
+        self._store_info(info)
+        return fgrad
+
+    def eval_fgrad(self, sig, epl=None, seq=None,
+                   accumulated_strain=0.0, max_stress=0.0, flag=0.0,
+                   tex=None, ana=False, khard=None):
+        """Calculate gradient to yield surface without modifying the state of the material object. Three different methods can be used: (i) analytical gradient to Hill-like yield
+        function (default if no ML yield function exists - ML_yf=False), (ii) gradient to ML yield function (default if ML yield
+        function exists - ML_yf=True; can be overwritten if ana=True), (iii) ML gradient fitted seperately from ML yield function
         (activated if ML_grad=True and ana=False)
 
         Parameters
@@ -724,12 +1236,19 @@ class Material(object):
             Indicator if analytical solution should be used, rather than ML yield fct (optional, default: False)
         tex : (tdim, ) array
             Texture descriptor (optional, default: None)
+        khard : float
+            Strain hardening rate, returned unchanged if it is not derived from the ML model
+            (optional, default: self.khard)
 
         Returns
         -------
         fgrad : (sdim,), (N,sdim) array
             Gradient to yield surface at given position in stress space, same dimension as sdim
+        info : dictionary
+            Diagnostics with the label 'gradient' and the strain hardening rate 'khard'
         """
+        if khard is None:
+            khard = self.khard
         N = len(sig)
         sh = np.shape(sig)
         if epl is None:
@@ -750,77 +1269,62 @@ class Material(object):
             raise ValueError("SVM is trained on texture data but no texture data is given to evaluate yf!")
         fgrad = np.zeros_like(sig)
         if self.ML_grad and not ana:
-            # Evaluate SVR trained to plastic strain increments
-            xf = np.zeros(12)
-            for i, sv in enumerate(sig):
-                np.concatenate((sig[i, :], epl[i, :]), out=xf)
-                xsc = self.sc_feat.transform([xf])
-                dp = np.array([self.svm_grad0.predict(xsc)[0], self.svm_grad1.predict(xsc)[0],
-                               self.svm_grad2.predict(xsc)[0], self.svm_grad3.predict(xsc)[0],
-                               self.svm_grad4.predict(xsc)[0], self.svm_grad5.predict(xsc)[0]])
-                fgrad[i, :] = self.sc_grad.inverse_transform([dp])
+            # Evaluate SVR trained to plastic strain increments, all stresses in one batch
+            xsc = self.sc_feat.transform(np.concatenate((sig, epl), axis=1))
+            dp = np.column_stack((self.svm_grad0.predict(xsc), self.svm_grad1.predict(xsc),
+                                  self.svm_grad2.predict(xsc), self.svm_grad3.predict(xsc),
+                                  self.svm_grad4.predict(xsc), self.svm_grad5.predict(xsc)))
+            fgrad = self.sc_grad.inverse_transform(dp)
             # Global strain hardening rate will be set according to last value
-            self.khard = self.sc_khard.inverse_transform([self.svm_khard.predict(xsc)])[0]
-            self.msg['gradient'] = 'SVR gradient'
+            khard = self.sc_khard.inverse_transform([self.svm_khard.predict(xsc[-1:])])[0]
+            info = {'gradient': 'SVR gradient'}
         elif self.ML_yf and not ana:
             # use gradient of SVC yield fct. in stress space
-            # gradient of SVC kernel function w.r.t. feature vector
-            def grad_rbf(x, xp):
-                # calculate gradient of radial basis function kernel
-                # x.shape=(Ndof,)
-                # xp.shape=(Nsv,Ndof)
-                # grad.shape=(Nsv,Ndof)
-                hv = x - xp
-                hh = np.sum(hv * hv, axis=1)  # ||x-x'||^2=sum_i(x_i-x'_i)^2
-                k = np.exp(-self.gam_yf * hh)
-                arg = -2. * self.gam_yf * hv
-                grad = k[:, None] * arg
-                return grad
-
-            def Jac(sig):
-                # define Jacobian of coordinate transformation
-                J = np.ones((3, 3))
-                dev = sig_dev(sig)  # deviatoric princ. stress
-                vn = np.linalg.norm(dev) * np.sqrt(1.5)  # norm of stress vector
-                if vn > 0.1:
-                    # calculate Jacobian only if sig>0
-                    dseqds = 3. * dev / vn
-                    J[:, 2] /= 3.
-                    J[:, 0] = dseqds
-                    dsa = np.dot(sig, a_vec)
-                    dsb = np.dot(sig, b_vec)
-                    sc = dsa + 1j * dsb
-                    z = -1j * ((a_vec + 1j * b_vec) / sc - dseqds / vn)
-                    J[:, 1] = np.real(z)
-                return J
-
             x = self.create_scaled_input(sig, epl, accumulated_strain, max_stress, flag, tex)
-            dc = self.svm_yf.dual_coef_[0, :]
-            sv = self.svm_yf.support_vectors_
-            hk = np.zeros(self.sdim)
-            for i in range(N):
-                hh = grad_rbf(x[i, :], sv)
-                dKdx = np.sum(dc[:, None] * hh, axis=0)
-                if self.sdim == 3:
-                    fgrad[i, :] = Jac(sig[i, :]) @ np.array([1, dKdx[1], 0])
-                else:
-                    fgrad[i, 0:6] = dKdx[0:6] / self.scale_seq
-                if self.whdat:
-                    hk -= dKdx[self.ind_wh:self.ind_wh + self.sdim] * self.scale_seq / self.scale_wh
+            dKdx = self.get_yf_backend().gradient(x, max_mem=self.hess_mem)
+            if self.sdim == 3:
+                # Jacobian of coordinate transformation from cylindrical to principal stresses
+                J = np.ones((N, 3, 3))
+                dev = sig_dev(sig)  # deviatoric princ. stress
+                vn = np.linalg.norm(dev, axis=1) * np.sqrt(1.5)  # norm of stress vector
+                ind = np.nonzero(vn > 0.1)[0]  # calculate Jacobian only if sig>0
+                dseqds = 3. * dev[ind] / vn[ind, None]
+                J[ind, :, 2] /= 3.
+                J[ind, :, 0] = dseqds
+                sc = sig[ind] @ a_vec + 1j * (sig[ind] @ b_vec)
+                z = -1j * ((a_vec + 1j * b_vec)[None, :] / sc[:, None] - dseqds / vn[ind, None])
+                J[ind, :, 1] = np.real(z)
+                fgrad = J[:, :, 0] + J[:, :, 1] * dKdx[:, 1:2]
+            else:
                 if self.std_scaler:  # JS: Checks if scaler is there NOT if texture is there
-                    fgrad[i, :] /= self.self.scale_seq  # JS: fgrad only contains stress derivatives here
-            self.khard = np.sum(hk) / N  # multiply with matrix (d_eps_eq/d_eps)^-1 instead of summation ???
-            if self.khard < 0.:
-                self.khard = 0.  # strain softening not supported
-            self.msg['gradient'] = 'gradient to ML_yf'
+                    # stresses are scaled component-wise by std_scaler in create_scaled_input
+                    fgrad[:, 0:6] = dKdx[:, 0:6] / self.std_scaler.scale_[0:6]
+                else:
+                    fgrad[:, 0:6] = dKdx[:, 0:6] / self.scale_seq
+            if self.whdat:
+                hk = -np.sum(dKdx[:, self.ind_wh:self.ind_wh + self.sdim], axis=0) * self.scale_seq / self.scale_wh
+                khard = np.sum(hk) / N  # multiply with matrix (d_eps_eq/d_eps)^-1 instead of summation ???
+            else:
+                khard = 0.
+            if khard < 0.:
+                khard = 0.  # strain softening not supported
+            info = {'gradient': 'gradient to ML_yf'}
+        elif self.barlat:
+            # calculate analytical gradient of Barlat Yld2004-18p equiv. stress
+            if self.sdim == 3:
+                sv = np.zeros((N, 6))
+                sv[:, 0:3] = sig
+                fgrad = self.calc_seqB(sv, grad=True)[1][:, 0:3]
+            else:
+                fgrad = self.calc_seqB(sig, grad=True)[1]
+            info = {'gradient': 'analytical, Barlat Yld2004-18p'}
         else:
             # calculate analytical gradient based on the active material formulation 
             # standard: Hill definition of equiv. stress, which contains isotropic J2 equiv. stress
             # as special case.
-            # currently implemented: J2, 3-parameter Hill (only principal stresses), 6-parameter Hill full stress tensor
-            # no gradient yet for Barlat and Tresca, numerical gradient
-            if self.barlat:
-                raise ValueError('calc_fgrad: analytical gradient for Barlat not implemented')
+            # currently implemented: J2, 3-parameter Hill (only principal stresses), 6-parameter Hill full stress
+            # tensor; Barlat is treated separately
+            # no gradient yet for Tresca
             if self.tresca:
                 raise ValueError('calc_fgrad: analytical gradient for Tresca not implemented')
             h0 = self.hill[0]
@@ -830,8 +1334,9 @@ class Material(object):
                 d3 = self.lhs
             else:
                 d3 = np.ones(3) * self.drucker / 3.
+            info = dict()
             if seq is None:
-                seq = self.calc_seq(sig)
+                seq, info = self.eval_seq(sig)
             sdev = sig_dev(sig)
             fgrad[:, 0] = ((h0 + h2) * sdev[:, 0] - h0 * sdev[:, 1] - h2 * sdev[:, 2]) / (2. * seq) + d3[0]
             fgrad[:, 1] = ((h1 + h0) * sdev[:, 1] - h0 * sdev[:, 0] - h1 * sdev[:, 2]) / (2. * seq) + d3[1]
@@ -852,14 +1357,31 @@ class Material(object):
                     label = 'analytical, J2 isotropic, princ. stress'
                 else:
                     label = 'analytical, 3-parameter Hill, princ. stress'
-            self.msg['gradient'] = label
+            info['gradient'] = label
         if N == 1:
             fgrad = fgrad[0, :]
-        return fgrad
+        info['khard'] = khard
+        return fgrad, info
+
+    def grad_rbf(self, x):
+        """Calculate gradient of the decision function of the ML yield function w.r.t. the
+        scaled feature vector for all inputs simultaneously, see ``YieldBackend.gradient``.
+
+        Parameters
+        ----------
+        x : (N, Ndof) array
+            Scaled feature vectors (see ``create_scaled_input``)
+
+        Returns
+        -------
+        dKdx : (N, Ndof) array
+            Gradient of decision function w.r.t. feature vector
+        """
+        return self.get_yf_backend().gradient(x, max_mem=self.hess_mem)
 
     def calc_hessian(self, sig, epl=None, seq=None,
                      accumulated_strain=0.0, max_stress=0.0, flag=0.0,
-                     tex=None, ana=False):
+                     tex=None, ana=False, max_mem=None):
         """Calculate hessian to yield surface. Supports so far only option (ii) hessian to ML yield function (default if ML yield
         function exists - ML_yf=True; can be overwritten if ana=True)
 
@@ -878,6 +1400,9 @@ class Material(object):
             Indicator if analytical solution should be used, rather than ML yield fct (optional, default: False)
         tex : (tdim, ) array
             Texture descriptor (optional, default: None)
+        max_mem : int
+            Memory budget in bytes for temporary arrays; stresses are processed in chunks
+            respecting this budget (optional, default: self.hess_mem)
 
         Returns
         -------
@@ -911,43 +1436,12 @@ class Material(object):
         elif self.ML_yf and not ana:
             # use hessian of SVC yield fct. in stress space
             # hessian of SVC kernel function w.r.t. feature vector
+            if self.sdim == 3:
+                raise NotImplementedError('calc_hessian: not  implemented for 3D stress')
             x = self.create_scaled_input(sig, epl, accumulated_strain, max_stress, flag, tex)
-
-            # Expand dimensions for broadcasting
-            # x: (N, 1, d), sv: (1, n_sv, d)
-            sv = self.svm_yf.support_vectors_
-            x = x[:, np.newaxis, :]
-            sv = sv[np.newaxis, :, :]
-            dc = self.svm_yf.dual_coef_[0, :]
-
-            # Calculate difference vectors of all pairs in full d-dim space
-            # Shape: (N, n_sv, d)
-            diff_vecs = sv - x
-
-            # Calculate squared distances
-            # Shape: (N, n_sv)
-            sq_dists = np.sum(diff_vecs ** 2, axis=2)
-
-            # Calculate RBF kernel values
-            # Shape: (N, n_sv)
-            K_vals = np.exp(-self.gam_yf * sq_dists)
-
-            # Weigh by dual coefficients
-            # Shape: (N, n_sv)
-            weighted_K = K_vals * dc[np.newaxis, :]  # maybe np.newaxis not needed
-
-            for i in range(self.sdim):
-                for j in range(self.sdim):
-                    if i == j:
-                        # Diagonal elements
-                        hessian[:, i, j] = np.sum(weighted_K * (4 * self.gam_yf ** 2 * diff_vecs[:, :, i] *
-                                                                diff_vecs[:, :, j] - 2 * self.gam_yf), axis=1)
-                    else:
-                        # Off-diagonal elements
-                        hessian[:, i, j] = np.sum(weighted_K * 4 * self.gam_yf ** 2 * diff_vecs[:, :, i] *
-                                                  diff_vecs[:, :, j], axis=1)
-                if self.sdim == 3:
-                    raise NotImplementedError('calc_hessian: not  implemented for 3D stress')
+            if max_mem is None:
+                max_mem = self.hess_mem
+            hessian = self.get_yf_backend().hessian(x, cols=np.arange(self.sdim), max_mem=max_mem)
 
             if self.std_scaler:
                 scale_factors = 1.0 / (np.ones(self.sdim) * self.scale_seq)  # shape: (sdim,)
@@ -971,7 +1465,7 @@ class Material(object):
 
         return hessian
 
-    def get_sflow(self, epl):
+    def get_sflow(self, epl, khard=None):
         """Calculate an estimate of the scalar flow stress (strength) of the material
         for a given plastic strain.
 
@@ -982,6 +1476,8 @@ class Material(object):
         ----------
         epl : float or (sdim,) array
             Current value of equiv. plastic strain (float) or plastic strain tensor
+        khard : float
+            Strain hardening rate (optional, default: self.khard)
             
         Yields
         ------
@@ -991,10 +1487,16 @@ class Material(object):
         # if self.msparam is None:
         if type(epl) in (float, np.float64):
             peeq = epl
+        elif np.shape(epl) in ((6,), (3,)):
+            # single plastic strain tensor, avoid array allocations of eps_eq
+            e = np.asarray(epl, dtype=float).tolist() + [0., 0., 0.]
+            peeq = np.sqrt((2. * (e[0] ** 2 + e[1] ** 2 + e[2] ** 2) + e[3] ** 2 + e[4] ** 2 + e[5] ** 2) / 3.)
         else:
             peeq = eps_eq(epl)
 
-        sflow = self.sy + peeq * self.khard
+        if khard is None:
+            khard = self.khard
+        sflow = self.sy + peeq * khard
         '''else:
             sm = np.sum(self.tx_cur)
             if sm < 1.e-3:
@@ -1010,6 +1512,35 @@ class Material(object):
                 max_stress=0.0, flag=0.0, tex=None, ):
         """Calculate plastic strain increment relaxing stress back to yield locus;
         Reference: M.A. Crisfield, Non-linear finite element analysis of solids and structures,
+        Chapter 6, Eqs. (6.4), (6.8) and (6.17). Wrapper of ``eval_epl_dot`` that stores the
+        diagnostics in self.msg and the strain hardening rate in self.khard.
+
+        Parameters
+        ----------
+        sig : (6,)-array
+            Voigt stress tensor
+        epl : (6,)-array
+            Voigt plastic strain tensor
+        Cel : (6,6) array
+            Elastic stiffness tensor
+        deps: Voigt tensor
+            Strain increment from predictor step
+
+        Returns
+        -------
+        pdot : Voigt tensor
+            Plastic strain increment
+        """
+        pdot, info = self.eval_epl_dot(sig, epl, Cel, deps, accumulated_strain=accumulated_strain,
+                                       max_stress=max_stress, flag=flag, tex=tex)
+        self._store_info(info)
+        return pdot
+
+    def eval_epl_dot(self, sig, epl, Cel, deps, accumulated_strain=0.0,
+                     max_stress=0.0, flag=0.0, tex=None, khard=None):
+        """Calculate plastic strain increment relaxing stress back to yield locus without
+        modifying the state of the material object;
+        Reference: M.A. Crisfield, Non-linear finite element analysis of solids and structures,
         Chapter 6, Eqs. (6.4), (6.8) and (6.17)
 
         Parameters
@@ -1022,41 +1553,65 @@ class Material(object):
             Elastic stiffness tensor
         deps: Voigt tensor
             Strain increment from predictor step
+        khard : float
+            Strain hardening rate (optional, default: self.khard)
 
         Returns
         -------
         pdot : Voigt tensor
             Plastic strain increment
+        info : dictionary
+            Diagnostics with labels of evaluated functions and strain hardening rate 'khard'
         """
-        yfun = self.calc_yf(sig + Cel @ deps, epl=epl)
-        # for DEBUGGING
-        '''yf0  = self.calc_yf(sig, peeq=peeq)
-        if yf0<-ptol and yfun>ptol and peeq<1.e-5:
-            if self.ML_yf:
-                ds = Cel@deps
-                yfun = self.ML_full_yf(sig+ds)
-            print('*** Warning in epl_dot: Step crosses yield surface')
-            print('sig, epl, deps, yfun, yf0, peeq,caller', sig, epl, deps, yfun, yf0, peeq, sys._getframe().f_back.f_code.co_name)
-            yfun=0. # catch error that can be produced for anisotropic materials'''
+        if khard is None:
+            khard = self.khard
+        yfun, info = self.eval_yf(sig + Cel @ deps, epl=epl, khard=khard)
+        info['khard'] = khard
         if (yfun <= yf_tolerance):
             pdot = np.zeros(6)
-            # print('WARNING: Test for small stresses will be depracted in next version')
         else:
             if self.sdim == 3:
                 a = np.zeros(6)
-                a[0:3] = self.calc_fgrad(sig_princ(sig)[0], epl=epl[0:3],
-                                         accumulated_strain=accumulated_strain, max_stress=max_stress, tex=tex)
+                a[0:3], hh = self.eval_fgrad(sig_princ(sig)[0], epl=epl[0:3],
+                                             accumulated_strain=accumulated_strain, max_stress=max_stress,
+                                             tex=tex, khard=khard)
             else:
-                a = self.calc_fgrad(sig, epl=epl, accumulated_strain=accumulated_strain,
-                                    max_stress=max_stress, flag=flag, tex=tex)
-            hh = a.T @ Cel @ a + self.khard
+                a, hh = self.eval_fgrad(sig, epl=epl, accumulated_strain=accumulated_strain,
+                                        max_stress=max_stress, flag=flag, tex=tex, khard=khard)
+            info.update(hh)
+            hh = a.T @ Cel @ a + info['khard']
             lam_dot = a.T @ Cel @ deps / hh  # deps must not contain elastic strain components
             pdot = lam_dot * a
-        return pdot
+        return pdot, info
 
     def C_tan(self, sig, Cel, epl=None):
         """Calculate tangent stiffness relaxing stress back to yield locus;
         Reference: M.A. Crisfield, Non-linear finite element analysis of solids and structures,
+        Chapter 6, Eqs. (6.9) and (6.18). Wrapper of ``eval_C_tan`` that stores the
+        diagnostics in self.msg and the strain hardening rate in self.khard.
+
+        Parameters
+        ----------
+        sig : Voigt tensor
+            Stress
+        Cel : (6,6) array
+            Elastic stiffness tensor used for predictor step
+        epl : (sdim,) array
+            Equivalent plastic strain tensor (optional, default: 0.)
+
+        Returns
+        -------
+        Ct : (6,6) array
+            Tangent stiffness tensor
+        """
+        Ct, info = self.eval_C_tan(sig, Cel, epl=epl)
+        self._store_info(info)
+        return Ct
+
+    def eval_C_tan(self, sig, Cel, epl=None, khard=None):
+        """Calculate tangent stiffness relaxing stress back to yield locus without
+        modifying the state of the material object;
+        Reference: M.A. Crisfield, Non-linear finite element analysis of solids and structures,
         Chapter 6, Eqs. (6.9) and (6.18)
 
         Parameters
@@ -1067,30 +1622,43 @@ class Material(object):
             Elastic stiffness tensor used for predictor step
         epl : (sdim,) array
             Equivalent plastic strain tensor (optional, default: 0.)
+        khard : float
+            Strain hardening rate (optional, default: self.khard)
 
         Returns
         -------
         Ct : (6,6) array
             Tangent stiffness tensor
+        info : dictionary
+            Diagnostics with label 'gradient' and strain hardening rate 'khard'
         """
         if epl is None:
             epl = np.zeros(self.sdim)
         if self.sdim == 3:
             a = np.zeros(6)
-            a[0:3] = self.calc_fgrad(sig_princ(sig)[0], epl=epl[0:3])
+            a[0:3], info = self.eval_fgrad(sig_princ(sig)[0], epl=epl[0:3], khard=khard)
         else:
-            a = self.calc_fgrad(sig, epl=epl)
-        hh = a.T @ Cel @ a + self.khard
+            a, info = self.eval_fgrad(sig, epl=epl, khard=khard)
+        hh = a.T @ Cel @ a + info['khard']
         ca = Cel @ a
         Ct = Cel - np.kron(ca, ca).reshape(6, 6) / hh
-        return Ct
+        return Ct, info
 
     # ==============================================================
     # subroutines for ML flow rule, training
     # ==============================================================
+    @staticmethod
+    def _check_backend(backend, gridsearch):
+        """Check if training method of ML yield function is supported"""
+        if backend not in ('svc', 'nystroem'):
+            raise ValueError('Unknown backend "{}" for training of ML yield function, must be "svc" or "nystroem".'
+                             .format(backend))
+        if gridsearch and backend != 'svc':
+            raise NotImplementedError('Grid search of hyperparameters is only implemented for backend "svc".')
+
     def setup_yf_SVM(self, x, y_train, x_test=None, y_test=None, C=15., gamma=2.5,
                      fs=0.1, plot=False, cyl=False, gridsearch=False, cvals=None,
-                     gvals=None, verbose=3):
+                     gvals=None, verbose=3, backend='svc', ncomp=1000):
         """
         Generic function call to setup and train the SVM yield function, for details see the specific functions
         setup_yf_SVM_6D and setup_yf_SVM_3D.
@@ -1098,16 +1666,122 @@ class Material(object):
         if self.sdim == 3:
             train_sc, test_sc = self.setup_yf_SVM_3D(x, y_train, x_test=x_test, y_test=y_test,
                                                      C=C, gamma=gamma, fs=fs, plot=plot, cyl=cyl,
-                                                     gridsearch=gridsearch, cvals=cvals, gvals=gvals)
+                                                     gridsearch=gridsearch, cvals=cvals, gvals=gvals,
+                                                     backend=backend, ncomp=ncomp)
         else:
             train_sc, test_sc = self.setup_yf_SVM_6D(x, y_train, x_test=x_test, y_test=y_test,
                                                      C=C, gamma=gamma, plot=plot, verbose=verbose,
                                                      gridsearch=gridsearch, cvals=cvals, gvals=gvals,
-                                                     pca_dim=10, metric='acc')
+                                                     pca_dim=10, metric='acc', backend=backend, ncomp=ncomp)
         return train_sc, test_sc
 
+    def gridsearch_SVC(self, X, y, cvals, gvals, verbose=3, n_splits=5, n_jobs=-1):
+        """Optimize hyperparameters C and gamma of the SVC yield function by a grid search with
+        stratified k-fold cross validation, scored by accuracy as in ``GridSearchCV``. If the kernel
+        matrices fit into the memory budget self.gs_mem, the matrix of squared distances between
+        all training points is calculated only once, the kernel matrix for each gamma is obtained
+        from it by elementwise exponentiation, and all values of C are trained on the same
+        precomputed kernel matrices of each fold. Otherwise, ``GridSearchCV`` is used.
+        The hyperparameters are stored in self.C_yf and self.gam_yf, the results of the grid
+        search in self.grid, which provides the attributes best_params_, best_score_, best_index_,
+        best_estimator_, n_splits_ and cv_results_ of ``GridSearchCV`` in both cases.
+
+        Parameters
+        ----------
+        X : (N, Ndof) array
+            Scaled training features
+        y : (N,) array
+            Training labels
+        cvals : list
+            Values for SVC parameter C
+        gvals : list
+            Values for SVC parameter gamma
+        verbose : int
+            Verbosity of output (optional, default: 3)
+        n_splits : int
+            Number of folds for cross validation (optional, default: 5)
+        n_jobs : int
+            Number of parallel threads for training on folds (optional, default: -1, i.e. all cores)
+
+        Returns
+        -------
+        svc : object of class ``sklearn.svm.SVC``
+            SVC with RBF kernel trained on all training data with best hyperparameters
+        """
+        from joblib import Parallel, delayed
+        from sklearn import svm
+        from sklearn.model_selection import GridSearchCV
+        from sklearn.model_selection import StratifiedKFold
+        from sklearn.utils import Bunch
+        from scipy.stats import rankdata
+
+        N = len(X)
+        nbytes = 8 * N * N  # size of one kernel matrix of all training points
+        if 2.6 * nbytes > self.gs_mem:
+            # kernel matrices too large, use standard grid search; estimator refitted
+            # by GridSearchCV is used directly
+            print('Kernel matrices exceed memory budget, using GridSearchCV')
+            param_grid = {'C': cvals, 'gamma': gvals}
+            self.grid = GridSearchCV(svm.SVC(), param_grid, refit=True, verbose=verbose, n_jobs=n_jobs)
+            self.grid.fit(X, y)
+            print('The best hyperparameters are:', self.grid.best_params_)
+            self.gam_yf = self.grid.best_params_["gamma"]
+            self.C_yf = self.grid.best_params_["C"]
+            return self.grid.best_estimator_
+
+        # limit number of parallel folds such that sub-matrices of folds respect memory budget
+        if n_jobs < 0:
+            n_jobs = os.cpu_count()
+        n_jobs = int(max(1, min(n_jobs, n_splits, (self.gs_mem - 2 * nbytes) / (0.8 * nbytes))))
+        folds = list(StratifiedKFold(n_splits=n_splits).split(X, y))
+        # squared distances between all training points, ||x-x'||^2 = ||x||^2 + ||x'||^2 - 2 x.x'
+        sq = np.sum(X * X, axis=1)
+        D = X @ X.T
+        D *= -2.
+        D += sq[:, None]
+        D += sq[None, :]
+        np.maximum(D, 0., out=D)
+        K = np.empty_like(D)
+        score = np.zeros((len(cvals), len(gvals), n_splits))
+        start = time.time()
+        for j, gamma in enumerate(gvals):
+            np.multiply(D, -gamma, out=K)
+            np.exp(K, out=K)
+            res = Parallel(n_jobs=n_jobs, prefer='threads')(
+                delayed(_cv_fold_precomputed)(K, y, itr, ite, cvals) for itr, ite in folds)
+            score[:, j, :] = np.array(res).T
+            if verbose > 0:
+                for i, C in enumerate(cvals):
+                    print('[CV] C={}, gamma={}: score={:.3f}'.format(C, gamma, np.mean(score[i, j, :])))
+        del D, K
+        # parameters ordered as in sklearn.model_selection.ParameterGrid,
+        # first occurrence of best score is selected as in GridSearchCV
+        score = score.reshape(-1, n_splits)
+        mean_score = np.mean(score, axis=1)
+        params = [{'C': C, 'gamma': gamma} for C in cvals for gamma in gvals]
+        ib = int(np.argmax(mean_score))
+        cv_results = {'param_C': np.ma.MaskedArray([p['C'] for p in params], mask=False),
+                      'param_gamma': np.ma.MaskedArray([p['gamma'] for p in params], mask=False),
+                      'params': params}
+        for k in range(n_splits):
+            cv_results['split{}_test_score'.format(k)] = score[:, k]
+        cv_results['mean_test_score'] = mean_score
+        cv_results['std_test_score'] = np.std(score, axis=1)
+        cv_results['rank_test_score'] = rankdata(-mean_score, method='min').astype(np.int32)
+        self.gam_yf = params[ib]["gamma"]
+        self.C_yf = params[ib]["C"]
+        svc = svm.SVC(kernel='rbf', C=self.C_yf, gamma=self.gam_yf)
+        svc.fit(X, y)
+        self.grid = Bunch(best_params_=params[ib], best_score_=mean_score[ib], best_index_=ib,
+                          best_estimator_=svc, n_splits_=n_splits, cv_results_=cv_results)
+        print('The best hyperparameters are:', self.grid.best_params_)
+        if verbose > 0:
+            print('Grid search time: {:.1f} s'.format(time.time() - start))
+        return svc
+
     def setup_yf_SVM_6D(self, x, y_train, x_test=None, y_test=None, C=10., gamma=1., plot=False,
-                        gridsearch=False, cvals=None, gvals=None, verbose=3, pca_dim=10, metric='acc'):
+                        gridsearch=False, cvals=None, gvals=None, verbose=3, pca_dim=10, metric='acc',
+                        backend='svc', ncomp=1000):
 
         """Initialize and train Support Vector Classifier (SVC) as machine learning (ML) yield function. Training and 
         test data (features) are accepted as either 3D principal stresses or cylindrical stresses, but principal 
@@ -1141,6 +1815,12 @@ class Material(object):
             Values for SVC parameter gamma in gridsearch (optional, default: None)
         verbose : int
             Value for verbosity of grid search algorithm (optional, default: 3)
+        backend : str
+            Training method of ML yield function: 'svc' for kernel SVC or 'nystroem' for linear SVC on
+            Nystroem approximation of rbf kernel, which scales linearly with the number of training data
+            (optional, default: 'svc')
+        ncomp : int
+            Number of Nystroem components for backend='nystroem' (optional, default: 1000)
 
         Returns
         -------
@@ -1149,6 +1829,13 @@ class Material(object):
         test_sc  : float
             test score
         """
+        from sklearn import svm
+        from sklearn.decomposition import PCA
+        from sklearn.metrics import matthews_corrcoef
+        from sklearn.preprocessing import StandardScaler
+        import matplotlib.pyplot as plt
+
+        self._check_backend(backend, gridsearch)
         # calculate proper scaling factor and scale data in input vector into range [-1,+1] for all columns
         print('Using {} full Voigt yield stresses for training.'.format(x.shape))
         if self.dev_only:
@@ -1219,17 +1906,10 @@ class Material(object):
                 gvals = [0.5, 1, 1.5, 2, 2.5, 3]
                 if gamma not in gvals:
                     gvals.append(gamma)
-            param_grid = {'C': cvals, 'gamma': gvals}
-            self.grid = GridSearchCV(svm.SVC(), param_grid, refit=True, verbose=verbose, n_jobs=-1)
-            self.grid.fit(X_train, y_train)
-            print('The best hyperparameters are:', self.grid.best_params_)
-            self.gam_yf = self.grid.best_params_["gamma"]
-            self.C_yf = self.grid.best_params_["C"]
-            self.svm_yf = svm.SVC(kernel='rbf', C=self.C_yf, gamma=self.gam_yf)
-            start = time.time()
-            self.svm_yf.fit(X_train, y_train)
-            stop = time.time()
+            self.svm_yf = self.gridsearch_SVC(X_train, y_train, cvals, gvals, verbose=verbose)
             print('Original values: C={}, gamma={}'.format(C, gamma))
+        elif backend == 'nystroem':
+            self.svm_yf = RBFExpansion.from_nystroem(X_train, y_train, C, gamma, ncomp=ncomp)
         else:
             self.svm_yf = svm.SVC(kernel='rbf', C=C, gamma=gamma)
             # print(f'Controlprint. X_train: {X_train.shape}, y_train: {y_train.shape}')  # JS: commented out gridsearch
@@ -1268,7 +1948,7 @@ class Material(object):
                 feat = np.c_[yy.ravel(), xx.ravel(), np.ones(2500) * self.scale_wh]
             else:
                 feat = np.c_[yy.ravel(), xx.ravel(), np.ones(2500) * self.scale_wh, np.ones(2500) * self.scale_text]
-            Z = self.svm_yf.decision_function(feat)
+            Z = self.get_yf_backend().decision(feat)
             self.plot_data(Z, ax, xx, yy, c='black')
             ax.scatter(X_train[:, 1], X_train[:, 0], s=10, c=y_train, cmap=plt.cm.Paired)
             ax.set_title('extended SVM yield function in training')
@@ -1279,7 +1959,8 @@ class Material(object):
 
     def setup_yf_SVM_3D(self, x, y_train, x_test=None, y_test=None, C=10.,
                         gamma=1., fs=0.1, plot=False, cyl=False,
-                        gridsearch=False, cvals=None, gvals=None, pca_dim=10):
+                        gridsearch=False, cvals=None, gvals=None, pca_dim=10,
+                        backend='svc', ncomp=1000):
         """Initialize and train Support Vector Classifier (SVC) as machine
         learning (ML) yield function. Training and test data (features) are
         accepted as either 3D principal stresses or cylindrical stresses, but
@@ -1321,6 +2002,10 @@ class Material(object):
             Values for SVC training parameter C in gridsearch (optional, default: None)
         gvals: array
             Values for SVC parameter gamma in gridsearch (optional, default: None)
+        backend : str
+            Training method of ML yield function, see ``setup_yf_SVM_6D`` (optional, default: 'svc')
+        ncomp : int
+            Number of Nystroem components for backend='nystroem' (optional, default: 1000)
 
         Returns
         -------
@@ -1329,6 +2014,10 @@ class Material(object):
         test_sc  : float
             test score
         """
+        from sklearn import svm
+        import matplotlib.pyplot as plt
+
+        self._check_backend(backend, gridsearch)
         # transformation of princ. stress into cyl. coordinates
         self.gam_yf = gamma
         self.C_yf = C
@@ -1399,15 +2088,10 @@ class Material(object):
                 gvals = [1, 1.5, 2, 2.5, 3]
                 if not gamma in gvals:
                     gvals.append(gamma)
-            param_grid = {'C': cvals, 'gamma': gvals}
-            grid = GridSearchCV(svm.SVC(), param_grid, refit=True, verbose=3, n_jobs=-1)
-            grid.fit(X_train, y_train)
-            print('The best hyperparameters are:', grid.best_params_)
-            self.gam_yf = grid.best_params_["gamma"]
-            self.C_yf = grid.best_params_["C"]
-            self.svm_yf = svm.SVC(kernel='rbf', C=self.C_yf, gamma=self.gam_yf)
-            self.svm_yf.fit(X_train, y_train)
+            self.svm_yf = self.gridsearch_SVC(X_train, y_train, cvals, gvals)
             print('Original values: C={}, gamma={}'.format(C, gamma))
+        elif backend == 'nystroem':
+            self.svm_yf = RBFExpansion.from_nystroem(X_train, y_train, C, gamma, ncomp=ncomp)
         else:
             self.svm_yf = svm.SVC(kernel='rbf', C=C, gamma=gamma)
             self.svm_yf.fit(X_train, y_train)
@@ -1430,7 +2114,7 @@ class Material(object):
                 feat = np.c_[yy.ravel(), xx.ravel(), np.ones(2500) * self.scale_wh]
             else:
                 feat = np.c_[yy.ravel(), xx.ravel(), np.ones(2500) * self.scale_wh, np.ones(2500) * self.scale_text]
-            Z = self.svm_yf.decision_function(feat)
+            Z = self.get_yf_backend().decision(feat)
             self.plot_data(Z, ax, xx, yy, c='black')
             ax.scatter(X_train[:, 1], X_train[:, 0], s=10, c=y_train, cmap=plt.cm.Paired)
             ax.set_title('extended SVM yield function in training')
@@ -1443,7 +2127,7 @@ class Material(object):
                   mat_ref=None, sdata=None, plot=False, fontsize=16,
                   gridsearch=False, cvals=None, gvals=None, Fe=0.1, Ce=0.99, scaler=None, pca=None,
                   train_index=None, test_index=None, verbose=1, metric='acc', pca_dim=10,
-                  reversal=None):
+                  reversal=None, n_jobs=-1, early_stop=None, backend='svc', ncomp=1000):
         """Train SVC for all yield functions of the microstructures provided
         in msparam and for flow stresses to capture work hardening. In first
         step, the training data for each set is generated by creating stresses
@@ -1515,7 +2199,26 @@ class Material(object):
             Fitted standard scaler on training data -> sets each component of feature vector to zero mean and unit var.
         pca_dim : int
             Number of principal components used for texture descriptor. Default=10.
+        n_jobs : int
+            Number of parallel processes for cross validation over textures in grid search
+            (optional, default: -1, i.e. all cores)
+        early_stop : float
+            Margin for early stopping of grid search over textures. Folds are evaluated in rounds,
+            after each round, hyperparameters with a mean test score below the best mean test score
+            minus this margin are discarded (optional, default: None, i.e. no early stopping)
+        backend : str
+            Training method of ML yield function: 'svc' for kernel SVC or 'nystroem' for linear SVC on
+            Nystroem approximation of rbf kernel, which scales linearly with the number of training data
+            (optional, default: 'svc')
+        ncomp : int
+            Number of Nystroem components for backend='nystroem' (optional, default: 1000)
         """
+        from joblib import Parallel, delayed
+        from sklearn.model_selection import KFold
+        from sklearn.model_selection import ParameterGrid
+        from sklearn.utils import Bunch
+        import matplotlib.pyplot as plt
+
         if reversal is not None:
             print('WARNING in "train_SVC": Parameter "reversal" is depracted and will be ignored.')
         # augment raw data and create result vector (yield function) for all
@@ -1530,65 +2233,90 @@ class Material(object):
                 if gamma not in gvals:
                     gvals.append(gamma)
             param_grid = {'C': cvals, 'gamma': gvals}
-            hp_grid = ParameterGrid(param_grid)
-            rng = np.random.default_rng(seed=42)
+            hp_grid = list(ParameterGrid(param_grid))
+            npair = len(hp_grid)
+            kf = KFold(n_splits=5, shuffle=True, random_state=42)
+            folds = list(kf.split(self.msparam))
+            nfold = len(folds)
+
+            # create data for all microstructures only once, data is shared read-only by all jobs
+            # (joblib memory-maps large arrays for worker processes)
+            data = [self._create_data_for_ms(Ce=Ce, Fe=Fe, Nseq=Nseq, extend=extend, idx_ms=i)[2:4]
+                    for i in range(len(self.msparam))]
+            offsets = np.cumsum([0] + [len(d[1]) for d in data])
+            xall = np.concatenate([d[0] for d in data], axis=0)
+            yall = np.concatenate([d[1] for d in data], axis=0)
+            del data
+            # slim copy of material, only scalar parameters of microstructures are needed for training
+            tmpl = copy.copy(self)
+            tmpl.msparam = [{key: ms[key] for key in ('sy_av', 'peeq_max', 'ms_type', 'tx_descriptor') if key in ms}
+                            for ms in self.msparam]
+            tmpl.svm_yf = None
+            tmpl.grid = None
+            tmpl.yr_cache = None
+
+            # evaluate folds in rounds if early stopping is requested, otherwise all jobs at once
+            train_sc = np.full((npair, nfold), np.nan)
+            test_sc = np.full((npair, nfold), np.nan)
+            active = list(range(npair))
+            rounds = [[i] for i in range(nfold)] if early_stop is not None else [list(range(nfold))]
+            with Parallel(n_jobs=n_jobs, verbose=10 if verbose > 1 else 0) as parallel:
+                for ifolds in rounds:
+                    jobs = [(ip, jf) for ip in active for jf in ifolds]
+                    res = parallel(delayed(_texture_cv_job)(tmpl, xall, yall, offsets, folds[jf][0], folds[jf][1],
+                                                            hp_grid[ip]['C'], hp_grid[ip]['gamma'], 0, metric,
+                                                            pca_dim, backend, ncomp) for ip, jf in jobs)
+                    for (ip, jf), (sc_tr, sc_te) in zip(jobs, res):
+                        train_sc[ip, jf] = sc_tr
+                        test_sc[ip, jf] = sc_te
+                    if early_stop is not None and ifolds[-1] < nfold - 1:
+                        mean_sc = np.nanmean(test_sc[active, :], axis=1)
+                        keep = mean_sc >= np.max(mean_sc) - early_stop
+                        if verbose and not np.all(keep):
+                            print(f"Early stopping after fold {ifolds[-1]} for hyperparameters: "
+                                  f"{[hp_grid[ip] for ip, k in zip(active, keep) if not k]}")
+                        active = [ip for ip, k in zip(active, keep) if k]
+
             results_dict = {}
-            best_cv_score = 0
+            best_cv_score = -np.inf
             C_cv = 0
             gamma_cv = 0
             idx_best = 0
-            for idx_pair, hp_pair in enumerate(list(hp_grid)):
-                if verbose:
-                    print(80 * "=")
-                    print(f"HP Run {idx_pair} / {len(list(hp_grid))}")
-                    print(80 * "-")
-                C = hp_pair['C']
-                gamma = hp_pair['gamma']
-                results_dict[f'hp-set_{idx_pair}'] = {'C': C, 'gamma': gamma}
-                train_sc_list = []
-                test_sc_list = []
-                random.seed(42)
-                kf = KFold(n_splits=5, shuffle=True, random_state=42)
-                for idx_fold, (train_index, test_index) in enumerate(kf.split(self.msparam)):
-                    if verbose:
-                        print(f"    starting fold {idx_fold} ...")
-                    results_dict[f'fold_{idx_fold}'] = {}
-                    # TODO: JS: Could be parallelized with joblib
-                    train_sc, test_sc = self.train_SVC(C=C, gamma=gamma, Nlc=Nlc, Nseq=Nseq, extend=extend,
-                                                       mat_ref=mat_ref, sdata=sdata, plot=plot, fontsize=fontsize,
-                                                       gridsearch=False, Fe=Fe, Ce=Ce, scaler=scaler, pca=pca,
-                                                       train_index=train_index, test_index=test_index, verbose=verbose,
-                                                       metric=metric, pca_dim=pca_dim)
-                    train_sc_list.append(train_sc)
-                    test_sc_list.append(test_sc)
-                results_dict[f'hp-set_{idx_pair}'][f'train_{metric}'] = train_sc_list
-                results_dict[f'hp-set_{idx_pair}'][f'test_{metric}'] = test_sc_list
-                cv_score = np.mean(test_sc_list)
-
+            for idx_pair, hp_pair in enumerate(hp_grid):
+                done = np.isfinite(test_sc[idx_pair])
+                results_dict[f'hp-set_{idx_pair}'] = {'C': hp_pair['C'], 'gamma': hp_pair['gamma'],
+                                                      f'train_{metric}': train_sc[idx_pair, done].tolist(),
+                                                      f'test_{metric}': test_sc[idx_pair, done].tolist()}
                 if verbose:
-                    print(f"    [CV{idx_pair}/{len(list(hp_grid))}]: train_{metric}={train_sc_list}")
-                    print(f"    [CV{idx_pair}/{len(list(hp_grid))}]: test_{metric}={test_sc_list}")
-                    print(80 * "-")
-
+                    print(f"    [CV{idx_pair}/{npair}] C={hp_pair['C']}, gamma={hp_pair['gamma']}: "
+                          f"train_{metric}={train_sc[idx_pair, done].tolist()}")
+                    print(f"    [CV{idx_pair}/{npair}] C={hp_pair['C']}, gamma={hp_pair['gamma']}: "
+                          f"test_{metric}={test_sc[idx_pair, done].tolist()}")
+                if not np.all(done):
+                    continue  # stopped early
+                cv_score = np.mean(test_sc[idx_pair])
                 if cv_score > best_cv_score:
                     best_cv_score = cv_score
-                    C_cv = C
-                    gamma_cv = gamma
+                    C_cv = hp_pair['C']
+                    gamma_cv = hp_pair['gamma']
                     idx_best = idx_pair
+            self.grid = Bunch(best_params_={'C': C_cv, 'gamma': gamma_cv}, best_score_=best_cv_score,
+                              best_index_=idx_best, cv_results_=results_dict)
 
             # JS : Retrain on full data set with best CV coefficients
-            if C == 0 or gamma == 0:
+            if C_cv == 0 or gamma_cv == 0:
                 warnings.warn(f"CV couldn't find better values for C and gamma. Best mean {metric} across the test"
                               f"folds is {best_cv_score}")
             train_sc, test_sc = self.train_SVC(C=C_cv, gamma=gamma_cv, Nlc=Nlc, Nseq=Nseq, extend=extend,
                                                mat_ref=mat_ref, sdata=sdata, plot=plot, fontsize=fontsize,
                                                gridsearch=False, Fe=Fe, Ce=Ce, scaler=scaler, pca=pca,
-                                               verbose=verbose, metric=metric, pca_dim=pca_dim)
+                                               verbose=verbose, metric=metric, pca_dim=pca_dim,
+                                               backend=backend, ncomp=ncomp)
 
             print(80 * "+")
             print(f"Grid Search is finished :) \n Best HP: C={C_cv}, gamma={gamma_cv}")
             print(f" Training {metric}: {results_dict[f'hp-set_{idx_best}'][f'train_{metric}']}")
-            print(f"     Test {metric}: {results_dict[f'hp-set_{idx_pair}'][f'test_{metric}']}")
+            print(f"     Test {metric}: {results_dict[f'hp-set_{idx_best}'][f'test_{metric}']}")
             print(80 * "+")
             return train_sc, test_sc  # JS: This is only returned after gridsearch finished over the texture sets
 
@@ -1658,14 +2386,16 @@ class Material(object):
             train_sc, test_sc = \
                 self.setup_yf_SVM_3D(xt, yt, C=C, gamma=gamma, fs=0.3,
                                      plot=False, gridsearch=gridsearch,
-                                     cvals=cvals, gvals=gvals)
+                                     cvals=cvals, gvals=gvals,
+                                     backend=backend, ncomp=ncomp)
         else:
             train_sc, test_sc = self.setup_yf_SVM_6D(xt, yt, x_test=xtest, y_test=ytest,
                                                      C=C, gamma=gamma,
                                                      gridsearch=gridsearch,
                                                      cvals=cvals, gvals=gvals,
                                                      verbose=verbose,
-                                                     metric=metric, pca_dim=pca_dim)
+                                                     metric=metric, pca_dim=pca_dim,
+                                                     backend=backend, ncomp=ncomp)
 
         print(self.svm_yf)
         if not gridsearch:
@@ -1714,7 +2444,7 @@ class Material(object):
                                        label='reference yield locus')
                     # ML yield fct: find norm of princ. stess vector lying on yield surface
                     snorm = sig_cyl2princ(np.array([sflow * np.ones(36) * np.sqrt(1.5), theta]).T)
-                    x1 = fsolve(self.find_yloc, np.ones(36), args=(snorm, peeq), xtol=1.e-5)
+                    x1 = self.find_yloc_batch(snorm, epl=peeq, x0=1.)
                     sig = snorm * x1[:, None]
                     s_yld = sig_eq_j2(sig)
                     plt.gca().plot(theta, s_yld, '-k', label='ML yield locus', linewidth=2)
@@ -1731,9 +2461,147 @@ class Material(object):
             plt.show()
         return train_sc, test_sc
 
+    def compress_svc(self, tol=1.e-2, min_accuracy=0.99, x=None, ncenters=None, verbose=False,
+                     random_state=0):
+        """Replace the trained SVC of the ML yield function by a reduced-set approximation with fewer
+        centers, which accelerates the evaluation of the yield function, its gradient and Hessian, and
+        reduces the size of the parameters exported for the UMAT accordingly. Starting from 1/32 of the
+        number of support vectors, the number of centers is doubled until the fidelity targets are met.
+
+        The fidelity is checked on points of the yield locus of the SVC, which are obtained by projecting
+        the support vectors with randomly rotated stress features on the yield locus, and on points that
+        are offset from the yield locus along its normal. Two independent sets of such points are
+        generated, one is used to fit the weights of the reduced-set approximation (see
+        ``RBFExpansion.from_svc``), the other one to check its fidelity by (i) the deviation of the
+        yield locus, estimated by the ratio of the decision function and the norm of its gradient w.r.t.
+        the stress features, and (ii) the accuracy of the classification w.r.t. the original SVC,
+        evaluated with ``training_score``. The deviation of the yield locus is given in units of the
+        scaled stress features, i.e. relative to ``scale_seq``, and is evaluated as the 99th percentile
+        over all points to be robust against isolated outliers. If the targets cannot be met with fewer
+        centers than support vectors, the SVC is kept and a warning is issued.
+
+        Parameters
+        ----------
+        tol : float
+            Maximum deviation of yield locus in units of scaled stress features (optional, default: 1.e-2)
+        min_accuracy : float
+            Minimum accuracy of classification w.r.t. original SVC (optional, default: 0.99)
+        x : (N, Ndof) array
+            Additional scaled feature vectors, e.g. training data, at which the reduced-set approximation
+            is fitted and the classification accuracy is checked (optional, default: None)
+        ncenters : int
+            Fixed number of centers, fidelity targets are then only evaluated (optional, default: None)
+        verbose : Boolean
+            Print fidelity for each number of centers (optional, default: False)
+        random_state : int
+            Seed for random directions and k-means clustering (optional, default: 0)
+
+        Returns
+        -------
+        model : object
+            Original model of ML yield function, which is replaced in self.svm_yf
+
+        Yields
+        ------
+        self.svm_yf : object of class ``RBFExpansion``
+            Reduced-set approximation of ML yield function
+        self.compress_info : dictionary
+            Fidelity of reduced-set approximation with the labels 'nsv', 'ncenters', 'locus_dev',
+            'locus_dev_max', 'accuracy' and 'mcc'
+        """
+        if not self.ML_yf or self.svm_yf is None:
+            raise ValueError('compress_svc: No ML yield function defined.')
+        model = self.svm_yf
+        backend = self.get_yf_backend()
+        sv, dc, rho, gamma = backend.rbf_params()
+        nsv = len(sv)
+        ist = np.arange(2) if self.sdim == 3 else np.arange(6)  # indices of stress features
+        rng = np.random.default_rng(random_state)
+        offsets = [-0.3, -0.1, -0.03, 0.03, 0.1, 0.3]
+
+        def locus_samples(nrep):
+            # rotate stress features of support vectors randomly and project them on yield locus
+            xs = np.tile(sv, (nrep, 1))
+            if self.sdim == 3:
+                xs[:, 1] = rng.uniform(-1., 1., len(xs))  # polar angle
+            else:
+                su = rng.normal(size=(len(xs), 6))
+                if self.dev_only and not self.txdat:
+                    su[:, 0:3] -= np.mean(su[:, 0:3], axis=1)[:, None]
+                su *= (np.linalg.norm(xs[:, 0:6], axis=1) / np.linalg.norm(su, axis=1))[:, None]
+                xs[:, 0:6] = su
+            xl, nl = project_on_locus(backend, xs, gamma, ist, max_mem=self.hess_mem)
+            xo = []
+            for dx in offsets:
+                hh = xl.copy()
+                hh[:, ist] += dx * nl
+                xo.append(hh)
+            return xl, np.vstack(xo)
+
+        xl_fit, xo_fit = locus_samples(2)
+        xl_chk, xo_chk = locus_samples(2)
+        xfit = np.vstack((xl_fit, xo_fit)) if x is None else np.vstack((xl_fit, xo_fit, x))
+        xchk = xo_chk if x is None else np.vstack((xo_chk, x))
+        fchk = backend.decision(xchk)
+
+        if ncenters is None:
+            nc_list = []
+            nc = max(8, int(nsv / 32))
+            while nc < nsv:
+                nc_list.append(nc)
+                nc *= 2
+        else:
+            nc_list = [ncenters]
+        rbf = None
+        info = None
+        for nc in nc_list:
+            rbf = RBFExpansion.from_svc(backend, nc, x=xfit, gamma=gamma, random_state=random_state)
+            dev = np.abs(rbf.decision(xl_chk)) / \
+                np.maximum(np.linalg.norm(rbf.gradient(xl_chk, cols=ist), axis=1), 1.e-12)
+            fr = rbf.decision(xchk)
+            mae, precision, accuracy, recall, f1, mcc = training_score(fchk, fr, verbose=False)
+            info = {'nsv': nsv, 'ncenters': nc, 'locus_dev': np.percentile(dev, 99),
+                    'locus_dev_max': np.max(dev), 'accuracy': accuracy, 'mcc': mcc}
+            if verbose:
+                print('compress_svc: {0} centers, deviation of yield locus: {1:.3e}, accuracy: {2:.4f}'
+                      .format(nc, info['locus_dev'], accuracy))
+            if info['locus_dev'] <= tol and accuracy >= min_accuracy:
+                break
+        else:
+            if ncenters is None:
+                warnings.warn('compress_svc: Fidelity targets cannot be met with less than {0} centers, '
+                              'ML yield function is not compressed.'.format(nsv))
+                return model
+            warnings.warn('compress_svc: Fidelity targets are not met with {0} centers.'.format(ncenters))
+        self.svm_yf = rbf
+        self.compress_info = info
+        return model
+
+    def setup_data_cache(self, max_mem=2 ** 27, spill_dir=None):
+        """Define cache for the training data generated for each microstructure in ``_create_data_for_ms``.
+        Data is identified by the index of the microstructure, the parameters of data generation and a
+        fingerprint of the raw data, see class ``TrainingDataCache``. A cache with default parameters is
+        created automatically; use ``max_mem=0`` without ``spill_dir`` to disable caching.
+
+        Parameters
+        ----------
+        max_mem : int
+            Memory budget in bytes for cached training data (optional, default: 128 MB)
+        spill_dir : str
+            Directory into which training data exceeding the memory budget is written (optional, default: None)
+
+        Returns
+        -------
+        td_cache : object of class ``TrainingDataCache``
+            Cache for training data
+        """
+        self.td_cache = TrainingDataCache(max_mem=max_mem, spill_dir=spill_dir)
+        return self.td_cache
+
     def _create_data_for_ms(self, Ce, Fe, Nseq, extend, idx_ms, reversal=None):
         """
-        Helper function to create dataset for one micro structure.
+        Helper function to create dataset for one micro structure. Results are memoized in self.td_cache,
+        see ``setup_data_cache``; the returned arrays are read-only.
         
         Parameters
         ----------
@@ -1765,6 +2633,17 @@ class Material(object):
         if reversal is not None:
             print('WARNING in "_create_data_for_ms": Parameter "reversal" is depracted and will be ignored.')
         ms_dict = self.msparam[idx_ms]
+        # look up data in cache, key contains all parameters and raw data the training data depends on
+        if self.td_cache is None:
+            self.setup_data_cache()
+        raw = [ms_dict.get(k) for k in ('Nlc', 'Ncyl', 'flow_stress', 'sig_ideal', 'plastic_strain',
+                                         'normalized_accumulated_strain', 'max_stress', 'texture')]
+        fp = TrainingDataCache.fingerprint(self.sdim, self.Ndof, self.dev_only, self.whdat, self.txdat,
+                                           getattr(self, 'ind_wh', None), getattr(self, 'ind_tx', None), *raw)
+        key = (idx_ms, Nseq, Fe, Ce, extend, fp)
+        res = self.td_cache.get(key)
+        if res is not None:
+            return res
         Nlc = ms_dict['Nlc']  # JS: This is the total number of keys per microstructure. Why we have Nlc and N0?
         if self.whdat:
             Ndinp = len(ms_dict['flow_stress'])
@@ -1791,9 +2670,9 @@ class Material(object):
         xt[:, 0:self.sdim] = sig_train
         if self.whdat:
             # Add DOF for work Plastic Strain
-            if 'normalized_accumulated_strain' in self.msparam[0].keys():
+            if 'normalized_accumulated_strain' in ms_dict.keys():
                 reversal = True
-                if 'max_stress' not in self.msparam[0].keys():
+                if 'max_stress' not in ms_dict.keys():
                     raise ValueError("Data contains field for 'normalized_accumulated_strain' "
                                      "but not for 'max_stress'. Cannot continue.")
                 if self.Ndof < 2 * self.sdim + 2:
@@ -1801,15 +2680,13 @@ class Material(object):
                                      "but not enough DOF are defined for work hardening parameters.")
             else:
                 reversal = False
-            for i in range(Ndinp):
-                for j in range(Nsdata):
-                    xt[i + j * Ndinp, self.ind_wh:self.ind_wh + self.sdim] = \
-                        self.msparam[0]['plastic_strain'][i, :]  # plastic strain from data is corrected for epc
-                    if reversal:
-                        xt[i + j * Ndinp, self.ind_wh + self.sdim] = \
-                            self.msparam[0]['normalized_accumulated_strain'][i]
-                        xt[i + j * Ndinp, self.ind_wh + self.sdim + 1] = \
-                            self.msparam[0]['max_stress'][i]
+            # row i + j*Ndinp of training data belongs to data point i of raw data
+            xt[:, self.ind_wh:self.ind_wh + self.sdim] = \
+                np.tile(ms_dict['plastic_strain'][0:Ndinp, :], (Nsdata, 1))  # plastic strain is corrected for epc
+            if reversal:
+                xt[:, self.ind_wh + self.sdim] = \
+                    np.tile(ms_dict['normalized_accumulated_strain'][0:Ndinp], Nsdata)
+                xt[:, self.ind_wh + self.sdim + 1] = np.tile(ms_dict['max_stress'][0:Ndinp], Nsdata)
         if self.txdat:
             # JS: Add DOF for Texture
             # print(f"Control Print: Nlc: {Nlc} - Ndinp: {Ndinp} - shape xt: {xt.shape} - idtx: {self.ind_tx}"
@@ -1817,7 +2694,9 @@ class Material(object):
             xt[:, self.ind_tx:] = ms_dict['texture']
         # print(
         #     '%i training data sets created, with %i load cases' % (Nt, Nlc))
-        return Nlc, N0, xt, yt
+        res = (Nlc, N0, xt, yt)
+        self.td_cache.put(key, res)
+        return res
 
     # just for having an easy way to get the score score from the data similar as we have the training data as Jan suggested. SHould be removed I guess later
     def test_data_generation(self, C=10, gamma=4, Nlc=36, Nseq=25, fs=0.3, extend=False,
@@ -2017,7 +2896,7 @@ class Material(object):
                 su = load_cases(n3, n6)
                 if self.dev_only:
                     su = sig_dev(su)
-            x1 = fsolve(mat_ref.find_yloc, np.ones(N) * mat_ref.sy, args=(su,), xtol=1.e-5)
+            x1 = mat_ref.find_yloc_batch(su)
             sdata = su * x1[:, None]  # yield stress tensors representing ground truth
         else:
             # read stress data as seeding points for generation of further training stresses in entire 
@@ -2068,6 +2947,9 @@ class Material(object):
         gamma : float
             Parameter for kernel of SVR (optional, default: 0.1)
         """
+        from sklearn import svm
+        from sklearn.preprocessing import StandardScaler
+
         if not self.whdat:
             raise ValueError('No strain hardening data available.')
         # define support vector regressor parameters
@@ -2166,7 +3048,7 @@ class Material(object):
 
         if not self.ML_yf:
             raise AttributeError('export_MLparam: No ML flow rule defined.')
-        if self.msparam is None:
+        if self.msparam is None and self.ms_ref is None:
             self.Nset = 1
             self.epc = 0.
             self.scale_wh = 1.
@@ -2182,7 +3064,7 @@ class Material(object):
         file = path + file
 
         # write parameters of trained SVC to file readable to Abaqus
-        dc = self.svm_yf.dual_coef_[0]  # dual coefficients
+        sv, dc, rho, gamma = self.get_yf_backend().rbf_params()  # support vectors, dual coefficients
         nsv = len(dc)  # number of support vectors
         nlin = int((nsv * (self.Ndof + 1) + 30) / 8) + 1
         Ndata = nlin * 8  # Number of data points to write
@@ -2192,8 +3074,8 @@ class Material(object):
         props[2] = self.C11
         props[3] = self.C12
         props[4] = self.C44
-        props[5] = self.svm_yf.intercept_[0]
-        props[6] = self.gam_yf
+        props[5] = rho
+        props[6] = gamma
         props[7] = self.epc
         props[8] = self.scale_seq
         props[9] = self.scale_wh
@@ -2213,7 +3095,7 @@ class Material(object):
         props[18:18 + self.Nset] = self.scale_text
         props[29:29 + nsv] = dc
         nl = (self.Ndof + 1) * nsv + 29  # last entry of support vectors
-        props[29 + nsv:nl] = self.svm_yf.support_vectors_.flatten()
+        props[29 + nsv:nl] = sv.flatten()
         np.savetxt(file + '-svm.csv', props.reshape((nlin, 8)), delimiter=', ', newline='\n')
 
         # parameters for metadata
@@ -2225,7 +3107,7 @@ class Material(object):
         if param is None:
             param = []
         descr.extend(['Ndata', 'gamma', 'C'])
-        param.extend([Ndata, self.gam_yf, self.C_yf])
+        param.extend([Ndata, gamma, self.C_yf])
 
         # Create metadata
         meta = {
@@ -2272,7 +3154,7 @@ class Material(object):
         with open(file + '-svm_meta.json', 'w') as fp:
             dump(meta, fp, indent=2)
 
-    def pckl(self, name=None, path='../../materials/'):
+    def pckl(self, name=None, path='../../materials/', slim=False):
         """Write material into pickle file. Usefull for materials with trained machine 
         learning flow rules to avoid time-consuming re-training.
         
@@ -2284,6 +3166,12 @@ class Material(object):
             the filename will be the material name + '.pckl'. 
         path : string
             Path to location for pickles
+        slim : Boolean
+            Write only the parameters required for inference, i.e. the data sets of the
+            microstructures in self.msparam and the caches for training data and yield radii
+            are not pickled. Instead, references to the data sets are stored in self.ms_ref,
+            see ``data_reference``, and the data sets can be re-attached to the unpickled
+            material with ``reload_data`` (optional, default: False)
 
         Returns
         -------
@@ -2294,10 +3182,126 @@ class Material(object):
             name = 'mat_' + self.name + '.pkl'
         if path[-1] != '/':
             path += '/'
+        mat = self
+        if slim:
+            mat = copy.copy(self)
+            if self.msparam is not None:
+                mat.ms_ref = self.data_reference()
+                if self.txdat:
+                    mat.tx_descr = self.msparam[0]['tx_descriptor']
+            mat.msparam = None
+            mat.td_cache = None
+            mat.yr_cache = None  # cache holds reference to material
         with open(path + name, 'wb') as output:
-            pickle.dump(self, output, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(mat, output, pickle.HIGHEST_PROTOCOL)
         return
 
+    @staticmethod
+    def _ms_fingerprint(ms_dict):
+        """Calculate fingerprint of the raw data in a data set of a microstructure that enter
+        the definition and training of the material"""
+        raw = [ms_dict.get(k) for k in ('Nlc', 'Ncyl', 'flow_stress', 'sig_ideal', 'plastic_strain',
+                                         'normalized_accumulated_strain', 'max_stress', 'texture',
+                                         'elast_const', 'sy_av', 'peeq_max', 'epc')]
+        return TrainingDataCache.fingerprint(*raw)
+
+    def data_reference(self):
+        """Get references to the data sets of the microstructures from which the material has
+        been defined, see ``from_data``. Each reference contains the name of the material and
+        of the data set, the name and key of the texture, and a fingerprint of the raw data,
+        see class ``TrainingDataCache``.
+
+        Returns
+        -------
+        ms_ref : list of dictionaries
+            References to data sets of microstructures, None if material is not defined from data
+        """
+        if self.msparam is None:
+            return self.ms_ref
+        ms_ref = []
+        for ms in self.msparam:
+            ref = {key: ms.get(key) for key in ('Name', 'Dataset', 'tx_name', 'tx_key', 'ms_type')}
+            ref['fingerprint'] = self._ms_fingerprint(ms)
+            ms_ref.append(ref)
+        return ms_ref
+
+    def save_model(self, name=None, path='../../models/'):
+        """Write material with trained ML yield function into a binary model container,
+        see ``pylabfea.container``. The container holds the elastic constants, the scaling
+        parameters of the feature vector, the state of the standard scaler and PCA used in
+        `Material.create_scaled_input`, and the support vectors and dual coefficients of the
+        ML yield function in full precision. It can be read with `Material.load_model`, which
+        maps the large arrays into memory.
+
+        Parameters
+        ----------
+        name : string
+            File name of container (optional, default: 'mat_' + material name + '.plm')
+        path : string
+            Path to location for model containers (optional, default: '../../models/')
+
+        Returns
+        -------
+        None.
+        """
+        from importlib.metadata import version
+
+        if not self.ML_yf:
+            raise AttributeError('save_model: No ML flow rule defined.')
+        if name is None:
+            name = 'mat_' + self.name + '.plm'
+        if path[-1] != '/':
+            path += '/'
+        sv, dc, rho, gamma = self.get_yf_backend().rbf_params()
+        if self.txdat and self.msparam is not None:
+            self.tx_descr = self.msparam[0]['tx_descriptor']
+        mat = {
+            'name': self.name,
+            'sdim': self.sdim,
+            'Ndof': self.Ndof,
+            'ind_wh': self.ind_wh,
+            'ind_tx': self.ind_tx,
+            'tdim': self.tdim,
+            'whdat': bool(self.whdat),
+            'txdat': bool(self.txdat),
+            'dev_only': bool(self.dev_only),
+            'tx_descr': self.tx_descr,
+            'Nset': self.Nset,
+            'epc': self.epc,
+            'scale_seq': self.scale_seq,
+            'scale_wh': self.scale_wh,
+            'scale_text': None if self.scale_text is None else np.ravel(self.scale_text).tolist(),
+            'E': self.E,
+            'nu': self.nu,
+            'C_yf': self.C_yf,
+        }
+        for key, val in mat.items():
+            if isinstance(val, np.generic):
+                mat[key] = val.item()
+        header = {
+            'Creator': 'pylabfea',
+            'Version': version('pylabfea'),
+            'Material': mat,
+            'Model': {'kernel': 'rbf', 'intercept': float(rho), 'gamma': float(gamma),
+                      'classes': np.asarray(self.svm_yf.classes_).tolist()},
+            'Scaler': None,
+            'PCA': None,
+        }
+        arrays = {'CV': self.CV, 'support_vectors': sv, 'dual_coef': dc}
+        if self.std_scaler is not None:
+            sc = self.std_scaler
+            header['Scaler'] = {'with_mean': bool(sc.with_mean), 'with_std': bool(sc.with_std)}
+            if sc.with_mean:
+                arrays['scaler_mean'] = sc.mean_
+            if sc.with_std:
+                arrays['scaler_scale'] = sc.scale_
+        if self.pca is not None:
+            header['PCA'] = {'whiten': bool(self.pca.whiten)}
+            arrays['pca_mean'] = self.pca.mean_
+            arrays['pca_components'] = self.pca.components_
+            arrays['pca_explained_variance'] = self.pca.explained_variance_
+        write_container(path + name, header, arrays)
+
     def create_scaled_input(self, sig, epl=None, acc_strain=None, max_stress=None, flag=None, tex=None):
         """
          Transforms np.array x to be used by SVM.
@@ -2359,11 +3363,12 @@ class Material(object):
                 x[:, self.ind_wh + self.sdim + 2] = flag
             x[:, self.ind_tx:] = tex
             x_scaled = self.std_scaler.transform(x)
-            if self.pca and 'ADV' in self.msparam[0]['tx_descriptor']:
+            tx_descr = self.msparam[0]['tx_descriptor'] if self.msparam is not None else self.tx_descr
+            if self.pca and 'ADV' in tx_descr:
                 print('PCA is performed on ADV as texture descriptor.')
                 x_texture_transform = self.pca.transform(x[:, self.ind_tx:])
                 x_scaled = np.hstack((x_scaled[:, :self.ind_tx], x_texture_transform))
-            elif not self.pca and 'ADV' in self.msparam[0]['tx_descriptor']:
+            elif not self.pca and 'ADV' in tx_descr:
                 raise Warning("No PCA object in material but address vector texture descriptor used !!!")
         return x_scaled
 
@@ -2383,6 +3388,8 @@ class Material(object):
         -------
 
         """
+        from sklearn.model_selection import KFold
+
         n_c = len(param_grid['C'].values())
         n_gamma = len(param_grid['gamma'].values())
         for idx_c, C in enumerate(param_grid['C'].values()):
@@ -2616,6 +3623,7 @@ class Material(object):
         # import dictionaries with all microstructure parameters resulting from data module
 
         self.msparam = np.array(param, ndmin=1)  # required as array ???
+        self.ms_ref = None
         # JS: Storing all data dicts might blow up storage!
         self.Nset = len(self.msparam)  # number of microstructures in material definition
         self.whdat = self.msparam[0]['wh_data']  # flag if work hardening data exists
@@ -2685,22 +3693,178 @@ class Material(object):
             raise NotImplementedError
             self.set_texture(tp)  # JS: TODO: When save texture at self.tx_cur?
 
+    def reload_data(self, param):
+        """Re-attach the data sets of the microstructures to a material that has been pickled
+        without them, see ``pckl`` with slim=True. The fingerprints of the raw data are compared
+        with the references stored in self.ms_ref, such that the material is only combined with
+        the data sets it has been defined from. In contrast to ``from_data``, the parameters of
+        the material are not changed.
+
+        Parameters
+        ----------
+        param : list of directories
+            `Data.mat_param` directories containing material data sets
+        """
+        msparam = np.array(param, ndmin=1)
+        if self.ms_ref is not None:
+            if len(msparam) != len(self.ms_ref):
+                raise ValueError('reload_data: Material has been defined from {} data sets, {} given.'
+                                 .format(len(self.ms_ref), len(msparam)))
+            for i, ms in enumerate(msparam):
+                if self._ms_fingerprint(ms) != self.ms_ref[i]['fingerprint']:
+                    raise ValueError('reload_data: Data set {} ({}) does not match data set {} of material.'
+                                     .format(i, ms.get('Dataset'), self.ms_ref[i]['Dataset']))
+        self.msparam = msparam
+        self.ms_ref = None
+
     def from_MLparam(self, name, path='../../models/'):
         """Define material properties from parameters of trained machine learning 
         models that have been written with `Material.export_MLparam`.
         Will invoke definition of elastic parameters by calls to the methods 
         `Material.elasticity` with the parameters provided in the data set. 
-        Also initializes current texture to first one in list and resets work hardening
-        parameters.
+        The ML yield function is defined as ``RBFExpansion`` with the support vectors
+        and dual coefficients stored in contiguous arrays, such that the material can be
+        used for inference, i.e. for the evaluation of the yield function and for FEA,
+        but not for further training.
 
         Parameters
         ----------
         name : string
-            Name of parameter files (`name`.csv file and metadata file `name_meta.json`)
+            Name of parameter files (`name`-svm.csv file and metadata file `name`-svm_meta.json),
+            the suffix '-svm' is optional
         path : string
             Path in which files are stored (optional, default: '../../models/')            
         """
-        raise ModuleNotFoundError('Import from ML parameters not yet implemented.')
+        from json import load
+
+        if path[-1] != '/':
+            path += '/'
+        if name.endswith('-svm'):
+            name = name[:-4]
+        file = path + name + '-svm'
+        if os.path.isfile(file + '_meta.json'):
+            with open(file + '_meta.json', 'r') as fp:
+                meta = load(fp)
+            if meta['Data']['Class'] != 'SVC_parameters':
+                raise ValueError('from_MLparam: Unknown class of parameters "{}" in {}.'
+                                 .format(meta['Data']['Class'], file + '_meta.json'))
+            param = dict(zip(meta['Model']['Names'], meta['Model']['Parameters']))
+        else:
+            warnings.warn('from_MLparam: No metadata file {} found.'.format(file + '_meta.json'))
+            param = dict()
+        props = np.loadtxt(file + '.csv', delimiter=',', ndmin=2).ravel()
+        nsv = int(props[0])
+        nsd = int(props[1])
+        nl = (nsd + 1) * nsv + 29  # last entry of support vectors
+        if len(props) < nl:
+            raise ValueError('from_MLparam: Inconsistent number of parameters in {}.'.format(file + '.csv'))
+        if nsd == 2:
+            sdim = 3
+            whdat = False
+        elif nsd == 6:
+            sdim = 6
+            whdat = False
+        elif nsd == 15:
+            sdim = 6
+            whdat = True
+        else:
+            raise NotImplementedError('from_MLparam: Feature vectors of dimension {} are not supported.'
+                                      .format(nsd))
+
+        # elastic parameters
+        if props[10] < 0.:
+            self.elasticity(C11=props[2], C12=props[3], C44=props[4])
+        else:
+            CV = np.zeros((6, 6))
+            CV[0, 0], CV[1, 1], CV[2, 2] = props[2], props[10], props[11]
+            CV[0, 1] = CV[1, 0] = props[3]
+            CV[0, 2] = CV[2, 0] = props[12]
+            CV[1, 2] = CV[2, 1] = props[13]
+            CV[3, 3], CV[4, 4], CV[5, 5] = props[4], props[14], props[15]
+            self.elasticity(CV=CV)
+
+        # plastic parameters and ML yield function
+        self.plasticity(sy=props[8], sdim=sdim)
+        self.msparam = None
+        self.txdat = False
+        self.whdat = whdat
+        self.Ndof = nsd
+        self.ind_wh = 6 if whdat else None
+        self.epc = props[7]
+        self.scale_seq = props[8]
+        self.scale_wh = props[9]
+        self.dev_only = props[16] < 0.
+        self.Nset = max(1, int(props[17]))
+        self.scale_text = props[18:18 + self.Nset].tolist() if int(props[17]) > 0 else [1.]
+        self.gam_yf = props[6]
+        self.C_yf = param.get('C')
+        self.svm_yf = RBFExpansion(props[29 + nsv:nl].reshape((nsv, nsd)), props[29:29 + nsv],
+                                   props[5], props[6])
+        self.ML_yf = True
+        self.ML_grad = False
+
+    def load_model(self, name, path='../../models/', mmap=True):
+        """Define material from a binary model container written with `Material.save_model`.
+        The support vectors and dual coefficients of the ML yield function are mapped
+        read-only into memory, such that processes on one node that load the same model share
+        a single physical copy. The material can be used for inference, i.e. for the evaluation
+        of the yield function and for FEA, but not for further training.
+
+        Parameters
+        ----------
+        name : string
+            File name of model container
+        path : string
+            Path in which file is stored (optional, default: '../../models/')
+        mmap : Boolean
+            Map arrays into memory instead of reading them (optional, default: True)
+        """
+        if path[-1] != '/':
+            path += '/'
+        header, arrays = read_container(path + name, mmap=mmap)
+        if header.get('Creator') != 'pylabfea' or header['Model']['kernel'] != 'rbf':
+            raise ValueError('load_model: File {} does not contain an ML yield function of pyLabFEA.'
+                             .format(path + name))
+        mat = header['Material']
+
+        # elastic and plastic parameters
+        self.elasticity(CV=np.array(arrays['CV']))
+        self.E = mat['E']
+        self.nu = mat['nu']
+        self.plasticity(sy=mat['scale_seq'], sdim=mat['sdim'])
+        for key in ['Ndof', 'ind_wh', 'ind_tx', 'tdim', 'whdat', 'txdat', 'dev_only', 'tx_descr',
+                    'Nset', 'epc', 'scale_seq', 'scale_wh', 'scale_text', 'C_yf']:
+            setattr(self, key, mat[key])
+        self.msparam = None
+
+        # scaler and PCA of feature vector
+        self.std_scaler = None
+        self.pca = None
+        if header['Scaler'] is not None:
+            from sklearn.preprocessing import StandardScaler
+            self.std_scaler = StandardScaler(with_mean=header['Scaler']['with_mean'],
+                                             with_std=header['Scaler']['with_std'])
+            self.std_scaler.mean_ = np.array(arrays['scaler_mean']) if 'scaler_mean' in arrays else None
+            self.std_scaler.scale_ = np.array(arrays['scaler_scale']) if 'scaler_scale' in arrays else None
+            self.std_scaler.var_ = None if self.std_scaler.scale_ is None else self.std_scaler.scale_ ** 2
+            self.std_scaler.n_features_in_ = self.Ndof
+        if header['PCA'] is not None:
+            from sklearn.decomposition import PCA
+            comp = np.array(arrays['pca_components'])
+            self.pca = PCA(n_components=comp.shape[0], whiten=header['PCA']['whiten'])
+            self.pca.components_ = comp
+            self.pca.n_components_ = comp.shape[0]
+            self.pca.mean_ = np.array(arrays['pca_mean'])
+            self.pca.explained_variance_ = np.array(arrays['pca_explained_variance'])
+            self.pca.n_features_in_ = comp.shape[1]
+
+        # ML yield function
+        model = header['Model']
+        self.gam_yf = model['gamma']
+        self.svm_yf = RBFExpansion(arrays['support_vectors'], arrays['dual_coef'], model['intercept'],
+                                   model['gamma'], classes=model['classes'])
+        self.ML_yf = True
+        self.ML_grad = False
 
     def set_texture(self, current, verb=False):
         """Set parameters for current crystallographic texture of material as defined in microstructure.
@@ -2814,6 +3978,8 @@ class Material(object):
         line : handle
             Reference to plotted line
         """
+        import matplotlib.pyplot as plt
+
         # symmetrize Z values
         zmin = np.amin(Z)
         zmax = np.amax(Z)
@@ -2877,6 +4043,9 @@ class Material(object):
         axs : pyplot axis handle
             Axis of the plot
         """
+        from matplotlib.lines import Line2D
+        import matplotlib.pyplot as plt
+
         if xstart is None:
             if scaling:
                 xstart = -2.
@@ -3180,6 +4349,8 @@ class Material(object):
         fontsize : int
             Fontsize for axis annotations (optional, default: 14)
         """
+        import matplotlib.pyplot as plt
+
         legend = []
         print('---------------------------------------------------------')
         for sel in self.prop:
@@ -3252,6 +4423,8 @@ class Material(object):
             equivalent stress (optional, default: False)
             
         """
+        import matplotlib.pyplot as plt
+
         if scaling is None:
             sf = 1.
         else:
@@ -3270,9 +4443,9 @@ class Material(object):
                     '"polar_plot_yl" currently does not support texture as degree of freedom for field plots.')
             cmap = plt.cm.get_cmap('PuOr_r')  # 'bwr' and 'PuOr_r' are good choices
             if predict:
-                Z = self.svm_yf.predict(feat)
+                Z = self.get_yf_backend().predict(feat)
             else:
-                Z = self.svm_yf.decision_function(feat)
+                Z = self.get_yf_backend().decision(feat)
             'symmetrize Z values'
             zmin = np.amin(Z)
             zmax = np.amax(Z)
@@ -3289,7 +4462,7 @@ class Material(object):
         # find norm of princ. stess vector lying on yield surface
         theta = np.linspace(0., 2 * np.pi, Na)
         snorm = sig_cyl2princ(np.array([self.sy * np.ones(Na) * np.sqrt(1.5), theta]).T)
-        x1 = fsolve(self.find_yloc, np.ones(Na), args=snorm, xtol=1.e-5)
+        x1 = self.find_yloc_batch(snorm, x0=1.)
         sig = snorm * np.array([x1, x1, x1]).T
         if sJ2:
             s_yld = sig_eq_j2(sig)
@@ -3300,7 +4473,7 @@ class Material(object):
             N = len(cmat)
             cmap = plt.cm.get_cmap('copper')
             for i, mat in enumerate(cmat):
-                x1 = fsolve(mat.find_yloc, np.ones(Na), args=snorm, xtol=1.e-5)
+                x1 = mat.find_yloc_batch(snorm, x0=1.)
                 sig = snorm * np.array([x1, x1, x1]).T
                 if sJ2:
                     s_yld = sig_eq_j2(sig)
@@ -11,10 +11,8 @@ Email: alexander.hartmaier@rub.de
 
 distributed under GNU General Public License (GPLv3)"""
 import numpy as np
-import matplotlib.pyplot as plt
 import warnings
 from pylabfea.basic import Stress, eps_eq, sig_eq_j2, yf_tolerance
-from matplotlib import colors, colorbar
 
 
 # =========================
@@ -1581,6 +1579,9 @@ class Model(object):
         mat     :
             materials and sections of model
         """
+        from matplotlib import colors, colorbar
+        import matplotlib.pyplot as plt
+
         if fig is None:
             fig, ax = plt.subplots(1)
         else:
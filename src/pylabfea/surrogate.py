@@ -0,0 +1,320 @@
+# Module pylabfea.surrogate
+"""Module pylabfea.surrogate introduces the class ``YieldRadiusCache`` that tabulates the
+yield radius of a material, i.e. the distance from the origin to the yield locus, as
+function of the direction in stress space. For a given plastic state, the yield radius only
+depends on the unit stress direction, such that the distance of a stress to the yield locus
+can be obtained by interpolation on the unit sphere instead of a root search along the
+loading direction. The table is seeded with a spherical design from
+``pylabfea.training.load_cases`` and is refined lazily wherever queries land. Each
+interpolated value is verified against the yield function, which provides a guaranteed
+bound for the relative error of the yield radius.
+
+uses NumPy, SciPy and pyLabFEA.training
+
+Authors: Alexander Hartmaier, ICAMS/Ruhr University Bochum, Germany
+Email: alexander.hartmaier@rub.de
+distributed under GNU General Public License (GPLv3)"""
+
+import numpy as np
+import threading
+from collections import OrderedDict
+from scipy.optimize import root_scalar
+from pylabfea.basic import sig_dev, sig_cyl2princ
+from pylabfea.training import load_cases
+
+
+class YieldRadiusCache(object):
+    """Surrogate model of the yield radius of a material on the unit sphere of stress directions.
+
+    For each plastic state of an ML yield function (plastic strain, accumulated strain, maximum stress,
+    flag and texture descriptor, as far as they enter the yield function of the material), a separate
+    table of unit directions and corresponding yield radii is created. For analytical yield functions,
+    isotropic hardening only scales the yield locus with the flow stress, hence a single table of yield
+    radii divided by the flow stress is used for all plastic strains and hardening rates. Queries are answered by inverse-distance
+    interpolation between the nearest tabulated directions. If ``verify`` is True, the yield function
+    is evaluated at the interpolated radius scaled by (1-tol) and (1+tol); if the yield locus is not
+    bracketed by these two points, the yield radius in this direction is calculated by a root search
+    and added to the table. In this way, the relative error of each returned yield radius is bounded
+    by ``tol``. Access to the tables is serialized by a lock, such that one cache can be shared by
+    threads evaluating the same material concurrently.
+
+    Parameters
+    ----------
+    mat : object of class ``Material``
+        Material for which yield radii are tabulated
+    nseed : int
+        Number of seeding directions per table (optional, default: 300 for sdim=6, 36 for sdim=3)
+    nnb : int
+        Number of nearest neighbors used for interpolation (optional, default: 4)
+    tol : float
+        Relative tolerance of the yield radius (optional, default: 2.e-3)
+    max_mem : int
+        Memory budget in bytes for all tables (optional, default: 16 MB)
+    decimals : int
+        Number of decimals to which state variables are rounded for table lookup (optional, default: 4)
+    dev : Boolean
+        Tabulate only deviatoric directions; requires pressure insensitive yield function
+        (optional, default: mat.dev_only)
+    verify : Boolean
+        Verify interpolated yield radii by evaluating the yield function (optional, default: True)
+
+    Attributes
+    ----------
+    tables : OrderedDict
+        Tables with keys given by plastic state, each table is a dictionary with the entries
+        'dirs' (array of unit directions), 'rad' (array of yield radii) and 'nseed' (number of seeding points)
+    nbytes : int
+        Current memory consumption of all tables
+    stats : dictionary
+        Number of 'queries', 'refinements', 'seeds' and 'evictions'
+    """
+
+    def __init__(self, mat, nseed=None, nnb=4, tol=2.e-3, max_mem=2 ** 24, decimals=4,
+                 dev=None, verify=True):
+        if mat.sdim is None:
+            raise ValueError('YieldRadiusCache: Material must have plastic properties defined.')
+        self.mat = mat
+        self.sdim = mat.sdim
+        if nseed is None:
+            nseed = 300 if self.sdim == 6 else 36
+        self.nseed = nseed
+        self.nnb = nnb
+        self.tol = tol
+        self.max_mem = max_mem
+        self.decimals = decimals
+        self.dev = mat.dev_only if dev is None else dev
+        self.verify = verify
+        self.tables = OrderedDict()
+        self.nbytes = 0
+        self.stats = {'queries': 0, 'refinements': 0, 'seeds': 0, 'evictions': 0}
+        self._svm = mat.svm_yf
+        self._lock = threading.RLock()
+        self._seed_dirs = self._seed_directions()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_lock']  # locks cannot be pickled
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def _seed_directions(self):
+        """Create unit directions of the spherical design used to seed each table"""
+        if self.sdim == 3:
+            if self.dev:
+                sc = np.ones((self.nseed, 2))
+                sc[:, 1] = np.linspace(-np.pi, np.pi, self.nseed, endpoint=False)
+                su = sig_cyl2princ(sc)
+            else:
+                su = load_cases(self.nseed, 0)[:, 0:3]
+        else:
+            n3 = int(self.nseed / 3)
+            su = load_cases(n3, self.nseed - n3)
+        return self._unit(su)[0]
+
+    def _unit(self, sig):
+        """Project stresses on the tabulated subspace and normalize them"""
+        if self.dev:
+            sig = sig_dev(sig)
+        norm = np.linalg.norm(sig, axis=-1)
+        return sig / np.expand_dims(norm, -1), norm
+
+    def _key(self, epl, accumulated_strain, max_stress, flag, tex):
+        """Get key of table for given plastic state, only variables changing the shape of the yield locus
+        are considered"""
+        mat = self.mat
+        key = ()
+        if mat.ML_yf:
+            if mat.whdat:
+                key += tuple(np.round(epl, self.decimals)) + \
+                       (round(accumulated_strain, self.decimals),
+                        round(max_stress, self.decimals), flag)
+            if mat.txdat:
+                key += tuple(np.round(np.ravel(tex), self.decimals))
+        return key
+
+    def _scale(self, epl, khard):
+        """Get scaling factor of tabulated yield radii, i.e. the flow stress for analytical yield functions"""
+        if self.mat.ML_yf:
+            return 1.
+        return self.mat.get_sflow(epl, khard)
+
+    def _yf(self, x, u, args):
+        """Evaluate yield function of material at stresses x*u"""
+        return np.atleast_1d(self.mat.find_yloc(np.atleast_1d(x), u, *args))
+
+    def _solve(self, u, args, r0):
+        """Calculate yield radius in direction of unit stress u by a root search
+
+        Parameters
+        ----------
+        u : (sdim,) array
+            Unit stress
+        args : tuple
+            Plastic state passed to yield function
+        r0 : float
+            Initial estimate of yield radius
+
+        Returns
+        -------
+        r : float
+            Yield radius, None if yield locus cannot be bracketed
+        """
+        x0 = x1 = r0
+        f0 = f1 = self._yf(r0, u, args)[0]
+        it = 0
+        while f0 >= 0. and it < 100:
+            x1, f1 = x0, f0
+            x0 *= 0.9
+            f0 = self._yf(x0, u, args)[0]
+            it += 1
+        while f1 < 0. and it < 100:
+            x0, f0 = x1, f1
+            x1 *= 1.1
+            f1 = self._yf(x1, u, args)[0]
+            it += 1
+        if f0 * f1 > 0.:
+            return None
+        if f0 == 0.:
+            return x0
+        res = root_scalar(lambda x: self._yf(x, u, args)[0], method=self.mat.root_method,
+                          bracket=[x0, x1], xtol=1.e-3 * self.tol * x0)
+        return res.root if res.converged else None
+
+    def _create_table(self, key, args, scale):
+        """Seed new table for given plastic state"""
+        rad = self.mat.find_yloc_batch(self._seed_dirs, *args[0:5], khard=args[5], xtol=1.e-3 * self.tol) / scale
+        ind = np.nonzero(np.isfinite(rad))[0]
+        if len(ind) == 0:
+            raise ValueError('YieldRadiusCache: Could not determine yield radius for any seeding direction.')
+        table = {'dirs': self._seed_dirs[ind], 'rad': rad[ind], 'nseed': len(ind)}
+        self.stats['seeds'] += len(rad)
+        self.tables[key] = table
+        self.nbytes += table['dirs'].nbytes + table['rad'].nbytes
+        self._evict(key)
+        return table
+
+    def _insert(self, key, u, r):
+        """Add refinement point to table"""
+        table = self.tables[key]
+        table['dirs'] = np.append(table['dirs'], u[None, :], axis=0)
+        table['rad'] = np.append(table['rad'], r)
+        self.nbytes += (self.sdim + 1) * 8
+        self._evict(key)
+
+    def _evict(self, key):
+        """Evict least recently used tables, and finally oldest refinement points, until memory budget is met"""
+        while self.nbytes > self.max_mem and len(self.tables) > 1:
+            k, table = next(iter(self.tables.items()))
+            if k == key:
+                self.tables.move_to_end(k)
+                continue
+            self.tables.popitem(last=False)
+            self.nbytes -= table['dirs'].nbytes + table['rad'].nbytes
+            self.stats['evictions'] += 1
+        table = self.tables[key]
+        while self.nbytes > self.max_mem and len(table['rad']) > table['nseed']:
+            i = table['nseed']
+            table['dirs'] = np.delete(table['dirs'], i, axis=0)
+            table['rad'] = np.delete(table['rad'], i)
+            self.nbytes -= (self.sdim + 1) * 8
+            self.stats['evictions'] += 1
+
+    def clear(self):
+        """Remove all tables"""
+        with self._lock:
+            self.tables.clear()
+            self.nbytes = 0
+            self._svm = self.mat.svm_yf
+
+    def radius(self, u, epl=None, accumulated_strain=0.0, max_stress=0.0, flag=0.0, tex=None, khard=None):
+        """Get yield radius in direction of a given unit stress
+
+        Parameters
+        ----------
+        u : (sdim,) array
+            Unit stress (Euclidean norm), must be deviatoric if dev=True
+        epl : (sdim,) array
+            Plastic strain tensor (optional, default: 0)
+        accumulated_strain : float
+            Accumulated equiv. plastic strain (optional, default: 0)
+        max_stress : float
+            Maximum equivalent stress reached so far (optional, default: 0)
+        flag : float
+            Indicator (optional, default: 0)
+        tex : (tdim,) array
+            Texture descriptor (optional, default: None)
+        khard : float
+            Strain hardening rate of analytical yield function (optional, default: mat.khard)
+
+        Returns
+        -------
+        r : float
+            Yield radius, i.e. r*u lies on yield locus
+        """
+        if epl is None:
+            epl = np.zeros(self.sdim)
+        args = (epl, accumulated_strain, max_stress, flag, tex, khard)
+        key = self._key(epl, accumulated_strain, max_stress, flag, tex)
+        scale = self._scale(epl, khard)
+        with self._lock:
+            if self.mat.svm_yf is not self._svm:
+                # ML yield function has been retrained, tabulated values are outdated
+                self.clear()
+            self.stats['queries'] += 1
+            if key in self.tables:
+                table = self.tables[key]
+                self.tables.move_to_end(key)
+            else:
+                table = self._create_table(key, args, scale)
+            dirs, rad = table['dirs'], table['rad']
+
+        # inverse distance interpolation between nearest tabulated directions
+        dist = 1. - dirs @ u  # equals half of squared Euclidean distance
+        nnb = min(self.nnb, len(dist))
+        ind = np.argpartition(dist, nnb - 1)[0:nnb]
+        if dist[ind].min() < 1.e-12:
+            r = rad[ind[np.argmin(dist[ind])]]
+        else:
+            wght = 1. / dist[ind]
+            r = np.sum(wght * rad[ind]) / np.sum(wght)
+        r *= scale
+        if not self.verify:
+            return r
+
+        # verify that yield locus lies within relative tolerance of interpolated radius,
+        # yield function is evaluated outside of lock
+        f = self._yf(np.array([1. - self.tol, 1. + self.tol]) * r, u, args)
+        if f[0] < 0. <= f[1]:
+            return r
+        rs = self._solve(u, args, r)
+        if rs is None:
+            return r
+        with self._lock:
+            self.stats['refinements'] += 1
+            if key in self.tables:
+                self._insert(key, u, rs / scale)
+        return rs
+
+    def yield_factor(self, sig, epl=None, accumulated_strain=0.0, max_stress=0.0, flag=0.0, tex=None,
+                     khard=None):
+        """Get factor by which a stress tensor must be scaled to lie on the yield locus
+
+        Parameters
+        ----------
+        sig : (sdim,) array
+            Stress tensor (Voigt stress for sdim=6, principal stress for sdim=3)
+        epl, accumulated_strain, max_stress, flag, tex, khard :
+            Plastic state, see method ``radius``
+
+        Returns
+        -------
+        fac : float
+            Scaling factor, fac*sig lies on yield locus
+        """
+        u, norm = self._unit(np.asarray(sig, dtype=float))
+        r = self.radius(u, epl=epl, accumulated_strain=accumulated_strain,
+                        max_stress=max_stress, flag=flag, tex=tex, khard=khard)
+        return r / norm
@@ -20,13 +20,9 @@ These subroutines are distributed here under the CC-BY-SA 4.0 license, see https
 from pylabfea.basic import sig_eq_j2
 import numpy as np
 from itertools import count
-from scipy.special import gamma
-from scipy.optimize import root_scalar
-from sklearn.metrics import mean_absolute_error, confusion_matrix, \
-    ConfusionMatrixDisplay
-import matplotlib.pyplot as plt
-from sklearn.metrics import matthews_corrcoef
 import collections
+import hashlib
+import os
 import pylabfea as FE
 
 
@@ -96,6 +92,8 @@ def uniform_hypersphere(d, n, method='brentq'):
     points : (n,6)-array
         Unit stresses
     """
+    from scipy.optimize import root_scalar
+    from scipy.special import gamma
 
     def dim_func(y, x):
         return mult * int_sin_m(y, dim - 1) - x
@@ -148,7 +146,7 @@ def load_cases(number_3d, number_6d, method='brentq'):
     return allsig
 
 
-def training_score(yf_ref, yf_ml, plot=False):
+def training_score(yf_ref, yf_ml, plot=False, verbose=True):
     """Calculate the accuracy of the training result in form of different measures
     as compared to given reference values.
 
@@ -159,6 +157,10 @@ def training_score(yf_ref, yf_ml, plot=False):
     yf_ml : (N,)-array
         Yield function values of ML material at identical sequence of stresses
         at which reference material is evaluated.
+    plot : Boolean
+        Plot confusion matrix (optional, default: False)
+    verbose : Boolean
+        Print scores (optional, default: True)
 
     Returns
     -------
@@ -175,6 +177,10 @@ def training_score(yf_ref, yf_ml, plot=False):
     MCC : float
         Matthews Correlation Coefficient
     """
+    from sklearn.metrics import mean_absolute_error, confusion_matrix, \
+        ConfusionMatrixDisplay, matthews_corrcoef
+    import matplotlib.pyplot as plt
+
     res_yf_ref = np.sign(yf_ref)
     ind = np.nonzero(np.abs(res_yf_ref) < 0.9)[0]
     res_yf_ref[ind] = 1.  # change points with yf=0 to +1
@@ -212,32 +218,37 @@ def training_score(yf_ref, yf_ml, plot=False):
             TN += 1
     mae = mean_absolute_error(yf_ref, yf_ml)
     MCC = matthews_corrcoef(np.sign(yf_ref), np.sign(yf_ml), sample_weight=None)
-    print("Mean Absolut Error is", mae)
-    print('True Positives:', TP)
-    print('True Negatives:', TN)
-    print('False Positives:', FP)
-    print('False Negatives:', FN)
+    if verbose:
+        print("Mean Absolut Error is", mae)
+        print('True Positives:', TP)
+        print('True Negatives:', TN)
+        print('False Positives:', FP)
+        print('False Negatives:', FN)
     if TP + FP > 0:
         precision = (TP) / (TP + FP)
     else:
         precision = 0.0
-    print('Precision:', precision)
+    if verbose:
+        print('Precision:', precision)
     if TP + FP + FN + TN > 0:
         Accuracy = (TP + TN) / (TP + FP + FN + TN)
     else:
         Accuracy = 0.0
-    print('Accuracy:', Accuracy)
+    if verbose:
+        print('Accuracy:', Accuracy)
     if TP + FN > 0:
         Recall = (TP) / (TP + FN)
     else:
         Recall = 0.0
-    print('Recall:', Recall)
+    if verbose:
+        print('Recall:', Recall)
     if Recall + precision > 1.0e-4:
         F1Score = 2 * (Recall * precision) / (Recall + precision)
     else:
         F1Score = 0.0
-    print('F1score:', F1Score)
-    print('MCC score:', MCC)
+    if verbose:
+        print('F1score:', F1Score)
+        print('MCC score:', MCC)
     return mae, precision, Accuracy, Recall, F1Score, MCC
 
 
@@ -300,3 +311,138 @@ def create_test_sig(file, number_sig_per_strain=4):
     yf_ref = np.concatenate((pos, neg), axis=None)
 
     return (ts_sig, epl_tot, yf_ref)
+
+
+class TrainingDataCache(object):
+    """Least-recently-used cache for blocks of training data, e.g. the data generated for individual
+    microstructures in ``Material._create_data_for_ms``. The memory consumption of all blocks held in
+    memory is bounded by ``max_mem``. Blocks exceeding this budget are either discarded or, if
+    ``spill_dir`` is given, written to disk and reloaded when they are requested again.
+    Blocks are stored as tuples of arrays and scalars; arrays are returned read-only.
+
+    Parameters
+    ----------
+    max_mem : int
+        Memory budget in bytes for all blocks held in memory (optional, default: 128 MB)
+    spill_dir : str
+        Directory into which evicted blocks are written (optional, default: None)
+
+    Attributes
+    ----------
+    blocks : OrderedDict
+        Blocks in memory, ordered from least to most recently used
+    nbytes : int
+        Current memory consumption of all blocks in memory
+    stats : dictionary
+        Number of 'hits', 'misses', 'spills', 'loads' and 'evictions'
+    """
+
+    def __init__(self, max_mem=2 ** 27, spill_dir=None):
+        self.max_mem = max_mem
+        self.spill_dir = spill_dir
+        if spill_dir is not None:
+            os.makedirs(spill_dir, exist_ok=True)
+        self.blocks = collections.OrderedDict()
+        self.nbytes = 0
+        self.stats = {'hits': 0, 'misses': 0, 'spills': 0, 'loads': 0, 'evictions': 0}
+
+    def __getstate__(self):
+        # blocks are not pickled together with the material
+        state = self.__dict__.copy()
+        state['blocks'] = collections.OrderedDict()
+        state['nbytes'] = 0
+        return state
+
+    @staticmethod
+    def fingerprint(*objs):
+        """Calculate hash value of arrays and other objects, used to identify the raw data from which a
+        block of training data is generated.
+
+        Parameters
+        ----------
+        objs : arrays or objects with unique string representation
+
+        Returns
+        -------
+        fp : str
+            Hexadecimal digest
+        """
+        hh = hashlib.blake2b(digest_size=16)
+        for obj in objs:
+            if isinstance(obj, np.ndarray):
+                hh.update(str((obj.shape, obj.dtype.str)).encode())
+                hh.update(np.ascontiguousarray(obj).data)
+            else:
+                hh.update(repr(obj).encode())
+        return hh.hexdigest()
+
+    def _fname(self, key):
+        return os.path.join(self.spill_dir, 'td_{}.npz'.format(self.fingerprint(key)))
+
+    @staticmethod
+    def _size(value):
+        return sum(v.nbytes for v in value if isinstance(v, np.ndarray))
+
+    def get(self, key):
+        """Get block of training data
+
+        Parameters
+        ----------
+        key : tuple
+            Key of block
+
+        Returns
+        -------
+        value : tuple or None
+            Block of data, None if block is not cached
+        """
+        if key in self.blocks:
+            self.blocks.move_to_end(key)
+            self.stats['hits'] += 1
+            return self.blocks[key]
+        if self.spill_dir is not None and os.path.isfile(self._fname(key)):
+            with np.load(self._fname(key)) as fz:
+                value = tuple(fz['arr_{}'.format(i)] for i in range(len(fz.files)))
+            value = tuple(v.item() if v.ndim == 0 else v for v in value)
+            self.stats['loads'] += 1
+            self.put(key, value)
+            return value
+        self.stats['misses'] += 1
+        return None
+
+    def put(self, key, value):
+        """Add block of training data to cache
+
+        Parameters
+        ----------
+        key : tuple
+            Key of block
+        value : tuple
+            Block of data, arrays will be set read-only
+        """
+        for v in value:
+            if isinstance(v, np.ndarray):
+                v.flags.writeable = False
+        if key in self.blocks:
+            self.nbytes -= self._size(self.blocks.pop(key))
+        self.blocks[key] = value
+        self.nbytes += self._size(value)
+        while self.nbytes > self.max_mem and len(self.blocks) > 0:
+            # evict least recently used block, write it to disk if not yet spilled before
+            k, v = self.blocks.popitem(last=False)
+            self.nbytes -= self._size(v)
+            fname = None if self.spill_dir is None else self._fname(k)
+            if fname is not None and not os.path.isfile(fname):
+                np.savez(fname, *v)
+                self.stats['spills'] += 1
+            else:
+                self.stats['evictions'] += 1
+
+    def clear(self):
+        """Remove all blocks from memory and from spill directory"""
+        if self.spill_dir is not None:
+            for fn in os.listdir(self.spill_dir):
+                if fn.startswith('td_') and fn.endswith('.npz'):
+                    os.remove(os.path.join(self.spill_dir, fn))
+        self.blocks.clear()
+        self.nbytes = 0
@@ -79,7 +79,209 @@ def test_bcnode():
     assert np.abs(fe.element[5*NY+7].sig[0] - 45.68020736256676) < 1E-5
     assert np.abs(fe.element[6*NY+7].sig[1] - 69.16252458086865) < 1E-5
     assert noc == [0]
-    
+
+def test_sig_princ():
+    # check batched principal stresses, ordering along major force axes and closed-form eigenvalues
+    sig = np.array([[-125.5, -64.4, 251.9, 2.9, 3.5, 0.8], [12.6, -13.2, 64., 10.5, -53.6, 36.2]])
+    sp, ev = FE.sig_princ(sig)
+    assert np.all(np.abs(sp[0] - sig[0, 0:3]) < 0.2)
+    st = np.einsum('nij,nj,nkj->nik', ev, sp, ev)
+    assert np.allclose(st, FE.sig_voigt2tensor(sig))
+    assert np.allclose(FE.sig_princ_vals(sig), -np.sort(-sp, axis=1))
+
+def test_invariants():
+    # check invariant-based equiv. stress and Lode angle against principal stress values
+    sig = np.array([[120., -40., 10., 30., 0., -20.], [-60., 80., 0., 0., 50., 10.]])
+    sp = FE.sig_princ(sig)[0]
+    assert np.allclose(FE.sig_eq_j2(sig), FE.sig_eq_j2(sp))
+    assert np.allclose(FE.sig_polar_ang(sig), FE.sig_polar_ang(sp))
+    assert np.allclose(FE.sig_lode_ang(sig), FE.sig_lode_ang(sp))
+    st = FE.Stress(sig[0])
+    assert np.abs(FE.sig_lode_ang(sig[0]) - st.lode_ang(float(st.seq()))) < 1.e-8
+
+def test_barlat_gradient():
+    # check analytical gradient of Barlat equiv. stress against finite differences
+    bp = [0.81, 1.12, 0.93, 1.05, 0.87, 1.21, 0.95, 1.08, 0.99,
+          1.13, 0.88, 1.02, 0.91, 1.16, 0.97, 1.04, 0.86, 1.1]
+    mat = FE.Material()
+    mat.elasticity(E=200.e3, nu=0.3)
+    mat.plasticity(sy=150., barlat=bp, barlat_exp=8, sdim=6)
+    sig = np.array([[120., -40., 10., 30., 0., -20.], [-60., 80., 0., 0., 50., 10.]])
+    fgrad = mat.calc_fgrad(sig)
+    h = 1.e-4
+    for k in range(6):
+        ds = np.zeros(6)
+        ds[k] = h
+        dseq = (mat.calc_seq(sig + ds) - mat.calc_seq(sig - ds)) / (2. * h)
+        assert np.allclose(fgrad[:, k], dseq, atol=1.e-6)
+
+def test_yloc_batch():
+    # check if batched root search finds yield stresses along given directions
+    mat = FE.Material()
+    mat.elasticity(E=200.e3, nu=0.3)
+    mat.plasticity(sy=150., hill=[1.4, 1., 0.7, 1.2, .8, 1.], sdim=6)
+    su = FE.load_cases(20, 40)
+    x1 = mat.find_yloc_batch(su, x0=1.)
+    assert np.allclose(x1 * mat.calc_seq(su), 150., rtol=1.e-5)
+
+def test_yield_cache():
+    # check if surrogate for yield radius reproduces distance to yield locus
+    mat = FE.Material()
+    mat.elasticity(E=200.e3, nu=0.3)
+    mat.plasticity(sy=150., hill=[1.4, 1., 0.7, 1.2, .8, 1.], sdim=6)
+    sig = np.array([[120., -40., 10., 30., 0., -20.], [-60., 80., 0., 0., 50., 10.]])
+    yf_ref = [mat.ML_full_yf(s) for s in sig]
+    cache = mat.setup_yield_cache(nseed=60)
+    yf = [mat.ML_full_yf(s) for s in sig]
+    assert np.allclose(yf, yf_ref, atol=cache.tol * 150.)
+    nref = cache.stats['refinements']
+    yf = [mat.ML_full_yf(s) for s in sig]
+    assert cache.stats['refinements'] == nref
+    assert cache.nbytes <= cache.max_mem
+    # hardening rate passed as argument must be considered by surrogate
+    epl = np.array([2.e-3, -1.e-3, -1.e-3, 0., 0., 0.])
+    yf = [mat.ML_full_yf(sig[0], epl, khard=kh) for kh in (500., 5000.)]
+    mat.yr_cache = None
+    yf_ref = [mat.ML_full_yf(sig[0], epl, khard=kh) for kh in (500., 5000.)]
+    assert np.allclose(yf, yf_ref, atol=cache.tol * 160.)
+    # one table of normalized yield radii is reused for all plastic strains of analytical yield function
+    epl_list = np.linspace(0., 10., 20)[:, None] * epl
+    yf_ref = [mat.ML_full_yf(sig[1], e, khard=500.) for e in epl_list]
+    cache = mat.setup_yield_cache(nseed=60)
+    yf = [mat.ML_full_yf(sig[1], e, khard=500.) for e in epl_list]
+    assert np.allclose(yf, yf_ref, atol=cache.tol * 170.)
+    assert len(cache.tables) == 1
+    assert cache.stats['seeds'] == 60
+
+def test_eval_api():
+    # check if side-effect-free evaluation reproduces legacy methods without changing material state
+    from concurrent.futures import ThreadPoolExecutor
+    mat = FE.Material()
+    mat.elasticity(E=200.e3, nu=0.3)
+    mat.plasticity(sy=150., hill=[1.4, 1., 0.7, 1.2, .8, 1.], khard=500., sdim=6)
+    sig = np.array([140., -20., 10., 30., 0., -20.])
+    deps = np.array([2.e-3, -1.e-3, -1.e-3, 0., 0., 0.])
+    epl = np.zeros(6)
+    msg = dict(mat.msg)
+    res = mat.eval_response(sig, epl, deps, mat.CV)
+    assert mat.msg == msg
+    assert res[4]['khard'] == mat.khard
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        res_t = list(ex.map(lambda s: mat.eval_response(s, epl, deps, mat.CV), [sig] * 8))
+    assert all(np.allclose(r[1], res[1]) for r in res_t)
+    fy1, sig1, depl, gs = mat.response(sig, epl, deps, mat.CV)
+    assert np.allclose(sig1, res[1]) and np.allclose(depl, res[2]) and np.allclose(gs, res[3])
+    assert mat.msg['nsteps'] == res[4]['nsteps']
+
+def test_gridsearch():
+    # check if grid search on precomputed kernel matrices reproduces GridSearchCV
+    from sklearn.model_selection import GridSearchCV
+    from sklearn import svm
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 6))
+    y = np.sign(np.linalg.norm(X, axis=1) - 2.3 + 0.3 * rng.normal(size=300))
+    cvals = [1, 4]
+    gvals = [0.5, 2.]
+    mat = FE.Material()
+    svc = mat.gridsearch_SVC(X, y, cvals, gvals, verbose=0)
+    grid = GridSearchCV(svm.SVC(), {'C': cvals, 'gamma': gvals}).fit(X, y)
+    assert mat.grid.best_params_ == grid.best_params_
+    for key in ('mean_test_score', 'split0_test_score', 'split4_test_score', 'param_C', 'param_gamma'):
+        assert np.allclose(mat.grid.cv_results_[key], grid.cv_results_[key].astype(float))
+    assert np.all(mat.grid.cv_results_['rank_test_score'] == grid.cv_results_['rank_test_score'])
+    assert mat.grid.best_estimator_ is svc
+    assert np.allclose(svc.decision_function(X), grid.best_estimator_.decision_function(X))
+
+def test_data_cache(tmp_path):
+    # check if training data of microstructures is reused from memory and from spill directory
+    rng = np.random.default_rng(0)
+    ms = {'Nlc': 20, 'Ncyl': 4, 'flow_stress': rng.normal(size=(40, 6)) * 100.,
+          'plastic_strain': rng.normal(size=(40, 6)) * 1.e-3}
+    mat = FE.Material()
+    mat.elasticity(E=200.e3, nu=0.3)
+    mat.plasticity(sy=150., sdim=6)
+    mat.msparam = np.array([ms])
+    mat.whdat = True
+    mat.ind_wh = 6
+    mat.Ndof = 15
+    res = mat._create_data_for_ms(Ce=0.95, Fe=0.8, Nseq=2, extend=False, idx_ms=0)
+    assert np.array_equal(res[2][41, 6:12], ms['plastic_strain'][1])
+    assert mat._create_data_for_ms(Ce=0.95, Fe=0.8, Nseq=2, extend=False, idx_ms=0) is res
+    cache = mat.setup_data_cache(max_mem=0, spill_dir=str(tmp_path))
+    mat._create_data_for_ms(Ce=0.95, Fe=0.8, Nseq=2, extend=False, idx_ms=0)
+    res_s = mat._create_data_for_ms(Ce=0.95, Fe=0.8, Nseq=2, extend=False, idx_ms=0)
+    assert cache.stats['loads'] == 1
+    assert np.array_equal(res_s[2], res[2]) and res_s[0:2] == res[0:2]
+
+def test_slim_pickle(tmp_path):
+    # check if material is pickled without data sets and data sets are re-attached after fingerprint check
+    rng = np.random.default_rng(1)
+    ms = {'Dataset': 'random', 'Nlc': 20, 'Ncyl': 4, 'flow_stress': rng.normal(size=(4000, 6)) * 100.,
+          'plastic_strain': rng.normal(size=(4000, 6)) * 1.e-3, 'sy_av': 100., 'epc': 2.e-3}
+    mat = FE.Material(name='slim')
+    mat.elasticity(E=200.e3, nu=0.3)
+    mat.plasticity(sy=150., sdim=6)
+    mat.msparam = np.array([ms])
+    mat.epc = ms['epc']
+    mat.pckl(path=str(tmp_path), name='full.pkl')
+    mat.pckl(path=str(tmp_path), name='slim.pkl', slim=True)
+    assert mat.msparam[0] is ms and mat.ms_ref is None
+    assert os.path.getsize(tmp_path / 'slim.pkl') < 0.1 * os.path.getsize(tmp_path / 'full.pkl')
+    mat_s = FE.pickle2mat('slim.pkl', path=str(tmp_path))
+    assert mat_s.msparam is None and mat_s.epc == mat.epc
+    assert mat_s.ms_ref == mat.data_reference()
+    ms_mod = dict(ms, flow_stress=ms['flow_stress'] * 1.01)
+    with pytest.raises(ValueError):
+        mat_s.reload_data([ms_mod])
+    mat_s.reload_data([ms])
+    assert mat_s.msparam[0] is ms
+
+def test_yield_backend():
+    # check if a user-defined backend of the ML yield function is used by all evaluation methods
+    class J2Backend(FE.YieldBackend):
+        def decision(self, x):
+            return FE.sig_eq_j2(x) - 1.
+
+        def gradient(self, x, cols=None, max_mem=None):
+            grad = np.zeros_like(x)
+            grad[:, 0:3] = 1.5 * FE.sig_dev(x)[:, 0:3] / FE.sig_eq_j2(x)[:, None]
+            grad[:, 3:6] = 3. * x[:, 3:6] / FE.sig_eq_j2(x)[:, None]
+            return grad
+
+    mat_J2 = FE.Material()
+    mat_J2.elasticity(E=200.e3, nu=0.3)
+    mat_J2.plasticity(sy=150., sdim=6)
+    mat = FE.Material()
+    mat.elasticity(E=200.e3, nu=0.3)
+    mat.plasticity(sy=150., sdim=6)
+    mat.svm_yf = J2Backend()
+    mat.ML_yf = True
+    mat.Ndof = 6
+    mat.scale_seq = 150.
+    sig = FE.load_cases(number_3d=0, number_6d=20) * 160.
+    assert mat.get_yf_backend() is mat.svm_yf
+    assert np.allclose(mat.calc_yf(sig), mat_J2.calc_yf(sig) / 150.)
+    assert np.isclose(mat.calc_yf(sig[0]), mat_J2.calc_yf(sig[0]) / 150.)
+    assert np.allclose(mat.calc_fgrad(sig), mat_J2.calc_fgrad(sig) / 150.)
+    with pytest.raises(NotImplementedError):
+        mat.calc_hessian(sig)
+
+def test_import_time():
+    # import of package and elastic FE model must not load training and plotting libraries
+    import subprocess
+    import sys
+    code = ('import sys, time\n'
+            't0 = time.perf_counter()\n'
+            'import pylabfea as FE\n'
+            'dt = time.perf_counter() - t0\n'
+            'fe = FE.Model(dim=1, planestress=False)\n'
+            'mat = FE.Material()\n'
+            'print(dt, *[m for m in ("sklearn", "matplotlib", "joblib") if m in sys.modules])\n')
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    res = out.stdout.split()
+    assert len(res) == 1, 'Modules imported on startup: {}'.format(res[1:])
+    assert float(res[0]) < 2.
+
 #define model for elasticity tests
 fem_v = FE.Model(dim=2, planestress=True)   # call class to generate container for finite element model
 fem_v.geom([2, 1, 2, 1, 2], LY=4.) # define sections in absolute lengths
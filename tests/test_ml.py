@@ -67,8 +67,18 @@ def test_ml_shear():
     assert np.abs(fem.element[3].epl[5] - 0.003942707316047761) < 1E-7
     assert np.abs(fem.element[3].sig[1] - 43.9060552472426) < 5E-3
 
+    # compress ML yield function and compare with original SVC
+    sig = FE.load_cases(number_3d=0, number_6d=500) * np.linspace(100., 200., 500)[:, None]
+    yf_svc = mat_mlh.calc_yf(sig)
+    svc = mat_mlh.compress_svc(tol=1.e-2, min_accuracy=0.99)
+    nc = len(mat_mlh.svm_yf.support_vectors_)
+    assert isinstance(mat_mlh.svm_yf, FE.RBFExpansion)
+    assert nc == mat_mlh.compress_info['ncenters'] < len(svc.support_vectors_) / 4
+    assert mat_mlh.compress_info['locus_dev'] <= 1.e-2
+    assert np.mean(np.sign(mat_mlh.calc_yf(sig)) == np.sign(yf_svc)) > 0.98
 
-def test_ml_training():
+
+def test_ml_training(tmp_path):
     # test generation of stress data in 6D stress space
     # define J2 model as reference
     E = 200000.
@@ -102,6 +112,9 @@ def test_ml_training():
     sig_test = sunittest * X[:, None]
     yf_ml = mat_ml2.calc_yf(sig_test)
     yf_J2 = mat_J2.calc_yf(sig_test)
+    # single-stress evaluation must agree with batch evaluation
+    assert np.allclose([mat_ml2.calc_yf(s) for s in sig_test[0:20]], yf_ml[0:20])
+    assert np.allclose([mat_J2.calc_yf(s) for s in sig_test[0:20]], yf_J2[0:20])
     mae, precision, Accuracy, Recall, F1Score, mcc = \
         FE.training_score(yf_J2, yf_ml, plot=False)
 
@@ -109,6 +122,216 @@ def test_ml_training():
     assert np.abs(mat_ml2.propJ2['et2']['ys'] - 60.5) < 1.0
     assert np.abs(mat_ml2.propJ2['ect']['peeq'][-1] - 0.00898749114723422) < 2E-6
 
+    # write binary model container and map it into memory
+    mat_ml2.save_model(path=str(tmp_path))
+    mat_mm = FE.Material('ML-J2-mapped')
+    mat_mm.load_model('mat_' + name + '.plm', path=str(tmp_path))
+    assert not mat_mm.svm_yf.support_vectors_.flags.writeable  # read-only view of mapped file
+    assert np.array_equal(mat_mm.svm_yf.support_vectors_, mat_ml2.svm_yf.support_vectors_)
+    assert np.allclose(mat_mm.CV, mat_ml2.CV)
+    assert np.allclose(mat_mm.calc_yf(sig_test), yf_ml)
+    assert np.allclose(mat_mm.calc_fgrad(sig_test[0:10]), mat_ml2.calc_fgrad(sig_test[0:10]))
+
+
+def test_ml_hessian():
+    # Hessian of ML yield function must agree with finite differences of its gradient
+    mat_J2 = FE.Material(name='J2-reference')
+    mat_J2.elasticity(E=200000., nu=0.3)
+    mat_J2.plasticity(sy=60., sdim=6)
+    mat_ml = FE.Material('ML-J2-hessian')
+    mat_ml.dev_only = False
+    mat_ml.train_SVC(C=15., gamma=2.5, mat_ref=mat_J2, Nlc=50, Nseq=10, Fe=0.1, Ce=0.99)
+    sig = FE.load_cases(number_3d=0, number_6d=8) * np.linspace(50., 70., 8)[:, None]
+    hess = mat_ml.calc_hessian(sig)
+    hess_fd = np.zeros_like(hess)
+    ds = 1.e-3
+    for j in range(6):
+        dsig = np.zeros(6)
+        dsig[j] = ds
+        hess_fd[:, :, j] = (mat_ml.calc_fgrad(sig + dsig) - mat_ml.calc_fgrad(sig - dsig)) / (2. * ds)
+    # without standard scaler, calc_hessian scales the Hessian w.r.t. the scaled features only once by scale_seq
+    assert np.allclose(hess, hess_fd * mat_ml.scale_seq, atol=1.e-8)
+    # evaluation in several chunks with tiny memory budget
+    assert np.allclose(mat_ml.calc_hessian(sig, max_mem=1), hess, rtol=1.e-12, atol=1.e-14)
+
+
+def test_ml_nystroem(tmp_path):
+    # train ML yield function with Nystroem approximation of rbf kernel
+    mat_h = FE.Material(name='Hill-reference')
+    mat_h.elasticity(E=200.e3, nu=0.3)
+    mat_h.plasticity(sy=150., hill=[1.4, 1., 0.7, 1.2, .8, 1.], sdim=6)
+    mat_ml = FE.Material('Hill-ML-Nystroem')
+    mat_ml.train_SVC(C=2, gamma=0.5, mat_ref=mat_h, Nseq=4, Nlc=300, Fe=0.7, Ce=0.95,
+                     backend='nystroem', ncomp=300)
+    assert isinstance(mat_ml.svm_yf, FE.RBFExpansion)
+    assert len(mat_ml.svm_yf.support_vectors_) == 300
+
+    sig = FE.load_cases(number_3d=0, number_6d=500) * np.linspace(100., 200., 500)[:, None]
+    yf_ml = mat_ml.calc_yf(sig)
+    assert np.mean(np.sign(yf_ml) == np.sign(mat_h.calc_yf(sig))) > 0.95
+    assert np.allclose([mat_ml.calc_yf(s) for s in sig[0:10]], yf_ml[0:10])
+    assert np.all(np.isfinite(mat_ml.calc_fgrad(sig[0:10])))
+
+    # export parameters and reload them as inference-only material
+    mat_ml.export_MLparam(__file__, path=str(tmp_path))
+    mat_inf = FE.Material('Hill-ML-inference')
+    mat_inf.from_MLparam('abq_Hill-ML-Nystroem', path=str(tmp_path))
+    assert mat_inf.ML_yf and mat_inf.sdim == 6
+    assert np.isclose(mat_inf.C11, mat_ml.C11)
+    assert np.allclose(mat_inf.calc_yf(sig), yf_ml)
+    assert np.allclose(mat_inf.calc_fgrad(sig[0:10]), mat_ml.calc_fgrad(sig[0:10]))
+
+
+def test_texture_cv():
+    # synthetic microstructures with Hill-type anisotropy, parameter a serves as texture descriptor
+    u = FE.load_cases(number_3d=0, number_6d=40)
+    msparam = []
+    for a in np.linspace(0.8, 1.2, 5):
+        mat_h = FE.Material(name='Hill-{}'.format(a))
+        mat_h.elasticity(E=200.e3, nu=0.3)
+        mat_h.plasticity(sy=100., hill=[a, 1., 2. - a, 1., 1., 1.], sdim=6)
+        msparam.append({'Nlc': 40, 'Ncyl': 0, 'Ntext': 1, 'sdim': 6, 'tdim': 1, 'wh_data': False,
+                        'tx_data': True, 'tx_descriptor': 'GSH', 'epc': 0.002, 'elast_const': mat_h.CV,
+                        'sy_av': 100., 'peeq_max': 0., 'ms_type': 'Hill', 'Dataset': mat_h.name,
+                        'sig_ideal': u * (100. / mat_h.calc_seq(u))[:, None], 'texture': np.array([a])})
+    # cross validation over textures with early stopping, serial and in parallel
+    grid = []
+    for n_jobs in [1, 2]:
+        mat_ml = FE.Material('ML-texture')
+        mat_ml.from_data(msparam)
+        mat_ml.train_SVC(C=10, gamma=1, Nseq=4, Fe=0.7, Ce=0.95, gridsearch=True, cvals=[1, 10],
+                         gvals=[0.5, 5], n_jobs=n_jobs, early_stop=0.01, verbose=0)
+        grid.append(mat_ml.grid)
+    assert grid[0].best_params_ == grid[1].best_params_
+    assert grid[0].cv_results_ == grid[1].cv_results_
+    nfold = [len(res['test_acc']) for res in grid[0].cv_results_.values()]
+    assert max(nfold) == 5 and min(nfold) < 5  # folds skipped for hyperparameters stopped early
+    assert len(grid[0].cv_results_['hp-set_{}'.format(grid[0].best_index_)]['test_acc']) == 5
+    # gradient of yield function with standard scaler must agree with finite differences
+    sig = u[0:5] * 100.
+    tex = np.array([[1.1]] * 5)
+    fgrad = mat_ml.calc_fgrad(sig, tex=tex)
+    fgrad_fd = np.zeros_like(fgrad)
+    ds = 1.e-3
+    for j in range(6):
+        dsig = np.zeros(6)
+        dsig[j] = ds
+        fgrad_fd[:, j] = (mat_ml.calc_yf(sig + dsig, tex=tex) - mat_ml.calc_yf(sig - dsig, tex=tex)) / (2. * ds)
+    assert np.allclose(fgrad, fgrad_fd, rtol=1.e-5, atol=1.e-7)
+
+
+def test_json_stream():
+    # items of data file read incrementally must be identical to items of complete JSON object
+    import json
+    from pylabfea.data import iter_json_items
+    fname = os.path.join(os.path.dirname(__file__), '..', 'examples', 'Train_CPFEM', 'Data_Random_Texture_Test.json')
+    with open(fname) as fp:
+        ref = json.load(fp)
+    assert list(iter_json_items(fname, chunk_size=1000)) == list(ref.items())
+
+
+def test_data_parse_cache(tmp_path):
+    # parsed data must be reused from cache and be identical to data parsed from file
+    path = os.path.join(os.path.dirname(__file__), '..', 'examples', 'Train_CPFEM')
+    kw = dict(path_data=path, epl_crit=2.e-3, epl_start=1.e-3, epl_max=0.03, depl=1.e-3, wh_data=True)
+    db = FE.Data('Data_Random_Texture_Test.json', cache_dir=str(tmp_path), **kw)
+    db_c = FE.Data('Data_Random_Texture_Test.json', cache_dir=str(tmp_path), **kw)
+    assert len(os.listdir(tmp_path)) == 1
+    assert db_c.lc_data.keys() == db.lc_data.keys()
+    for key in ['flow_stress', 'plastic_strain', 'sig_ideal', 'elast_const', 'lc_indices']:
+        assert np.array_equal(db_c.mat_data[key], db.mat_data[key])
+    assert db_c.mat_data['sy_av'] == db.mat_data['sy_av']
+    FE.Data('Data_Random_Texture_Test.json', cache_dir=str(tmp_path), **dict(kw, epl_max=0.02))
+    assert len(os.listdir(tmp_path)) == 2
+
+    # parallel parsing of several files, parsed data is taken from cache
+    ms_list = FE.Data.load_many(['Data_Random_Texture_Test.json'] * 3, n_jobs=2, cache_dir=str(tmp_path), **kw)
+    assert len(ms_list) == 3 and len(os.listdir(tmp_path)) == 2
+    for ms in ms_list:
+        assert np.array_equal(ms['flow_stress'], db.mat_data['flow_stress'])
+
+
+def test_data_plastic_strain(tmp_path, monkeypatch):
+    # plastic strains reconstructed from elastic constants must be consistent with total strains and stresses
+    import json
+    import pylabfea.data
+    from pylabfea.data import ln_strain, eng_strain, get_elastic_coefficients
+    CV = []  # record elastic constants used in reconstruction of plastic strains
+    monkeypatch.setattr(pylabfea.data, 'get_elastic_coefficients',
+                        lambda *args, **kwargs: CV.append(get_elastic_coefficients(*args, **kwargs)) or CV[-1])
+    fname = os.path.join(os.path.dirname(__file__), '..', 'examples', 'Train_CPFEM', 'Data_Random_Texture_Test.json')
+    with open(fname) as fp:
+        data = json.load(fp)
+    for val in data.values():
+        if 'Results' in val and isinstance(val['Results'], dict):
+            for key in [k for k in val['Results'] if k.startswith('Ep')]:
+                del val['Results'][key]
+    with open(tmp_path / 'data.json', 'w') as fp:
+        json.dump(data, fp)
+    db = FE.Data('data.json', path_data=str(tmp_path), epl_crit=2.e-3, epl_start=1.e-3, epl_max=0.03)
+    SV = np.linalg.inv(CV[0])
+    for val in db.lc_data.values():
+        if 'Strain_Total' in val:
+            i = len(val['Stress']) // 2
+            epl = eng_strain(ln_strain(val['Strain_Total'][i]) - ln_strain(SV @ val['Stress'][i]))
+            assert np.allclose(val['Strain_Plastic'][i], epl, atol=1.e-12)
+            assert np.isclose(val['Eq_Strain_Plastic'][i], FE.eps_eq(epl))
+
+
+def test_elastic_coefficients():
+    # check identification of stiffness matrix from stress-strain pairs with known elastic constants
+    rng = np.random.default_rng(3)
+    L = np.tril(rng.random((6, 6))) + 2.*np.eye(6)
+    C = 1.e4*L @ L.T
+    eps = 1.e-3*rng.standard_normal((30, 6))
+    sig = eps @ C
+    C_ls = FE.get_elastic_coefficients(eps, sig)
+    assert np.allclose(C_ls, C)
+    C1 = FE.get_elastic_coefficients(eps, sig, npairs=8, seed=7)
+    C2 = FE.get_elastic_coefficients(eps, sig, npairs=8, seed=7)
+    assert np.allclose(C1, C)
+    assert np.allclose(C1, C2)
+    # scaled data with stiffness L @ L.T for decomposition method
+    C_dc = FE.get_elastic_coefficients(1.e3*eps, 1.e-1*sig, method='decomposition',
+                                       initial_guess=1.1*L[np.tril_indices(6)])
+    assert np.allclose(C_dc, 1.e-4*C, atol=1.e-2)
+
+
+def test_transition_index():
+    # check vectorized and batched transition detection against original loop over windows
+    from scipy.signal import savgol_filter
+
+    def transition_index_loop(stress):
+        nst = len(stress)
+        wl1 = max(5, int(nst / 10))
+        wl2 = max(2, int(nst / 50))
+        sig_d1 = savgol_filter(stress, window_length=wl1, polyorder=1, deriv=1)
+        sig_d2 = savgol_filter(sig_d1, window_length=wl2, polyorder=1, deriv=1)
+        i0 = int(nst / 10)
+        tol = np.mean(sig_d2[i0:i0 + wl2]) * 1.2
+        for i in range(1, int((nst - i0) / wl2) - 1):
+            if np.abs(np.mean(sig_d2[i0 + i * wl2:i0 + (i + 1) * wl2])) > tol:
+                return i0 + i * wl2
+        return i0
+
+    rng = np.random.default_rng(5)
+    paths = []
+    for n in [60, 200, 500, 500, 1333, 3000]:
+        eps = np.linspace(0., 0.005, n)
+        sy = rng.uniform(200., 400.)
+        paths.append(np.minimum(2.e5*eps, sy + 1.e3*eps) * (1. + 0.5*eps) + rng.normal(0., 1.e-3, n))
+    idx = [transition_index_loop(stress) for stress in paths]
+    assert np.all(np.array(idx) > np.array([len(stress) for stress in paths]) / 10)  # transition found
+    assert [FE.find_transition_index(stress) for stress in paths] == idx
+    assert np.all(FE.find_transition_indices(paths) == idx)
+    padded = np.zeros((len(paths), 3000))
+    for i, stress in enumerate(paths):
+        padded[i, :len(stress)] = stress
+    assert np.all(FE.find_transition_indices(padded, lengths=[len(stress) for stress in paths]) == idx)
+    # short load path without windows for transition detection
+    assert FE.find_transition_index(paths[0][:5]) == 0
+    assert np.all(FE.find_transition_indices([paths[0][:5]] + paths) == [0] + idx)
+
 
 def test_ml_data():
     urllib.request.urlretrieve(